@@ -1,28 +1,25 @@
-print("=== APP.PY STARTING ===")
-
-import sys
-print(f"Python version: {sys.version}")
-
 try:
-    from flask import Flask, render_template, request, jsonify, session, redirect, url_for, Response
-    print("Flask imported")
+    from flask import Flask, render_template, request, jsonify, session, redirect, url_for, Response, g, has_request_context
     from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
-    print("Flask-Login imported")
-    from flask_mail import Mail, Message
-    print("Flask-Mail imported")
-    import resend
-    print("Resend imported")
-    from authlib.integrations.flask_client import OAuth
-    print("Authlib imported")
     import sqlite3
     import json
     import random
+    import bisect
+    import itertools
     import uuid
     from datetime import datetime, date, timedelta
     import hashlib
+    import hmac
     import os
+    import time
+    import threading
+    import tempfile
     from dotenv import load_dotenv
-    print("All imports successful")
+    from itsdangerous import URLSafeTimedSerializer, BadSignature
+    import question_bank as question_bank_data
+    from question_bank import CATEGORIES
+    from prometheus_client import (CollectorRegistry, Counter, Gauge, Histogram, REGISTRY,
+                                   CONTENT_TYPE_LATEST, generate_latest, multiprocess)
 except Exception as e:
     print(f"IMPORT ERROR: {e}")
     import traceback
@@ -39,17 +36,10 @@ app.secret_key = os.environ.get('SECRET_KEY', 'uptriv-dev-secret-key-change-in-p
 from werkzeug.middleware.proxy_fix import ProxyFix
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
-# Flask-Mail setup
-app.config['MAIL_SERVER'] = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
-app.config['MAIL_PORT'] = int(os.environ.get('MAIL_PORT', 587))
-app.config['MAIL_USE_TLS'] = True
-app.config['MAIL_USERNAME'] = os.environ.get('MAIL_USERNAME')
-app.config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD')
-app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'noreply@uptriv.app')
-mail = Mail(app)
-
-# Resend setup
-resend.api_key = os.environ.get('RESEND_API_KEY')
+# Resend (invite emails) and Authlib (Google sign-in) together take longer to
+# import than Flask itself, and most requests need neither, so each is
+# imported on first use: see send_email() and google_oauth().
+RESEND_API_KEY = os.environ.get('RESEND_API_KEY')
 
 # Flask-Login setup
 login_manager = LoginManager()
@@ -62,26 +52,29 @@ def unauthorized():
     return redirect(url_for('login_page', _external=True, next=req.path), 302)
 
 # OAuth setup
-oauth = OAuth(app)
-google = None
-
 GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID')
 GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET')
 
-print(f"GOOGLE_CLIENT_ID set: {bool(GOOGLE_CLIENT_ID)}")
-print(f"GOOGLE_CLIENT_SECRET set: {bool(GOOGLE_CLIENT_SECRET)}")
-
-if GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET:
-    google = oauth.register(
-        name='google',
-        client_id=GOOGLE_CLIENT_ID,
-        client_secret=GOOGLE_CLIENT_SECRET,
-        server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-        client_kwargs={'scope': 'openid email profile'}
-    )
-    print("Google OAuth registered successfully")
-else:
-    print("WARNING: Google OAuth not configured - missing credentials")
+_google = None
+_google_lock = threading.Lock()
+
+
+def google_oauth():
+    """The Google OAuth client, registered on first use; None without credentials."""
+    global _google
+    if _google is None and GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET:
+        with _google_lock:
+            if _google is None:
+                from authlib.integrations.flask_client import OAuth
+                oauth = OAuth(app)
+                _google = oauth.register(
+                    name='google',
+                    client_id=GOOGLE_CLIENT_ID,
+                    client_secret=GOOGLE_CLIENT_SECRET,
+                    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+                    client_kwargs={'scope': 'openid email profile'}
+                )
+    return _google
 
 # Database configuration
 DATABASE_URL = os.environ.get('DATABASE_URL', '')
@@ -91,1032 +84,113 @@ if DATABASE_URL and DATABASE_URL.startswith('postgres'):
     if DATABASE_URL.startswith('postgres://'):
         DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
 else:
-    # SQLite for local development
+    # SQLite for local development; DATABASE_URL=sqlite:///path/to.db picks the file
     USE_POSTGRES = False
-    DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uptriv.db')
-
-# Categories and their subcategories
-CATEGORIES = {
-    'news': {
-        'name': 'World & U.S. News',
-        'icon': 'globe',
-        'color': '#FF6B6B',
-        'subcategories': ['current_events', 'politics', 'famous_people', 'world_affairs']
-    },
-    'history': {
-        'name': 'History',
-        'icon': 'landmark',
-        'color': '#4ECDC4',
-        'subcategories': ['ancient', 'medieval', 'modern', 'wars', 'presidents', 'world_history']
-    },
-    'science': {
-        'name': 'Science & Nature',
-        'icon': 'flask',
-        'color': '#45B7D1',
-        'subcategories': ['space', 'animals', 'human_body', 'physics', 'chemistry', 'earth_science']
-    },
-    'entertainment': {
-        'name': 'Entertainment',
-        'icon': 'film',
-        'color': '#96CEB4',
-        'subcategories': ['movies', 'tv', 'music_pre1990', 'music_post1990', 'celebrities', 'literature']
-    },
-    'sports': {
-        'name': 'Sports',
-        'icon': 'trophy',
-        'color': '#FFEAA7',
-        'subcategories': ['football', 'basketball', 'baseball', 'soccer', 'olympics', 'records']
-    },
-    'geography': {
-        'name': 'Geography',
-        'icon': 'map',
-        'color': '#DDA0DD',
-        'subcategories': ['countries', 'capitals', 'landmarks', 'maps', 'flags', 'continents']
-    }
-}
+    if DATABASE_URL.startswith('sqlite:///'):
+        DATABASE = DATABASE_URL[len('sqlite:///'):]
+    else:
+        DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uptriv.db')
+
+# ============ QUESTION BANK ============
+# The questions live in data/questions.json (see question_bank.py); edit that
+# and run tools/build_questions.py. Every question carries a stable numeric
+# 'id'. IDs are never reused: new questions take the next unused number and
+# removed questions retire theirs. Each worker loads the bank on first use.
+#
+# Hot reload: every QUESTION_BANK_CHECK_INTERVAL seconds a request stats the
+# bank's files, and if they changed a background thread loads the new bank,
+# syncs the questions table and swaps it in with one assignment. Requests
+# keep using the old bank until then. POST /admin/reload-questions reloads the
+# worker that receives it and touches questions.json so the others follow.
+
+QUESTION_BANK_CHECK_INTERVAL = float(os.environ.get('QUESTION_BANK_CHECK_INTERVAL', 30))
+
+_question_bank = None
+_question_bank_signature = None
+_question_bank_lock = threading.Lock()
+_question_bank_checked_at = 0.0
+_question_bank_reloading = False
+
+
+def question_bank():
+    """The loaded QuestionBank: by_id, ids_by_text, easy/hard by category,
+    onboarding, curated and learning_resources. Read it once per operation:
+    a reload can swap in a new one between two calls."""
+    global _question_bank, _question_bank_signature
+    if _question_bank is None:
+        with _question_bank_lock:
+            if _question_bank is None:
+                _question_bank_signature = question_bank_signature()
+                _question_bank = question_bank_data.load()
+    return _question_bank
+
+
+def question_bank_signature():
+    """(mtime, size) of questions.json and questions.bin, None for a missing file."""
+    signature = []
+    for path in (question_bank_data.SOURCE_PATH, question_bank_data.ARTIFACT_PATH):
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def reload_question_bank():
+    """Load the bank from disk, sync the questions table and swap it in.
+    Raises QuestionBankError and keeps the current bank if the files don't validate."""
+    global _question_bank, _question_bank_signature
+    signature = question_bank_signature()
+    try:
+        bank = question_bank_data.load()
+    except Exception:
+        # Don't retry the same broken files on every check
+        _question_bank_signature = signature
+        raise
+    # Before the swap, so other workers can resolve new IDs from the table
+    conn = get_db()
+    try:
+        sync_questions_table(conn, bank)
+    finally:
+        conn.close()
+    _question_bank, _question_bank_signature = bank, signature
+    print(f"Question bank reloaded: {len(bank.by_id)} questions, sha256 {bank.digest[:12]}")
+    return bank
 
-# Learning resources for knowledge gaps
-LEARNING_RESOURCES = {
-    'news': {
-        'current_events': [
-            {'type': 'read', 'title': 'AP News Daily', 'url': 'https://apnews.com', 'desc': 'Unbiased daily news coverage'},
-            {'type': 'watch', 'title': 'TLDR News (YouTube)', 'url': 'https://youtube.com/@TLDRNews', 'desc': '10-min explainers on current events'},
-            {'type': 'listen', 'title': 'The Daily (NYT Podcast)', 'desc': '20-min deep dives on top stories'},
-        ],
-        'politics': [
-            {'type': 'read', 'title': 'The Economist', 'url': 'https://economist.com', 'desc': 'In-depth political analysis'},
-            {'type': 'watch', 'title': 'Vox (YouTube)', 'url': 'https://youtube.com/@Vox', 'desc': 'Visual explainers on policy & politics'},
-            {'type': 'listen', 'title': 'Pod Save America', 'desc': 'US politics from Obama staffers'},
-        ],
-        'world_affairs': [
-            {'type': 'read', 'title': 'Foreign Affairs', 'url': 'https://foreignaffairs.com', 'desc': 'Global politics & international relations'},
-            {'type': 'watch', 'title': 'CaspianReport (YouTube)', 'url': 'https://youtube.com/@CaspianReport', 'desc': 'Geopolitics explained'},
-            {'type': 'listen', 'title': 'Global News Podcast (BBC)', 'desc': 'Twice-daily world news roundup'},
-        ],
-        'famous_people': [
-            {'type': 'read', 'title': 'Biography.com', 'url': 'https://biography.com', 'desc': 'Notable figures past & present'},
-            {'type': 'watch', 'title': 'Biographics (YouTube)', 'url': 'https://youtube.com/@Biographics', 'desc': 'Video biographies of famous people'},
-            {'type': 'listen', 'title': 'Revisionist History', 'desc': 'Malcolm Gladwell on overlooked stories'},
-        ],
-    },
-    'history': {
-        'ancient': [
-            {'type': 'read', 'title': 'SPQR by Mary Beard', 'desc': 'Definitive history of ancient Rome'},
-            {'type': 'watch', 'title': 'Historia Civilis (YouTube)', 'url': 'https://youtube.com/@HistoriaCivilis', 'desc': 'Animated ancient history'},
-            {'type': 'listen', 'title': 'The History of Rome Podcast', 'desc': '179 episodes covering Rome\'s history'},
-        ],
-        'medieval': [
-            {'type': 'read', 'title': 'The Time Traveler\'s Guide to Medieval England', 'desc': 'Immersive medieval history'},
-            {'type': 'watch', 'title': 'Kings and Generals (YouTube)', 'url': 'https://youtube.com/@KingsandGenerals', 'desc': 'Medieval battles & kingdoms'},
-            {'type': 'stream', 'title': 'The Last Kingdom (Netflix)', 'desc': 'Saxon England drama series'},
-        ],
-        'modern': [
-            {'type': 'read', 'title': 'The Guns of August by Barbara Tuchman', 'desc': 'WWI origins, Pulitzer winner'},
-            {'type': 'watch', 'title': 'The Great War (YouTube)', 'url': 'https://youtube.com/@TheGreatWar', 'desc': 'Week-by-week WWI coverage'},
-            {'type': 'listen', 'title': 'Hardcore History', 'desc': 'Dan Carlin\'s epic history deep dives'},
-        ],
-        'wars': [
-            {'type': 'read', 'title': 'A World at Arms by Gerhard Weinberg', 'desc': 'Comprehensive WWII history'},
-            {'type': 'watch', 'title': 'World War Two (YouTube)', 'url': 'https://youtube.com/@WorldWarTwo', 'desc': 'WWII week by week'},
-            {'type': 'stream', 'title': 'Band of Brothers (Max)', 'desc': 'WWII miniseries masterpiece'},
-        ],
-        'presidents': [
-            {'type': 'read', 'title': 'Team of Rivals by Doris Kearns Goodwin', 'desc': 'Lincoln\'s political genius'},
-            {'type': 'watch', 'title': 'American Experience: The Presidents (PBS)', 'desc': 'Documentary series on US presidents'},
-            {'type': 'listen', 'title': 'Presidential Podcast (Washington Post)', 'desc': 'Story of each president'},
-        ],
-        'world_history': [
-            {'type': 'read', 'title': 'Sapiens by Yuval Noah Harari', 'desc': 'Human history overview'},
-            {'type': 'watch', 'title': 'Crash Course World History (YouTube)', 'url': 'https://youtube.com/@crashcourse', 'desc': 'Fast-paced world history'},
-            {'type': 'listen', 'title': 'Stuff You Missed in History Class', 'desc': 'Overlooked historical stories'},
-        ],
-    },
-    'science': {
-        'space': [
-            {'type': 'read', 'title': 'Cosmos by Carl Sagan', 'desc': 'Classic introduction to astronomy'},
-            {'type': 'watch', 'title': 'PBS Space Time (YouTube)', 'url': 'https://youtube.com/@pbsspacetime', 'desc': 'Deep dives into astrophysics'},
-            {'type': 'stream', 'title': 'Cosmos: A Spacetime Odyssey (Disney+)', 'desc': 'Neil deGrasse Tyson\'s visual journey'},
-        ],
-        'astronomy': [
-            {'type': 'read', 'title': 'Astrophysics for People in a Hurry', 'desc': 'Neil deGrasse Tyson\'s quick guide'},
-            {'type': 'watch', 'title': 'Scott Manley (YouTube)', 'url': 'https://youtube.com/@scottmanley', 'desc': 'Space exploration & rockets'},
-            {'type': 'listen', 'title': 'StarTalk Radio', 'desc': 'Neil deGrasse Tyson\'s science podcast'},
-        ],
-        'biology': [
-            {'type': 'read', 'title': 'The Gene by Siddhartha Mukherjee', 'desc': 'History of genetics'},
-            {'type': 'watch', 'title': 'Kurzgesagt (YouTube)', 'url': 'https://youtube.com/@kurzgesagt', 'desc': 'Animated science explainers'},
-            {'type': 'stream', 'title': 'Planet Earth (Netflix)', 'desc': 'David Attenborough nature series'},
-        ],
-        'physics': [
-            {'type': 'read', 'title': 'A Brief History of Time by Stephen Hawking', 'desc': 'Physics for everyone'},
-            {'type': 'watch', 'title': 'Veritasium (YouTube)', 'url': 'https://youtube.com/@veritasium', 'desc': 'Fascinating physics videos'},
-            {'type': 'listen', 'title': 'Radiolab', 'desc': 'Science storytelling at its best'},
-        ],
-        'chemistry': [
-            {'type': 'read', 'title': 'The Disappearing Spoon by Sam Kean', 'desc': 'Stories behind the periodic table'},
-            {'type': 'watch', 'title': 'Periodic Videos (YouTube)', 'url': 'https://youtube.com/@periodicvideos', 'desc': 'Every element explained'},
-            {'type': 'stream', 'title': 'Breaking Bad (Netflix)', 'desc': 'Chemistry-themed drama (fiction!)'},
-        ],
-        'earth_science': [
-            {'type': 'read', 'title': 'A Short History of Nearly Everything', 'desc': 'Bill Bryson\'s science adventure'},
-            {'type': 'watch', 'title': 'MinuteEarth (YouTube)', 'url': 'https://youtube.com/@MinuteEarth', 'desc': 'Quick earth science lessons'},
-            {'type': 'stream', 'title': 'Our Planet (Netflix)', 'desc': 'Earth\'s ecosystems documentary'},
-        ],
-    },
-    'entertainment': {
-        'movies': [
-            {'type': 'read', 'title': 'IMDb Top 250', 'url': 'https://imdb.com/chart/top', 'desc': 'Must-see films ranked'},
-            {'type': 'watch', 'title': 'Lessons from the Screenplay (YouTube)', 'url': 'https://youtube.com/@LessonsFromTheScreenplay', 'desc': 'Film analysis & storytelling'},
-            {'type': 'listen', 'title': 'The Rewatchables (Ringer)', 'desc': 'Deep dives on classic movies'},
-        ],
-        'tv': [
-            {'type': 'read', 'title': 'TV Guide\'s Greatest Shows', 'desc': 'Classic & modern TV essentials'},
-            {'type': 'watch', 'title': 'Nerdwriter1 (YouTube)', 'url': 'https://youtube.com/@Nerdwriter1', 'desc': 'Video essays on TV & culture'},
-            {'type': 'listen', 'title': 'TV Avalanche', 'desc': 'Weekly TV discussion podcast'},
-        ],
-        'music': [
-            {'type': 'read', 'title': 'Rolling Stone\'s 500 Greatest Albums', 'desc': 'Essential music history'},
-            {'type': 'watch', 'title': 'Polyphonic (YouTube)', 'url': 'https://youtube.com/@Polyphonic', 'desc': 'Music history & analysis'},
-            {'type': 'listen', 'title': 'Song Exploder', 'desc': 'Artists break down their songs'},
-        ],
-        'literature': [
-            {'type': 'read', 'title': 'Penguin Classics Collection', 'desc': 'Essential world literature'},
-            {'type': 'watch', 'title': 'Crash Course Literature (YouTube)', 'url': 'https://youtube.com/@crashcourse', 'desc': 'Quick lit lessons'},
-            {'type': 'listen', 'title': 'LeVar Burton Reads', 'desc': 'Short fiction read aloud'},
-        ],
-        'arts': [
-            {'type': 'read', 'title': 'The Story of Art by E.H. Gombrich', 'desc': 'Classic art history intro'},
-            {'type': 'watch', 'title': 'Great Art Explained (YouTube)', 'url': 'https://youtube.com/@GreatArtExplained', 'desc': '15-min masterpiece deep dives'},
-            {'type': 'stream', 'title': 'Abstract: The Art of Design (Netflix)', 'desc': 'Profiles of top designers'},
-        ],
-        'games': [
-            {'type': 'read', 'title': 'Blood, Sweat, and Pixels', 'desc': 'Behind-the-scenes game development'},
-            {'type': 'watch', 'title': 'NoClip Documentaries (YouTube)', 'url': 'https://youtube.com/@noclip', 'desc': 'Video game documentaries'},
-            {'type': 'stream', 'title': 'High Score (Netflix)', 'desc': 'History of video games docuseries'},
-        ],
-    },
-    'sports': {
-        'football': [
-            {'type': 'read', 'title': 'The Blind Side by Michael Lewis', 'desc': 'Football & human interest'},
-            {'type': 'watch', 'title': 'NFL Films (YouTube)', 'url': 'https://youtube.com/@NFL', 'desc': 'Classic NFL moments'},
-            {'type': 'stream', 'title': 'Quarterback (Netflix)', 'desc': 'Behind-the-scenes NFL docuseries'},
-        ],
-        'basketball': [
-            {'type': 'read', 'title': 'The Book of Basketball by Bill Simmons', 'desc': 'NBA history & legends'},
-            {'type': 'stream', 'title': 'The Last Dance (Netflix)', 'desc': 'Michael Jordan documentary'},
-            {'type': 'listen', 'title': 'The Bill Simmons Podcast', 'desc': 'NBA talk & sports culture'},
-        ],
-        'baseball': [
-            {'type': 'read', 'title': 'Moneyball by Michael Lewis', 'desc': 'Baseball analytics revolution'},
-            {'type': 'stream', 'title': 'Ken Burns: Baseball (PBS)', 'desc': 'Epic baseball documentary'},
-            {'type': 'listen', 'title': 'Effectively Wild', 'desc': 'Daily baseball analysis'},
-        ],
-        'soccer': [
-            {'type': 'read', 'title': 'Inverting the Pyramid by Jonathan Wilson', 'desc': 'Soccer tactics history'},
-            {'type': 'watch', 'title': 'TIFO Football (YouTube)', 'url': 'https://youtube.com/@TifoFootball', 'desc': 'Tactical analysis & history'},
-            {'type': 'stream', 'title': 'Sunderland \'Til I Die (Netflix)', 'desc': 'English football club docuseries'},
-        ],
-        'olympics': [
-            {'type': 'read', 'title': 'The Boys in the Boat', 'desc': '1936 Olympic rowing story'},
-            {'type': 'watch', 'title': 'Olympic Channel (YouTube)', 'url': 'https://youtube.com/@olympics', 'desc': 'Historic Olympic moments'},
-            {'type': 'stream', 'title': 'Icarus (Netflix)', 'desc': 'Olympic doping scandal documentary'},
-        ],
-        'misc': [
-            {'type': 'read', 'title': 'Sports Illustrated Vault', 'url': 'https://vault.si.com', 'desc': 'Classic sports journalism'},
-            {'type': 'stream', 'title': '30 for 30 (ESPN+)', 'desc': 'Award-winning sports docs'},
-            {'type': 'listen', 'title': 'The Athletic Football Show', 'desc': 'Multi-sport analysis'},
-        ],
-        'hockey': [
-            {'type': 'read', 'title': 'The Game by Ken Dryden', 'desc': 'Hockey memoir classic'},
-            {'type': 'watch', 'title': 'NHL Vault (YouTube)', 'url': 'https://youtube.com/@NHL', 'desc': 'Classic hockey highlights'},
-            {'type': 'listen', 'title': 'Spittin\' Chiclets', 'desc': 'Hockey culture podcast'},
-        ],
-        'tennis': [
-            {'type': 'read', 'title': 'Open by Andre Agassi', 'desc': 'Tennis autobiography'},
-            {'type': 'stream', 'title': 'Break Point (Netflix)', 'desc': 'Behind-the-scenes tennis doc'},
-            {'type': 'listen', 'title': 'No Challenges Remaining', 'desc': 'Tennis analysis podcast'},
-        ],
-        'golf': [
-            {'type': 'read', 'title': 'The Match by Mark Frost', 'desc': 'Golf history classic'},
-            {'type': 'watch', 'title': 'PGA Tour (YouTube)', 'url': 'https://youtube.com/@PGATOUR', 'desc': 'Golf highlights & history'},
-            {'type': 'stream', 'title': 'Full Swing (Netflix)', 'desc': 'PGA Tour docuseries'},
-        ],
-    },
-    'geography': {
-        'countries': [
-            {'type': 'read', 'title': 'Prisoners of Geography by Tim Marshall', 'desc': 'How maps explain the world'},
-            {'type': 'watch', 'title': 'Geography Now (YouTube)', 'url': 'https://youtube.com/@GeographyNow', 'desc': 'Every country explained'},
-            {'type': 'listen', 'title': 'Throughline (NPR)', 'desc': 'History behind current events'},
-        ],
-        'capitals': [
-            {'type': 'read', 'title': 'Sporcle Geography Quizzes', 'url': 'https://sporcle.com/games/category/geography', 'desc': 'Practice world capitals'},
-            {'type': 'watch', 'title': 'Seterra Geography Games', 'url': 'https://seterra.com', 'desc': 'Interactive map quizzes'},
-            {'type': 'listen', 'title': 'Radiolab: Cities', 'desc': 'Stories of urban life'},
-        ],
-        'landmarks': [
-            {'type': 'read', 'title': '1,000 Places to See Before You Die', 'desc': 'World landmarks guide'},
-            {'type': 'stream', 'title': 'Rick Steves\' Europe (PBS)', 'desc': 'Travel & landmark tours'},
-            {'type': 'listen', 'title': 'Atlas Obscura Podcast', 'desc': 'Hidden wonders of the world'},
-        ],
-        'maps': [
-            {'type': 'read', 'title': 'The Map Book by Peter Barber', 'desc': 'Beautiful cartography history'},
-            {'type': 'watch', 'title': 'Map Men (YouTube)', 'url': 'https://youtube.com/@JayForeman', 'desc': 'Fun cartography videos'},
-            {'type': 'listen', 'title': '99% Invisible', 'desc': 'Design stories including maps'},
-        ],
-        'flags': [
-            {'type': 'read', 'title': 'Flag Stories', 'url': 'https://flagstories.co', 'desc': 'Meaning behind flags'},
-            {'type': 'watch', 'title': 'Geography Now (YouTube)', 'url': 'https://youtube.com/@GeographyNow', 'desc': 'Flag facts in country episodes'},
-            {'type': 'listen', 'title': 'Vexillology Podcast', 'desc': 'All about flags'},
-        ],
-        'continents': [
-            {'type': 'read', 'title': 'National Geographic Atlas', 'desc': 'Comprehensive world atlas'},
-            {'type': 'watch', 'title': 'Atlas Pro (YouTube)', 'url': 'https://youtube.com/@AtlasPro1', 'desc': 'Geography & earth science'},
-            {'type': 'stream', 'title': 'Seven Worlds, One Planet (BBC)', 'desc': 'Each continent explored'},
-        ],
-    }
-}
 
-# Question bank with subcategories
-QUESTIONS = {
-    'news': [
-        {'q': 'Which country hosted the 2024 Summer Olympics?', 'a': 'France', 'options': ['France', 'Japan', 'USA', 'UK'], 'sub': 'current_events'},
-        {'q': 'Who is the current Secretary-General of the United Nations?', 'a': 'António Guterres', 'options': ['António Guterres', 'Ban Ki-moon', 'Kofi Annan', 'Javier Solana'], 'sub': 'world_affairs'},
-        {'q': 'Which tech company became the first to reach a $3 trillion market cap?', 'a': 'Apple', 'options': ['Apple', 'Microsoft', 'Amazon', 'Google'], 'sub': 'current_events'},
-        {'q': 'What social media platform was formerly known as Twitter?', 'a': 'X', 'options': ['X', 'Threads', 'Bluesky', 'Mastodon'], 'sub': 'current_events'},
-        {'q': 'Who won the 2024 U.S. Presidential Election?', 'a': 'Donald Trump', 'options': ['Donald Trump', 'Joe Biden', 'Kamala Harris', 'Ron DeSantis'], 'sub': 'politics'},
-        {'q': 'Which billionaire acquired Twitter in 2022?', 'a': 'Elon Musk', 'options': ['Elon Musk', 'Jeff Bezos', 'Mark Zuckerberg', 'Bill Gates'], 'sub': 'famous_people'},
-        {'q': 'What country did Russia invade in February 2022?', 'a': 'Ukraine', 'options': ['Ukraine', 'Georgia', 'Poland', 'Belarus'], 'sub': 'world_affairs'},
-        {'q': 'Who is the current Prime Minister of the United Kingdom?', 'a': 'Keir Starmer', 'options': ['Keir Starmer', 'Rishi Sunak', 'Boris Johnson', 'Liz Truss'], 'sub': 'politics'},
-        {'q': 'Which AI chatbot launched by OpenAI went viral in late 2022?', 'a': 'ChatGPT', 'options': ['ChatGPT', 'Bard', 'Claude', 'Copilot'], 'sub': 'current_events'},
-        {'q': 'What major bank collapsed in March 2023?', 'a': 'Silicon Valley Bank', 'options': ['Silicon Valley Bank', 'Wells Fargo', 'Chase', 'Bank of America'], 'sub': 'current_events'},
-        {'q': 'Which country left the European Union in 2020?', 'a': 'United Kingdom', 'options': ['United Kingdom', 'Greece', 'Poland', 'Hungary'], 'sub': 'world_affairs'},
-        {'q': 'Who became the first female Vice President of the United States?', 'a': 'Kamala Harris', 'options': ['Kamala Harris', 'Hillary Clinton', 'Nancy Pelosi', 'Elizabeth Warren'], 'sub': 'politics'},
-        {'q': 'What pandemic caused global lockdowns starting in 2020?', 'a': 'COVID-19', 'options': ['COVID-19', 'SARS', 'H1N1', 'Ebola'], 'sub': 'current_events'},
-        {'q': 'Which streaming service launched Disney+ in 2019?', 'a': 'Disney', 'options': ['Disney', 'Warner Bros', 'Universal', 'Paramount'], 'sub': 'current_events'},
-        {'q': 'What ship blocked the Suez Canal for six days in 2021?', 'a': 'Ever Given', 'options': ['Ever Given', 'Ever Forward', 'Maersk Line', 'Costa Concordia'], 'sub': 'current_events'},
-        {'q': 'Who is the CEO of Tesla?', 'a': 'Elon Musk', 'options': ['Elon Musk', 'Tim Cook', 'Satya Nadella', 'Jeff Bezos'], 'sub': 'famous_people'},
-        {'q': 'Which country hosted the 2022 FIFA World Cup?', 'a': 'Qatar', 'options': ['Qatar', 'Russia', 'Brazil', 'UAE'], 'sub': 'current_events'},
-        {'q': 'What cryptocurrency experienced a major crash in 2022?', 'a': 'Bitcoin', 'options': ['Bitcoin', 'Dogecoin', 'Ethereum', 'Litecoin'], 'sub': 'current_events'},
-        {'q': 'Who is the founder of Amazon?', 'a': 'Jeff Bezos', 'options': ['Jeff Bezos', 'Elon Musk', 'Bill Gates', 'Mark Zuckerberg'], 'sub': 'famous_people'},
-        {'q': 'Which social media app is known for short-form videos and is owned by ByteDance?', 'a': 'TikTok', 'options': ['TikTok', 'Instagram Reels', 'YouTube Shorts', 'Snapchat'], 'sub': 'current_events'},
-        {'q': 'What organization did the US rejoin on President Biden\'s first day in office?', 'a': 'Paris Climate Agreement', 'options': ['Paris Climate Agreement', 'NATO', 'United Nations', 'WHO'], 'sub': 'politics'},
-        {'q': 'Which European country experienced a major energy crisis in 2022 due to Russian gas cuts?', 'a': 'Germany', 'options': ['Germany', 'France', 'Spain', 'Italy'], 'sub': 'world_affairs'},
-        {'q': 'Who is the current President of France?', 'a': 'Emmanuel Macron', 'options': ['Emmanuel Macron', 'François Hollande', 'Nicolas Sarkozy', 'Marine Le Pen'], 'sub': 'politics'},
-        {'q': 'What company did Microsoft acquire for $69 billion in 2023?', 'a': 'Activision Blizzard', 'options': ['Activision Blizzard', 'Electronic Arts', 'Take-Two', 'Ubisoft'], 'sub': 'current_events'},
-        {'q': 'Which vaccine was the first COVID-19 vaccine authorized in the US?', 'a': 'Pfizer-BioNTech', 'options': ['Pfizer-BioNTech', 'Moderna', 'Johnson & Johnson', 'AstraZeneca'], 'sub': 'current_events'},
-        {'q': 'What is the name of the UK\'s royal family?', 'a': 'Windsor', 'options': ['Windsor', 'Tudor', 'Stuart', 'York'], 'sub': 'famous_people'},
-        {'q': 'Which tech giant was fined billions by the EU for antitrust violations?', 'a': 'Google', 'options': ['Google', 'Apple', 'Amazon', 'Facebook'], 'sub': 'current_events'},
-        {'q': 'Who succeeded Angela Merkel as Chancellor of Germany?', 'a': 'Olaf Scholz', 'options': ['Olaf Scholz', 'Friedrich Merz', 'Annalena Baerbock', 'Armin Laschet'], 'sub': 'politics'},
-        {'q': 'What messaging app is owned by Meta (Facebook)?', 'a': 'WhatsApp', 'options': ['WhatsApp', 'Telegram', 'Signal', 'WeChat'], 'sub': 'current_events'},
-        {'q': 'Which country\'s parliament was stormed on January 6, 2021?', 'a': 'United States', 'options': ['United States', 'Brazil', 'France', 'Germany'], 'sub': 'politics'},
-        {'q': 'Who is the richest person in the world as of 2024?', 'a': 'Elon Musk', 'options': ['Elon Musk', 'Jeff Bezos', 'Bernard Arnault', 'Bill Gates'], 'sub': 'famous_people'},
-        {'q': 'What company makes the iPhone?', 'a': 'Apple', 'options': ['Apple', 'Samsung', 'Google', 'Microsoft'], 'sub': 'current_events'},
-        {'q': 'Which prince stepped back from royal duties in 2020?', 'a': 'Prince Harry', 'options': ['Prince Harry', 'Prince William', 'Prince Andrew', 'Prince Charles'], 'sub': 'famous_people'},
-        {'q': 'What is the name of SpaceX\'s reusable rocket?', 'a': 'Falcon 9', 'options': ['Falcon 9', 'Atlas V', 'Delta IV', 'New Shepard'], 'sub': 'current_events'},
-        {'q': 'Which country experienced massive protests in 2019 over an extradition bill?', 'a': 'Hong Kong', 'options': ['Hong Kong', 'Taiwan', 'Thailand', 'Myanmar'], 'sub': 'world_affairs'},
-        {'q': 'Who is the CEO of Microsoft?', 'a': 'Satya Nadella', 'options': ['Satya Nadella', 'Bill Gates', 'Steve Ballmer', 'Sundar Pichai'], 'sub': 'famous_people'},
-        {'q': 'What major infrastructure bill did Biden sign in 2021?', 'a': 'Infrastructure Investment and Jobs Act', 'options': ['Infrastructure Investment and Jobs Act', 'Build Back Better', 'American Rescue Plan', 'CHIPS Act'], 'sub': 'politics'},
-        {'q': 'Which country\'s military took power in a 2021 coup?', 'a': 'Myanmar', 'options': ['Myanmar', 'Thailand', 'Afghanistan', 'Sudan'], 'sub': 'world_affairs'},
-        {'q': 'What search engine is the most used in the world?', 'a': 'Google', 'options': ['Google', 'Bing', 'Yahoo', 'DuckDuckGo'], 'sub': 'current_events'},
-        {'q': 'Who founded Facebook?', 'a': 'Mark Zuckerberg', 'options': ['Mark Zuckerberg', 'Jack Dorsey', 'Evan Spiegel', 'Kevin Systrom'], 'sub': 'famous_people'},
-        {'q': 'What telescope launched by NASA in 2021 is the successor to Hubble?', 'a': 'James Webb Space Telescope', 'options': ['James Webb Space Telescope', 'Kepler', 'Chandra', 'Spitzer'], 'sub': 'current_events'},
-        {'q': 'Which country did the Taliban retake control of in 2021?', 'a': 'Afghanistan', 'options': ['Afghanistan', 'Iraq', 'Syria', 'Pakistan'], 'sub': 'world_affairs'},
-        {'q': 'What is Netflix\'s primary business?', 'a': 'Streaming video', 'options': ['Streaming video', 'DVD rental', 'Video games', 'Social media'], 'sub': 'current_events'},
-        {'q': 'Who was the Queen of England until 2022?', 'a': 'Elizabeth II', 'options': ['Elizabeth II', 'Victoria', 'Elizabeth I', 'Mary'], 'sub': 'famous_people'},
-        {'q': 'What major climate conference was held in Glasgow in 2021?', 'a': 'COP26', 'options': ['COP26', 'COP25', 'Paris Summit', 'Kyoto Protocol'], 'sub': 'world_affairs'},
-        {'q': 'Which tech company created the Pixel smartphone?', 'a': 'Google', 'options': ['Google', 'Apple', 'Samsung', 'OnePlus'], 'sub': 'current_events'},
-        {'q': 'Who is the Prime Minister of Canada?', 'a': 'Justin Trudeau', 'options': ['Justin Trudeau', 'Stephen Harper', 'Pierre Poilievre', 'Jean Chrétien'], 'sub': 'politics'},
-        {'q': 'What cryptocurrency was created by the pseudonymous Satoshi Nakamoto?', 'a': 'Bitcoin', 'options': ['Bitcoin', 'Ethereum', 'Litecoin', 'Ripple'], 'sub': 'current_events'},
-        {'q': 'Which company owns Instagram?', 'a': 'Meta', 'options': ['Meta', 'Google', 'Twitter', 'Snapchat'], 'sub': 'current_events'},
-        {'q': 'Who owns The Washington Post?', 'a': 'Jeff Bezos', 'options': ['Jeff Bezos', 'Rupert Murdoch', 'Elon Musk', 'Mark Zuckerberg'], 'sub': 'famous_people'},
-    ],
-    'history': [
-        {'q': 'In what year did World War II end?', 'a': '1945', 'options': ['1945', '1944', '1946', '1943'], 'sub': 'wars'},
-        {'q': 'Who was the first President of the United States?', 'a': 'George Washington', 'options': ['George Washington', 'John Adams', 'Thomas Jefferson', 'Benjamin Franklin'], 'sub': 'presidents'},
-        {'q': 'The Great Wall of China was primarily built to protect against invasions from which direction?', 'a': 'North', 'options': ['North', 'South', 'East', 'West'], 'sub': 'ancient'},
-        {'q': 'What year did the Berlin Wall fall?', 'a': '1989', 'options': ['1989', '1991', '1987', '1990'], 'sub': 'modern'},
-        {'q': 'Which ancient civilization built the pyramids of Giza?', 'a': 'Egyptians', 'options': ['Egyptians', 'Romans', 'Greeks', 'Persians'], 'sub': 'ancient'},
-        {'q': 'Who was the British Prime Minister during most of World War II?', 'a': 'Winston Churchill', 'options': ['Winston Churchill', 'Neville Chamberlain', 'Clement Attlee', 'Anthony Eden'], 'sub': 'wars'},
-        {'q': 'The Renaissance began in which country?', 'a': 'Italy', 'options': ['Italy', 'France', 'England', 'Spain'], 'sub': 'medieval'},
-        {'q': 'What was the name of the ship on which the Pilgrims sailed to America in 1620?', 'a': 'Mayflower', 'options': ['Mayflower', 'Santa Maria', 'Endeavour', 'Beagle'], 'sub': 'world_history'},
-        {'q': 'Which U.S. President issued the Emancipation Proclamation?', 'a': 'Abraham Lincoln', 'options': ['Abraham Lincoln', 'Ulysses S. Grant', 'Andrew Johnson', 'James Buchanan'], 'sub': 'presidents'},
-        {'q': 'The Cold War was primarily between which two superpowers?', 'a': 'USA and USSR', 'options': ['USA and USSR', 'USA and China', 'UK and USSR', 'USA and Germany'], 'sub': 'modern'},
-        {'q': 'Who was the first man to walk on the moon?', 'a': 'Neil Armstrong', 'options': ['Neil Armstrong', 'Buzz Aldrin', 'John Glenn', 'Yuri Gagarin'], 'sub': 'modern'},
-        {'q': 'What year did the Titanic sink?', 'a': '1912', 'options': ['1912', '1905', '1920', '1898'], 'sub': 'modern'},
-        {'q': 'Who was the leader of Nazi Germany?', 'a': 'Adolf Hitler', 'options': ['Adolf Hitler', 'Benito Mussolini', 'Joseph Stalin', 'Francisco Franco'], 'sub': 'wars'},
-        {'q': 'The French Revolution began in what year?', 'a': '1789', 'options': ['1789', '1776', '1804', '1815'], 'sub': 'world_history'},
-        {'q': 'Who discovered America in 1492?', 'a': 'Christopher Columbus', 'options': ['Christopher Columbus', 'Amerigo Vespucci', 'Leif Erikson', 'Ferdinand Magellan'], 'sub': 'world_history'},
-        {'q': 'What ancient wonder was located in Alexandria, Egypt?', 'a': 'Lighthouse', 'options': ['Lighthouse', 'Hanging Gardens', 'Colossus', 'Temple of Artemis'], 'sub': 'ancient'},
-        {'q': 'Who was the first Roman Emperor?', 'a': 'Augustus', 'options': ['Augustus', 'Julius Caesar', 'Nero', 'Caligula'], 'sub': 'ancient'},
-        {'q': 'The Industrial Revolution began in which country?', 'a': 'England', 'options': ['England', 'Germany', 'France', 'USA'], 'sub': 'modern'},
-        {'q': 'Who wrote the Declaration of Independence?', 'a': 'Thomas Jefferson', 'options': ['Thomas Jefferson', 'Benjamin Franklin', 'John Adams', 'George Washington'], 'sub': 'presidents'},
-        {'q': 'What empire was ruled by Genghis Khan?', 'a': 'Mongol Empire', 'options': ['Mongol Empire', 'Ottoman Empire', 'Roman Empire', 'Persian Empire'], 'sub': 'medieval'},
-        {'q': 'The assassination of Archduke Franz Ferdinand triggered which war?', 'a': 'World War I', 'options': ['World War I', 'World War II', 'Napoleonic Wars', 'Franco-Prussian War'], 'sub': 'wars'},
-        {'q': 'What year did the American Civil War begin?', 'a': '1861', 'options': ['1861', '1865', '1850', '1870'], 'sub': 'wars'},
-        {'q': 'Who was the last Pharaoh of ancient Egypt?', 'a': 'Cleopatra', 'options': ['Cleopatra', 'Nefertiti', 'Hatshepsut', 'Tutankhamun'], 'sub': 'ancient'},
-        {'q': 'What document did King John sign in 1215?', 'a': 'Magna Carta', 'options': ['Magna Carta', 'Bill of Rights', 'Constitution', 'Declaration'], 'sub': 'medieval'},
-        {'q': 'Who painted the ceiling of the Sistine Chapel?', 'a': 'Michelangelo', 'options': ['Michelangelo', 'Leonardo da Vinci', 'Raphael', 'Donatello'], 'sub': 'medieval'},
-        {'q': 'What was the Manhattan Project?', 'a': 'Development of atomic bomb', 'options': ['Development of atomic bomb', 'Space program', 'Spy network', 'Economic plan'], 'sub': 'wars'},
-        {'q': 'Who was the first female Prime Minister of the UK?', 'a': 'Margaret Thatcher', 'options': ['Margaret Thatcher', 'Theresa May', 'Elizabeth I', 'Queen Victoria'], 'sub': 'modern'},
-        {'q': 'What ancient city was destroyed by Mount Vesuvius in 79 AD?', 'a': 'Pompeii', 'options': ['Pompeii', 'Rome', 'Athens', 'Carthage'], 'sub': 'ancient'},
-        {'q': 'Who was known as the "Sun King" of France?', 'a': 'Louis XIV', 'options': ['Louis XIV', 'Louis XVI', 'Napoleon', 'Charlemagne'], 'sub': 'world_history'},
-        {'q': 'What year did the Soviet Union collapse?', 'a': '1991', 'options': ['1991', '1989', '1985', '1993'], 'sub': 'modern'},
-        {'q': 'Who led India to independence from British rule?', 'a': 'Mahatma Gandhi', 'options': ['Mahatma Gandhi', 'Jawaharlal Nehru', 'Subhas Chandra Bose', 'Muhammad Ali Jinnah'], 'sub': 'world_history'},
-        {'q': 'What was the primary cause of the Irish Potato Famine?', 'a': 'Potato blight', 'options': ['Potato blight', 'Drought', 'War', 'Flooding'], 'sub': 'world_history'},
-        {'q': 'Who was the U.S. President during the Cuban Missile Crisis?', 'a': 'John F. Kennedy', 'options': ['John F. Kennedy', 'Dwight Eisenhower', 'Lyndon Johnson', 'Richard Nixon'], 'sub': 'presidents'},
-        {'q': 'What ancient Greek city-state was known for its military prowess?', 'a': 'Sparta', 'options': ['Sparta', 'Athens', 'Corinth', 'Thebes'], 'sub': 'ancient'},
-        {'q': 'Who invented the printing press?', 'a': 'Johannes Gutenberg', 'options': ['Johannes Gutenberg', 'Leonardo da Vinci', 'Benjamin Franklin', 'Thomas Edison'], 'sub': 'medieval'},
-        {'q': 'What war was fought between the North and South of the United States?', 'a': 'Civil War', 'options': ['Civil War', 'Revolutionary War', 'War of 1812', 'Mexican-American War'], 'sub': 'wars'},
-        {'q': 'Who was the first woman to fly solo across the Atlantic?', 'a': 'Amelia Earhart', 'options': ['Amelia Earhart', 'Harriet Quimby', 'Bessie Coleman', 'Jacqueline Cochran'], 'sub': 'modern'},
-        {'q': 'What empire built Machu Picchu?', 'a': 'Inca', 'options': ['Inca', 'Aztec', 'Maya', 'Olmec'], 'sub': 'ancient'},
-        {'q': 'Who was the U.S. President during the Great Depression\'s start?', 'a': 'Herbert Hoover', 'options': ['Herbert Hoover', 'Franklin D. Roosevelt', 'Calvin Coolidge', 'Warren Harding'], 'sub': 'presidents'},
-        {'q': 'What event started the Great Depression in 1929?', 'a': 'Stock market crash', 'options': ['Stock market crash', 'Bank failures', 'Drought', 'War'], 'sub': 'modern'},
-        {'q': 'Who unified Germany in 1871?', 'a': 'Otto von Bismarck', 'options': ['Otto von Bismarck', 'Kaiser Wilhelm I', 'Frederick the Great', 'Adolf Hitler'], 'sub': 'world_history'},
-        {'q': 'What was the Black Death?', 'a': 'Bubonic plague', 'options': ['Bubonic plague', 'Cholera', 'Smallpox', 'Typhus'], 'sub': 'medieval'},
-        {'q': 'Who was the longest-reigning British monarch before Elizabeth II?', 'a': 'Queen Victoria', 'options': ['Queen Victoria', 'George III', 'Henry VIII', 'Elizabeth I'], 'sub': 'world_history'},
-        {'q': 'What year did the United States declare independence?', 'a': '1776', 'options': ['1776', '1789', '1783', '1774'], 'sub': 'presidents'},
-        {'q': 'Who was the first President to be impeached?', 'a': 'Andrew Johnson', 'options': ['Andrew Johnson', 'Bill Clinton', 'Richard Nixon', 'Donald Trump'], 'sub': 'presidents'},
-        {'q': 'What battle marked Napoleon\'s final defeat?', 'a': 'Waterloo', 'options': ['Waterloo', 'Trafalgar', 'Austerlitz', 'Borodino'], 'sub': 'wars'},
-        {'q': 'Who was the leader of the Soviet Union during World War II?', 'a': 'Joseph Stalin', 'options': ['Joseph Stalin', 'Vladimir Lenin', 'Nikita Khrushchev', 'Leon Trotsky'], 'sub': 'wars'},
-        {'q': 'What ancient trade route connected China to the Mediterranean?', 'a': 'Silk Road', 'options': ['Silk Road', 'Spice Route', 'Amber Road', 'Tea Road'], 'sub': 'ancient'},
-        {'q': 'Who was the first explorer to circumnavigate the globe?', 'a': 'Ferdinand Magellan', 'options': ['Ferdinand Magellan', 'Christopher Columbus', 'Vasco da Gama', 'Francis Drake'], 'sub': 'world_history'},
-        {'q': 'What was the primary purpose of the Lewis and Clark expedition?', 'a': 'Explore western territories', 'options': ['Explore western territories', 'Find gold', 'Establish trade', 'Map the coast'], 'sub': 'presidents'},
-        {'q': 'What was the shortest war in recorded history?', 'a': 'Anglo-Zanzibar War', 'options': ['Anglo-Zanzibar War', 'Six-Day War', 'Football War', 'Falklands War'], 'sub': 'wars'},
-        {'q': 'What year was the first email sent?', 'a': '1971', 'options': ['1971', '1969', '1975', '1983'], 'sub': 'modern'},
-    ],
-    'science': [
-        {'q': 'What is the closest planet to the Sun?', 'a': 'Mercury', 'options': ['Mercury', 'Venus', 'Mars', 'Earth'], 'sub': 'space'},
-        {'q': 'What is the largest organ in the human body?', 'a': 'Skin', 'options': ['Skin', 'Liver', 'Heart', 'Brain'], 'sub': 'human_body'},
-        {'q': 'What is the chemical symbol for gold?', 'a': 'Au', 'options': ['Au', 'Ag', 'Fe', 'Go'], 'sub': 'chemistry'},
-        {'q': 'What is the fastest land animal?', 'a': 'Cheetah', 'options': ['Cheetah', 'Lion', 'Gazelle', 'Horse'], 'sub': 'animals'},
-        {'q': 'What force keeps planets in orbit around the Sun?', 'a': 'Gravity', 'options': ['Gravity', 'Magnetism', 'Friction', 'Inertia'], 'sub': 'physics'},
-        {'q': 'What is the largest planet in our solar system?', 'a': 'Jupiter', 'options': ['Jupiter', 'Saturn', 'Neptune', 'Uranus'], 'sub': 'space'},
-        {'q': 'How many bones are in the adult human body?', 'a': '206', 'options': ['206', '208', '204', '212'], 'sub': 'human_body'},
-        {'q': 'What is the hardest natural substance on Earth?', 'a': 'Diamond', 'options': ['Diamond', 'Titanium', 'Platinum', 'Quartz'], 'sub': 'earth_science'},
-        {'q': 'What gas do plants absorb from the atmosphere?', 'a': 'Carbon dioxide', 'options': ['Carbon dioxide', 'Oxygen', 'Nitrogen', 'Hydrogen'], 'sub': 'earth_science'},
-        {'q': 'What is the speed of light in a vacuum (approximately)?', 'a': '300,000 km/s', 'options': ['300,000 km/s', '150,000 km/s', '500,000 km/s', '1,000,000 km/s'], 'sub': 'physics'},
-        {'q': 'What is the chemical formula for water?', 'a': 'H2O', 'options': ['H2O', 'CO2', 'NaCl', 'O2'], 'sub': 'chemistry'},
-        {'q': 'What planet is known as the Red Planet?', 'a': 'Mars', 'options': ['Mars', 'Venus', 'Jupiter', 'Saturn'], 'sub': 'space'},
-        {'q': 'What is the powerhouse of the cell?', 'a': 'Mitochondria', 'options': ['Mitochondria', 'Nucleus', 'Ribosome', 'Golgi body'], 'sub': 'biology'},
-        {'q': 'What is the boiling point of water in Celsius?', 'a': '100°C', 'options': ['100°C', '90°C', '110°C', '212°C'], 'sub': 'physics'},
-        {'q': 'How many chromosomes do humans have?', 'a': '46', 'options': ['46', '23', '48', '44'], 'sub': 'biology'},
-        {'q': 'What element has the atomic number 1?', 'a': 'Hydrogen', 'options': ['Hydrogen', 'Helium', 'Oxygen', 'Carbon'], 'sub': 'chemistry'},
-        {'q': 'What is the largest mammal on Earth?', 'a': 'Blue whale', 'options': ['Blue whale', 'Elephant', 'Giraffe', 'Hippopotamus'], 'sub': 'animals'},
-        {'q': 'What is the center of an atom called?', 'a': 'Nucleus', 'options': ['Nucleus', 'Electron', 'Proton', 'Neutron'], 'sub': 'chemistry'},
-        {'q': 'What gas makes up most of Earth\'s atmosphere?', 'a': 'Nitrogen', 'options': ['Nitrogen', 'Oxygen', 'Carbon dioxide', 'Argon'], 'sub': 'earth_science'},
-        {'q': 'What is the smallest unit of life?', 'a': 'Cell', 'options': ['Cell', 'Atom', 'Molecule', 'Organ'], 'sub': 'biology'},
-        {'q': 'What planet has the most moons?', 'a': 'Saturn', 'options': ['Saturn', 'Jupiter', 'Uranus', 'Neptune'], 'sub': 'space'},
-        {'q': 'What type of rock is formed from cooled lava?', 'a': 'Igneous', 'options': ['Igneous', 'Sedimentary', 'Metamorphic', 'ite'], 'sub': 'earth_science'},
-        {'q': 'What is the main gas in the Sun?', 'a': 'Hydrogen', 'options': ['Hydrogen', 'Helium', 'Oxygen', 'Nitrogen'], 'sub': 'space'},
-        {'q': 'What vitamin is produced when skin is exposed to sunlight?', 'a': 'Vitamin D', 'options': ['Vitamin D', 'Vitamin C', 'Vitamin A', 'Vitamin B'], 'sub': 'human_body'},
-        {'q': 'What is the study of earthquakes called?', 'a': 'Seismology', 'options': ['Seismology', 'Geology', 'Volcanology', 'Meteorology'], 'sub': 'earth_science'},
-        {'q': 'How many legs does a spider have?', 'a': '8', 'options': ['8', '6', '10', '4'], 'sub': 'animals'},
-        {'q': 'What is the chemical symbol for iron?', 'a': 'Fe', 'options': ['Fe', 'Ir', 'In', 'I'], 'sub': 'chemistry'},
-        {'q': 'What organ pumps blood through the body?', 'a': 'Heart', 'options': ['Heart', 'Lungs', 'Liver', 'Brain'], 'sub': 'human_body'},
-        {'q': 'What is the freezing point of water in Fahrenheit?', 'a': '32°F', 'options': ['32°F', '0°F', '100°F', '212°F'], 'sub': 'physics'},
-        {'q': 'What type of animal is a dolphin?', 'a': 'Mammal', 'options': ['Mammal', 'Fish', 'Reptile', 'Amphibian'], 'sub': 'animals'},
-        {'q': 'What planet is known for its rings?', 'a': 'Saturn', 'options': ['Saturn', 'Jupiter', 'Uranus', 'Neptune'], 'sub': 'space'},
-        {'q': 'What is the most abundant element in the universe?', 'a': 'Hydrogen', 'options': ['Hydrogen', 'Helium', 'Oxygen', 'Carbon'], 'sub': 'chemistry'},
-        {'q': 'What part of the plant conducts photosynthesis?', 'a': 'Leaves', 'options': ['Leaves', 'Roots', 'Stem', 'Flowers'], 'sub': 'biology'},
-        {'q': 'What is the speed of sound in air at sea level?', 'a': '343 m/s', 'options': ['343 m/s', '300 m/s', '400 m/s', '500 m/s'], 'sub': 'physics'},
-        {'q': 'What blood type is the universal donor?', 'a': 'O negative', 'options': ['O negative', 'AB positive', 'A positive', 'B negative'], 'sub': 'human_body'},
-        {'q': 'What is the largest organ inside the human body?', 'a': 'Liver', 'options': ['Liver', 'Heart', 'Brain', 'Lungs'], 'sub': 'human_body'},
-        {'q': 'What force opposes motion between surfaces?', 'a': 'Friction', 'options': ['Friction', 'Gravity', 'Magnetism', 'Tension'], 'sub': 'physics'},
-        {'q': 'How many planets are in our solar system?', 'a': '8', 'options': ['8', '9', '7', '10'], 'sub': 'space'},
-        {'q': 'What is table salt\'s chemical name?', 'a': 'Sodium chloride', 'options': ['Sodium chloride', 'Potassium chloride', 'Calcium chloride', 'Sodium bicarbonate'], 'sub': 'chemistry'},
-        {'q': 'What is the largest species of big cat?', 'a': 'Tiger', 'options': ['Tiger', 'Lion', 'Leopard', 'Jaguar'], 'sub': 'animals'},
-        {'q': 'What phenomenon causes the Northern Lights?', 'a': 'Solar particles', 'options': ['Solar particles', 'Moon reflection', 'Volcanic ash', 'Meteor showers'], 'sub': 'space'},
-        {'q': 'What is the pH of pure water?', 'a': '7', 'options': ['7', '0', '14', '1'], 'sub': 'chemistry'},
-        {'q': 'What carries oxygen in red blood cells?', 'a': 'Hemoglobin', 'options': ['Hemoglobin', 'Plasma', 'Platelets', 'White blood cells'], 'sub': 'human_body'},
-        {'q': 'What is the study of weather called?', 'a': 'Meteorology', 'options': ['Meteorology', 'Climatology', 'Geology', 'Astronomy'], 'sub': 'earth_science'},
-        {'q': 'What is the largest land animal?', 'a': 'African elephant', 'options': ['African elephant', 'Rhinoceros', 'Hippopotamus', 'Giraffe'], 'sub': 'animals'},
-        {'q': 'What is absolute zero in Celsius?', 'a': '-273.15°C', 'options': ['-273.15°C', '-100°C', '0°C', '-459.67°C'], 'sub': 'physics'},
-        {'q': 'What organelle contains genetic material?', 'a': 'Nucleus', 'options': ['Nucleus', 'Mitochondria', 'Ribosome', 'Cytoplasm'], 'sub': 'biology'},
-        {'q': 'What scale is commonly used to measure the magnitude of earthquakes?', 'a': 'Richter scale', 'options': ['Richter scale', 'Mercalli scale', 'Beaufort scale', 'Mohs scale'], 'sub': 'earth_science'},
-        {'q': 'What planet rotates on its side?', 'a': 'Uranus', 'options': ['Uranus', 'Neptune', 'Venus', 'Pluto'], 'sub': 'space'},
-        {'q': 'What is the human body\'s largest muscle?', 'a': 'Gluteus maximus', 'options': ['Gluteus maximus', 'Quadriceps', 'Latissimus dorsi', 'Biceps'], 'sub': 'human_body'},
-        {'q': 'What is the name of NASA\'s Mars helicopter?', 'a': 'Ingenuity', 'options': ['Ingenuity', 'Perseverance', 'Curiosity', 'Spirit'], 'sub': 'space'},
-        {'q': 'What year did the Hubble Space Telescope launch?', 'a': '1990', 'options': ['1990', '1985', '1995', '2000'], 'sub': 'space'},
-    ],
-    'entertainment': [
-        {'q': 'Which film won the Academy Award for Best Picture in 2024?', 'a': 'Oppenheimer', 'options': ['Oppenheimer', 'Barbie', 'Killers of the Flower Moon', 'Poor Things'], 'sub': 'movies'},
-        {'q': 'Who sang "Bohemian Rhapsody"?', 'a': 'Queen', 'options': ['Queen', 'The Beatles', 'Led Zeppelin', 'Pink Floyd'], 'sub': 'music'},
-        {'q': 'What TV series features a chemistry teacher turned drug manufacturer?', 'a': 'Breaking Bad', 'options': ['Breaking Bad', 'The Wire', 'Ozark', 'Narcos'], 'sub': 'tv'},
-        {'q': 'Who wrote the Harry Potter book series?', 'a': 'J.K. Rowling', 'options': ['J.K. Rowling', 'Stephen King', 'George R.R. Martin', 'Suzanne Collins'], 'sub': 'literature'},
-        {'q': 'Which artist released the album "1989"?', 'a': 'Taylor Swift', 'options': ['Taylor Swift', 'Beyoncé', 'Adele', 'Lady Gaga'], 'sub': 'music'},
-        {'q': 'In what year was the first iPhone released?', 'a': '2007', 'options': ['2007', '2005', '2008', '2010'], 'sub': 'tech'},
-        {'q': 'Which movie features the quote "I\'ll be back"?', 'a': 'The Terminator', 'options': ['The Terminator', 'Predator', 'Total Recall', 'Commando'], 'sub': 'movies'},
-        {'q': 'Who played Iron Man in the Marvel Cinematic Universe?', 'a': 'Robert Downey Jr.', 'options': ['Robert Downey Jr.', 'Chris Evans', 'Chris Hemsworth', 'Mark Ruffalo'], 'sub': 'movies'},
-        {'q': 'Which band performed "Smells Like Teen Spirit"?', 'a': 'Nirvana', 'options': ['Nirvana', 'Pearl Jam', 'Soundgarden', 'Alice in Chains'], 'sub': 'music'},
-        {'q': 'What streaming service produced "Stranger Things"?', 'a': 'Netflix', 'options': ['Netflix', 'Hulu', 'Amazon Prime', 'Disney+'], 'sub': 'tv'},
-        {'q': 'Who directed the movie "Titanic"?', 'a': 'James Cameron', 'options': ['James Cameron', 'Steven Spielberg', 'Martin Scorsese', 'Christopher Nolan'], 'sub': 'movies'},
-        {'q': 'What band was Freddie Mercury the lead singer of?', 'a': 'Queen', 'options': ['Queen', 'The Rolling Stones', 'Led Zeppelin', 'The Who'], 'sub': 'music'},
-        {'q': 'Which TV show features dragons and the Iron Throne?', 'a': 'Game of Thrones', 'options': ['Game of Thrones', 'Lord of the Rings', 'The Witcher', 'Vikings'], 'sub': 'tv'},
-        {'q': 'Who wrote "Romeo and Juliet"?', 'a': 'William Shakespeare', 'options': ['William Shakespeare', 'Charles Dickens', 'Jane Austen', 'Mark Twain'], 'sub': 'literature'},
-        {'q': 'What movie features a shark terrorizing a beach town?', 'a': 'Jaws', 'options': ['Jaws', 'The Meg', 'Deep Blue Sea', 'Sharknado'], 'sub': 'movies'},
-        {'q': 'Who is known as the "King of Pop"?', 'a': 'Michael Jackson', 'options': ['Michael Jackson', 'Elvis Presley', 'Prince', 'Stevie Wonder'], 'sub': 'music'},
-        {'q': 'What sitcom featured six friends living in New York City?', 'a': 'Friends', 'options': ['Friends', 'Seinfeld', 'How I Met Your Mother', 'The Big Bang Theory'], 'sub': 'tv'},
-        {'q': 'Who wrote "1984"?', 'a': 'George Orwell', 'options': ['George Orwell', 'Aldous Huxley', 'Ray Bradbury', 'H.G. Wells'], 'sub': 'literature'},
-        {'q': 'Which film won the first Academy Award for Best Picture?', 'a': 'Wings', 'options': ['Wings', 'The Jazz Singer', 'Sunrise', 'The Broadway Melody'], 'sub': 'movies'},
-        {'q': 'What band sang "Hotel California"?', 'a': 'Eagles', 'options': ['Eagles', 'Fleetwood Mac', 'The Doors', 'Creedence Clearwater Revival'], 'sub': 'music'},
-        {'q': 'What animated show features a family named Griffin in Quahog, Rhode Island?', 'a': 'Family Guy', 'options': ['Family Guy', 'The Simpsons', 'American Dad', 'South Park'], 'sub': 'tv'},
-        {'q': 'Who wrote "Pride and Prejudice"?', 'a': 'Jane Austen', 'options': ['Jane Austen', 'Charlotte Brontë', 'Emily Brontë', 'Virginia Woolf'], 'sub': 'literature'},
-        {'q': 'What animated film features a lion cub named Simba?', 'a': 'The Lion King', 'options': ['The Lion King', 'Madagascar', 'The Jungle Book', 'Tarzan'], 'sub': 'movies'},
-        {'q': 'Who sang "Like a Virgin"?', 'a': 'Madonna', 'options': ['Madonna', 'Cyndi Lauper', 'Whitney Houston', 'Janet Jackson'], 'sub': 'music'},
-        {'q': 'What TV series is set in the 1960s at a fictional advertising agency on Madison Avenue?', 'a': 'Mad Men', 'options': ['Mad Men', 'Boardwalk Empire', 'The Crown', 'Downton Abbey'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Great Gatsby"?', 'a': 'F. Scott Fitzgerald', 'options': ['F. Scott Fitzgerald', 'Ernest Hemingway', 'John Steinbeck', 'William Faulkner'], 'sub': 'literature'},
-        {'q': 'What superhero is also known as the "Dark Knight"?', 'a': 'Batman', 'options': ['Batman', 'Superman', 'Spider-Man', 'Iron Man'], 'sub': 'movies'},
-        {'q': 'Who is the lead singer of U2?', 'a': 'Bono', 'options': ['Bono', 'The Edge', 'Sting', 'Chris Martin'], 'sub': 'music'},
-        {'q': 'What TV show follows the Bluth family?', 'a': 'Arrested Development', 'options': ['Arrested Development', 'Modern Family', 'Schitt\'s Creek', 'The Office'], 'sub': 'tv'},
-        {'q': 'Who wrote "To Kill a Mockingbird"?', 'a': 'Harper Lee', 'options': ['Harper Lee', 'John Steinbeck', 'Mark Twain', 'Ernest Hemingway'], 'sub': 'literature'},
-        {'q': 'What movie trilogy features Frodo and the One Ring?', 'a': 'Lord of the Rings', 'options': ['Lord of the Rings', 'The Hobbit', 'Harry Potter', 'Narnia'], 'sub': 'movies'},
-        {'q': 'Who sang "Thriller"?', 'a': 'Michael Jackson', 'options': ['Michael Jackson', 'Prince', 'Stevie Wonder', 'James Brown'], 'sub': 'music'},
-        {'q': 'What TV series follows the Shelby crime family in post-WWI Birmingham, England?', 'a': 'Peaky Blinders', 'options': ['Peaky Blinders', 'Boardwalk Empire', 'Vikings', 'Downton Abbey'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Catcher in the Rye"?', 'a': 'J.D. Salinger', 'options': ['J.D. Salinger', 'Jack Kerouac', 'F. Scott Fitzgerald', 'Ernest Hemingway'], 'sub': 'literature'},
-        {'q': 'What movie features a DeLorean time machine?', 'a': 'Back to the Future', 'options': ['Back to the Future', 'The Terminator', 'Bill & Ted', 'Hot Tub Time Machine'], 'sub': 'movies'},
-        {'q': 'Who is the lead singer of Coldplay?', 'a': 'Chris Martin', 'options': ['Chris Martin', 'Thom Yorke', 'Brandon Flowers', 'Matt Bellamy'], 'sub': 'music'},
-        {'q': 'What TV show features the Dunder Mifflin Paper Company?', 'a': 'The Office', 'options': ['The Office', 'Parks and Recreation', 'Brooklyn Nine-Nine', 'Superstore'], 'sub': 'tv'},
-        {'q': 'Who wrote "Moby-Dick"?', 'a': 'Herman Melville', 'options': ['Herman Melville', 'Mark Twain', 'Nathaniel Hawthorne', 'Edgar Allan Poe'], 'sub': 'literature'},
-        {'q': 'What movie features the character Jack Sparrow?', 'a': 'Pirates of the Caribbean', 'options': ['Pirates of the Caribbean', 'The Princess Bride', 'Master and Commander', 'Cutthroat Island'], 'sub': 'movies'},
-        {'q': 'Who sang "Rolling in the Deep"?', 'a': 'Adele', 'options': ['Adele', 'Amy Winehouse', 'Beyoncé', 'Rihanna'], 'sub': 'music'},
-        {'q': 'What TV show is set in the fictional town of Hawkins, Indiana?', 'a': 'Stranger Things', 'options': ['Stranger Things', 'Supernatural', 'The X-Files', 'Twin Peaks'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Hunger Games"?', 'a': 'Suzanne Collins', 'options': ['Suzanne Collins', 'Veronica Roth', 'James Dashner', 'Stephenie Meyer'], 'sub': 'literature'},
-        {'q': 'What movie features the quote "Here\'s looking at you, kid"?', 'a': 'Casablanca', 'options': ['Casablanca', 'Gone with the Wind', 'Citizen Kane', 'The Maltese Falcon'], 'sub': 'movies'},
-        {'q': 'Who is the lead singer of The Rolling Stones?', 'a': 'Mick Jagger', 'options': ['Mick Jagger', 'Keith Richards', 'Roger Daltrey', 'Robert Plant'], 'sub': 'music'},
-        {'q': 'What comedy series features the Parks Department employees of Pawnee, Indiana?', 'a': 'Parks and Recreation', 'options': ['Parks and Recreation', 'The Office', 'Brooklyn Nine-Nine', 'Superstore'], 'sub': 'tv'},
-        {'q': 'Who wrote "Lord of the Flies"?', 'a': 'William Golding', 'options': ['William Golding', 'George Orwell', 'Aldous Huxley', 'Ray Bradbury'], 'sub': 'literature'},
-        {'q': 'What Disney movie features a wooden puppet who wants to be a real boy?', 'a': 'Pinocchio', 'options': ['Pinocchio', 'Dumbo', 'Bambi', 'Fantasia'], 'sub': 'movies'},
-        {'q': 'Who sang "Purple Rain"?', 'a': 'Prince', 'options': ['Prince', 'Michael Jackson', 'Stevie Wonder', 'James Brown'], 'sub': 'music'},
-        {'q': 'What TV show features FBI agents Mulder and Scully?', 'a': 'The X-Files', 'options': ['The X-Files', 'Criminal Minds', 'Fringe', 'Supernatural'], 'sub': 'tv'},
-        {'q': 'Who wrote "Brave New World"?', 'a': 'Aldous Huxley', 'options': ['Aldous Huxley', 'George Orwell', 'Ray Bradbury', 'H.G. Wells'], 'sub': 'literature'},
-    ],
-    'sports': [
-        {'q': 'Which country has won the most FIFA World Cup titles?', 'a': 'Brazil', 'options': ['Brazil', 'Germany', 'Italy', 'Argentina'], 'sub': 'soccer'},
-        {'q': 'How many players are on a basketball team on the court at once?', 'a': '5', 'options': ['5', '6', '7', '4'], 'sub': 'basketball'},
-        {'q': 'Who holds the record for most home runs in MLB history?', 'a': 'Barry Bonds', 'options': ['Barry Bonds', 'Hank Aaron', 'Babe Ruth', 'Alex Rodriguez'], 'sub': 'baseball'},
-        {'q': 'Which NFL team has won the most Super Bowls?', 'a': 'New England Patriots', 'options': ['New England Patriots', 'Pittsburgh Steelers', 'Dallas Cowboys', 'San Francisco 49ers'], 'sub': 'football'},
-        {'q': 'In which city were the 2020 Summer Olympics held (delayed to 2021)?', 'a': 'Tokyo', 'options': ['Tokyo', 'Paris', 'London', 'Rio de Janeiro'], 'sub': 'olympics'},
-        {'q': 'Who is the all-time leading scorer in NBA history?', 'a': 'LeBron James', 'options': ['LeBron James', 'Kareem Abdul-Jabbar', 'Michael Jordan', 'Kobe Bryant'], 'sub': 'basketball'},
-        {'q': 'What is the only Grand Slam tennis tournament played on grass?', 'a': 'Wimbledon', 'options': ['Wimbledon', 'US Open', 'French Open', 'Australian Open'], 'sub': 'tennis'},
-        {'q': 'In which city were the first modern Olympic Games held in 1896?', 'a': 'Athens', 'options': ['Athens', 'Paris', 'London', 'Rome'], 'sub': 'olympics'},
-        {'q': 'What sport is played at Augusta National?', 'a': 'Golf', 'options': ['Golf', 'Tennis', 'Polo', 'Cricket'], 'sub': 'golf'},
-        {'q': 'Who won Super Bowl LVIII in 2024?', 'a': 'Kansas City Chiefs', 'options': ['Kansas City Chiefs', 'San Francisco 49ers', 'Philadelphia Eagles', 'Baltimore Ravens'], 'sub': 'football'},
-        {'q': 'What is the national sport of Canada?', 'a': 'Lacrosse', 'options': ['Lacrosse', 'Ice Hockey', 'Curling', 'Baseball'], 'sub': 'misc'},
-        {'q': 'How many points is a touchdown worth in American football?', 'a': '6', 'options': ['6', '7', '3', '4'], 'sub': 'football'},
-        {'q': 'Who is known as "The Great One" in hockey?', 'a': 'Wayne Gretzky', 'options': ['Wayne Gretzky', 'Mario Lemieux', 'Bobby Orr', 'Gordie Howe'], 'sub': 'hockey'},
-        {'q': 'Which country won the first FIFA World Cup in 1930?', 'a': 'Uruguay', 'options': ['Uruguay', 'Brazil', 'Argentina', 'Italy'], 'sub': 'soccer'},
-        {'q': 'How long is a marathon in miles?', 'a': '26.2', 'options': ['26.2', '24', '25', '30'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most career NBA championships as a player?', 'a': 'Bill Russell', 'options': ['Bill Russell', 'Michael Jordan', 'LeBron James', 'Magic Johnson'], 'sub': 'basketball'},
-        {'q': 'What sport uses a shuttlecock?', 'a': 'Badminton', 'options': ['Badminton', 'Tennis', 'Squash', 'Racquetball'], 'sub': 'misc'},
-        {'q': 'Which country has won the most Cricket World Cups?', 'a': 'Australia', 'options': ['Australia', 'India', 'West Indies', 'England'], 'sub': 'misc'},
-        {'q': 'Who won the 2023 NBA Finals?', 'a': 'Denver Nuggets', 'options': ['Denver Nuggets', 'Miami Heat', 'Boston Celtics', 'Golden State Warriors'], 'sub': 'basketball'},
-        {'q': 'What is the maximum score in a single frame of bowling?', 'a': '30', 'options': ['30', '10', '20', '50'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most Grand Slam tennis titles (men)?', 'a': 'Novak Djokovic', 'options': ['Novak Djokovic', 'Rafael Nadal', 'Roger Federer', 'Pete Sampras'], 'sub': 'tennis'},
-        {'q': 'What is the diameter of a basketball hoop in inches?', 'a': '18', 'options': ['18', '20', '16', '24'], 'sub': 'basketball'},
-        {'q': 'Which boxer was known as "The Greatest"?', 'a': 'Muhammad Ali', 'options': ['Muhammad Ali', 'Mike Tyson', 'Joe Frazier', 'George Foreman'], 'sub': 'misc'},
-        {'q': 'How many holes are played in a standard round of golf?', 'a': '18', 'options': ['18', '9', '12', '21'], 'sub': 'golf'},
-        {'q': 'Which team has won the most MLB World Series?', 'a': 'New York Yankees', 'options': ['New York Yankees', 'St. Louis Cardinals', 'Boston Red Sox', 'Los Angeles Dodgers'], 'sub': 'baseball'},
-        {'q': 'What is the term for three strikes in a row in bowling?', 'a': 'Turkey', 'options': ['Turkey', 'Hat trick', 'Triple', 'Strike out'], 'sub': 'misc'},
-        {'q': 'What NBA team did Michael Jordan win 6 championships with?', 'a': 'Chicago Bulls', 'options': ['Chicago Bulls', 'Los Angeles Lakers', 'Boston Celtics', 'Detroit Pistons'], 'sub': 'basketball'},
-        {'q': 'What country is sumo wrestling from?', 'a': 'Japan', 'options': ['Japan', 'China', 'Korea', 'Mongolia'], 'sub': 'misc'},
-        {'q': 'How many periods are in an NHL hockey game?', 'a': '3', 'options': ['3', '4', '2', '5'], 'sub': 'hockey'},
-        {'q': 'Who holds the record for most career goals in NHL history?', 'a': 'Wayne Gretzky', 'options': ['Wayne Gretzky', 'Gordie Howe', 'Alex Ovechkin', 'Jaromir Jagr'], 'sub': 'hockey'},
-        {'q': 'What is the term for a score of one under par in golf?', 'a': 'Birdie', 'options': ['Birdie', 'Eagle', 'Bogey', 'Par'], 'sub': 'golf'},
-        {'q': 'Which country has won the most Olympic gold medals all-time?', 'a': 'United States', 'options': ['United States', 'Soviet Union', 'China', 'Great Britain'], 'sub': 'olympics'},
-        {'q': 'How many players are on a baseball team on the field?', 'a': '9', 'options': ['9', '10', '8', '11'], 'sub': 'baseball'},
-        {'q': 'What tennis tournament is played on clay courts?', 'a': 'French Open', 'options': ['French Open', 'US Open', 'Wimbledon', 'Australian Open'], 'sub': 'tennis'},
-        {'q': 'Who is the fastest man in the world based on the 100m record?', 'a': 'Usain Bolt', 'options': ['Usain Bolt', 'Carl Lewis', 'Tyson Gay', 'Yohan Blake'], 'sub': 'olympics'},
-        {'q': 'What is a perfect score in a game of ten-pin bowling?', 'a': '300', 'options': ['300', '200', '400', '150'], 'sub': 'misc'},
-        {'q': 'Which team won the first Super Bowl?', 'a': 'Green Bay Packers', 'options': ['Green Bay Packers', 'Kansas City Chiefs', 'Dallas Cowboys', 'Miami Dolphins'], 'sub': 'football'},
-        {'q': 'How many sets does a player need to win a men\'s Grand Slam tennis match?', 'a': '3', 'options': ['3', '2', '4', '5'], 'sub': 'tennis'},
-        {'q': 'What sport is known as "the beautiful game"?', 'a': 'Soccer', 'options': ['Soccer', 'Basketball', 'Cricket', 'Rugby'], 'sub': 'soccer'},
-        {'q': 'Which golfer has won the most major championships?', 'a': 'Jack Nicklaus', 'options': ['Jack Nicklaus', 'Tiger Woods', 'Arnold Palmer', 'Gary Player'], 'sub': 'golf'},
-        {'q': 'What is the name of the trophy awarded to NHL champions?', 'a': 'Stanley Cup', 'options': ['Stanley Cup', 'Presidents Trophy', 'Conn Smythe', 'Hart Trophy'], 'sub': 'hockey'},
-        {'q': 'How many players are on a soccer team on the field?', 'a': '11', 'options': ['11', '10', '9', '12'], 'sub': 'soccer'},
-        {'q': 'Who holds the record for most career passing yards in the NFL?', 'a': 'Tom Brady', 'options': ['Tom Brady', 'Drew Brees', 'Peyton Manning', 'Brett Favre'], 'sub': 'football'},
-        {'q': 'In pool, what color is the 8-ball?', 'a': 'Black', 'options': ['Black', 'White', 'Red', 'Blue'], 'sub': 'misc'},
-        {'q': 'Which country invented basketball?', 'a': 'United States', 'options': ['United States', 'Canada', 'England', 'France'], 'sub': 'basketball'},
-        {'q': 'How many rings are on the Olympic flag?', 'a': '5', 'options': ['5', '6', '4', '7'], 'sub': 'olympics'},
-        {'q': 'What is the distance of a free throw line from the basket?', 'a': '15 feet', 'options': ['15 feet', '12 feet', '18 feet', '10 feet'], 'sub': 'basketball'},
-        {'q': 'Which country won the 2022 FIFA World Cup?', 'a': 'Argentina', 'options': ['Argentina', 'France', 'Brazil', 'Croatia'], 'sub': 'soccer'},
-        {'q': 'What is the term for three goals in a hockey game by one player?', 'a': 'Hat trick', 'options': ['Hat trick', 'Triple', 'Trifecta', 'Three-peat'], 'sub': 'hockey'},
-        {'q': 'Who is the all-time leading scorer in FIFA World Cup history?', 'a': 'Miroslav Klose', 'options': ['Miroslav Klose', 'Ronaldo', 'Pelé', 'Gerd Müller'], 'sub': 'soccer'},
-        {'q': 'What city is hosting the 2026 Winter Olympics?', 'a': 'Milan-Cortina', 'options': ['Milan-Cortina', 'Salt Lake City', 'Sapporo', 'Barcelona'], 'sub': 'olympics'},
-        {'q': 'Which three countries are co-hosting the 2026 FIFA World Cup?', 'a': 'USA, Canada, Mexico', 'options': ['USA, Canada, Mexico', 'USA, UK, Ireland', 'Spain, Portugal, Morocco', 'Germany, Austria, Switzerland'], 'sub': 'soccer'},
-        {'q': 'What sport is played on the largest field?', 'a': 'Polo', 'options': ['Polo', 'Soccer', 'Cricket', 'Rugby'], 'sub': 'misc'},
-        {'q': 'How many dimples are on a standard golf ball?', 'a': '336', 'options': ['336', '250', '400', '500'], 'sub': 'golf'},
-        {'q': 'What is the only position in football that can be tackled behind the line of scrimmage?', 'a': 'Quarterback', 'options': ['Quarterback', 'Running back', 'Wide receiver', 'Any position'], 'sub': 'football'},
-        {'q': 'In baseball, how many strikes make an out?', 'a': '3', 'options': ['3', '2', '4', '5'], 'sub': 'baseball'},
-        {'q': 'What is the term for two strokes under par on a golf hole?', 'a': 'Eagle', 'options': ['Eagle', 'Birdie', 'Albatross', 'Bogey'], 'sub': 'golf'},
-        {'q': 'Which NHL team plays in Detroit?', 'a': 'Red Wings', 'options': ['Red Wings', 'Pistons', 'Tigers', 'Lions'], 'sub': 'hockey'},
-        {'q': 'What is the width of a tennis court for singles play in feet?', 'a': '27 feet', 'options': ['27 feet', '36 feet', '30 feet', '24 feet'], 'sub': 'tennis'},
-        {'q': 'In baseball, what is a hit that allows the batter to reach second base?', 'a': 'Double', 'options': ['Double', 'Triple', 'Single', 'Home run'], 'sub': 'baseball'},
-        {'q': 'What color jersey does the leader of the Tour de France wear?', 'a': 'Yellow', 'options': ['Yellow', 'Red', 'Green', 'Blue'], 'sub': 'misc'},
-        {'q': 'How many downs does a team get to move 10 yards in football?', 'a': '4', 'options': ['4', '3', '5', '6'], 'sub': 'football'},
-        {'q': 'What is the penalty area in soccer also commonly called?', 'a': 'The box', 'options': ['The box', 'The zone', 'The circle', 'The crease'], 'sub': 'soccer'},
-        {'q': 'Which sport uses the terms "love," "deuce," and "advantage"?', 'a': 'Tennis', 'options': ['Tennis', 'Badminton', 'Squash', 'Table tennis'], 'sub': 'tennis'},
-        {'q': 'What is the name of the ice hockey puck made of?', 'a': 'Vulcanized rubber', 'options': ['Vulcanized rubber', 'Hard plastic', 'Compressed foam', 'Solid wood'], 'sub': 'hockey'},
-        {'q': 'How many bases are on a baseball diamond?', 'a': '4', 'options': ['4', '3', '5', '6'], 'sub': 'baseball'},
-        {'q': 'What sport is known as "the gentleman\'s game"?', 'a': 'Cricket', 'options': ['Cricket', 'Golf', 'Tennis', 'Polo'], 'sub': 'misc'},
-        {'q': 'What does NFL stand for?', 'a': 'National Football League', 'options': ['National Football League', 'National Federation League', 'North Football League', 'National Football Leaders'], 'sub': 'football'},
-        {'q': 'In golf, what is the term for one stroke over par?', 'a': 'Bogey', 'options': ['Bogey', 'Birdie', 'Eagle', 'Double'], 'sub': 'golf'},
-        {'q': 'What shape is a boxing ring?', 'a': 'Square', 'options': ['Square', 'Circle', 'Octagon', 'Rectangle'], 'sub': 'misc'},
-        {'q': 'How many players are on a volleyball team on the court?', 'a': '6', 'options': ['6', '5', '7', '8'], 'sub': 'misc'},
-        {'q': 'What is the only position in hockey that can legally use their hands to stop the puck?', 'a': 'Goalie', 'options': ['Goalie', 'Defenseman', 'Center', 'Any position'], 'sub': 'hockey'},
-        {'q': 'How many laps make up a standard NASCAR race at Daytona?', 'a': '200', 'options': ['200', '300', '150', '500'], 'sub': 'misc'},
-        {'q': 'What is the farthest distance from the green that counts as "on the green" in golf?', 'a': 'The fringe', 'options': ['The fringe', 'The rough', 'The fairway', 'The collar'], 'sub': 'golf'},
-        {'q': 'In baseball, what is the area where batters warm up called?', 'a': 'On-deck circle', 'options': ['On-deck circle', 'Batting cage', 'Warm-up zone', 'Batter\'s box'], 'sub': 'baseball'},
-        {'q': 'How many points is a 3-pointer worth in basketball?', 'a': '3 points', 'options': ['3 points', '2 points', '4 points', '1 point'], 'sub': 'basketball'},
-        {'q': 'What sport uses a try, conversion, and scrum?', 'a': 'Rugby', 'options': ['Rugby', 'Football', 'Cricket', 'Lacrosse'], 'sub': 'misc'},
-        {'q': 'Which NFL position is abbreviated QB?', 'a': 'Quarterback', 'options': ['Quarterback', 'Quaterback', 'Quick blocker', 'Quality back'], 'sub': 'football'},
-        {'q': 'What is the blue line in hockey used for?', 'a': 'Marking the offensive zone', 'options': ['Marking the offensive zone', 'Marking the goal area', 'Penalty area', 'Center ice'], 'sub': 'hockey'},
-        {'q': 'How many Olympic rings represent the five continents?', 'a': '5', 'options': ['5', '4', '6', '7'], 'sub': 'olympics'},
-        {'q': 'What surface is the Australian Open tennis tournament played on?', 'a': 'Hard court', 'options': ['Hard court', 'Clay', 'Grass', 'Carpet'], 'sub': 'tennis'},
-    ],
-    'geography': [
-        {'q': 'What is the capital of Australia?', 'a': 'Canberra', 'options': ['Canberra', 'Sydney', 'Melbourne', 'Brisbane'], 'sub': 'capitals'},
-        {'q': 'Which country has the largest population in the world?', 'a': 'India', 'options': ['India', 'China', 'USA', 'Indonesia'], 'sub': 'countries'},
-        {'q': 'What is the longest river in the world?', 'a': 'Nile', 'options': ['Nile', 'Amazon', 'Mississippi', 'Yangtze'], 'sub': 'landmarks'},
-        {'q': 'Which continent is the Sahara Desert located on?', 'a': 'Africa', 'options': ['Africa', 'Asia', 'Australia', 'South America'], 'sub': 'continents'},
-        {'q': 'What is the smallest country in the world by area?', 'a': 'Vatican City', 'options': ['Vatican City', 'Monaco', 'San Marino', 'Liechtenstein'], 'sub': 'countries'},
-        {'q': 'Which country\'s flag features a maple leaf?', 'a': 'Canada', 'options': ['Canada', 'USA', 'Japan', 'South Korea'], 'sub': 'flags'},
-        {'q': 'Mount Everest is located on the border of which two countries?', 'a': 'Nepal and China', 'options': ['Nepal and China', 'India and China', 'Nepal and India', 'Pakistan and China'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Brazil?', 'a': 'Brasília', 'options': ['Brasília', 'Rio de Janeiro', 'São Paulo', 'Salvador'], 'sub': 'capitals'},
-        {'q': 'Which ocean is the largest?', 'a': 'Pacific', 'options': ['Pacific', 'Atlantic', 'Indian', 'Arctic'], 'sub': 'maps'},
-        {'q': 'What country is known as the Land of the Rising Sun?', 'a': 'Japan', 'options': ['Japan', 'China', 'South Korea', 'Thailand'], 'sub': 'countries'},
-        {'q': 'What is the largest country by land area?', 'a': 'Russia', 'options': ['Russia', 'Canada', 'China', 'USA'], 'sub': 'countries'},
-        {'q': 'What is the capital of Japan?', 'a': 'Tokyo', 'options': ['Tokyo', 'Kyoto', 'Osaka', 'Yokohama'], 'sub': 'capitals'},
-        {'q': 'Which continent has the most countries?', 'a': 'Africa', 'options': ['Africa', 'Europe', 'Asia', 'South America'], 'sub': 'continents'},
-        {'q': 'What river flows through Paris?', 'a': 'Seine', 'options': ['Seine', 'Thames', 'Rhine', 'Danube'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Canada?', 'a': 'Ottawa', 'options': ['Ottawa', 'Toronto', 'Vancouver', 'Montreal'], 'sub': 'capitals'},
-        {'q': 'What is the tallest mountain in the world?', 'a': 'Mount Everest', 'options': ['Mount Everest', 'K2', 'Kangchenjunga', 'Mont Blanc'], 'sub': 'landmarks'},
-        {'q': 'Which country has the most time zones?', 'a': 'France', 'options': ['France', 'Russia', 'USA', 'China'], 'sub': 'countries'},
-        {'q': 'What is the capital of Germany?', 'a': 'Berlin', 'options': ['Berlin', 'Munich', 'Hamburg', 'Frankfurt'], 'sub': 'capitals'},
-        {'q': 'What is the largest island in the world?', 'a': 'Greenland', 'options': ['Greenland', 'Madagascar', 'Borneo', 'New Guinea'], 'sub': 'maps'},
-        {'q': 'Which African country has Cairo as its capital?', 'a': 'Egypt', 'options': ['Egypt', 'Sudan', 'Libya', 'Morocco'], 'sub': 'capitals'},
-        {'q': 'What mountain range separates Europe from Asia?', 'a': 'Ural Mountains', 'options': ['Ural Mountains', 'Alps', 'Himalayas', 'Caucasus'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Italy?', 'a': 'Rome', 'options': ['Rome', 'Milan', 'Venice', 'Florence'], 'sub': 'capitals'},
-        {'q': 'Which country is home to the Great Barrier Reef?', 'a': 'Australia', 'options': ['Australia', 'Indonesia', 'Philippines', 'Fiji'], 'sub': 'landmarks'},
-        {'q': 'What is the driest continent on Earth?', 'a': 'Antarctica', 'options': ['Antarctica', 'Africa', 'Australia', 'Asia'], 'sub': 'continents'},
-        {'q': 'What is the capital of Spain?', 'a': 'Madrid', 'options': ['Madrid', 'Barcelona', 'Seville', 'Valencia'], 'sub': 'capitals'},
-        {'q': 'Which strait connects the Mediterranean Sea to the Atlantic Ocean?', 'a': 'Strait of Gibraltar', 'options': ['Strait of Gibraltar', 'Strait of Hormuz', 'Bosphorus', 'Suez Canal'], 'sub': 'maps'},
-        {'q': 'What country has the longest coastline?', 'a': 'Canada', 'options': ['Canada', 'Australia', 'Russia', 'Indonesia'], 'sub': 'countries'},
-        {'q': 'What is the capital of South Korea?', 'a': 'Seoul', 'options': ['Seoul', 'Busan', 'Incheon', 'Pyongyang'], 'sub': 'capitals'},
-        {'q': 'On which continent would you find the Amazon River?', 'a': 'South America', 'options': ['South America', 'Africa', 'Asia', 'Australia'], 'sub': 'maps'},
-        {'q': 'Which country is completely surrounded by South Africa?', 'a': 'Lesotho', 'options': ['Lesotho', 'Swaziland', 'Botswana', 'Zimbabwe'], 'sub': 'countries'},
-        {'q': 'What is the capital of Argentina?', 'a': 'Buenos Aires', 'options': ['Buenos Aires', 'Córdoba', 'Rosario', 'Mendoza'], 'sub': 'capitals'},
-        {'q': 'What ocean lies between Africa and Australia?', 'a': 'Indian Ocean', 'options': ['Indian Ocean', 'Pacific Ocean', 'Atlantic Ocean', 'Southern Ocean'], 'sub': 'maps'},
-        {'q': 'What is the smallest US state by area?', 'a': 'Rhode Island', 'options': ['Rhode Island', 'Delaware', 'Connecticut', 'New Jersey'], 'sub': 'countries'},
-        {'q': 'What is the capital of Egypt?', 'a': 'Cairo', 'options': ['Cairo', 'Alexandria', 'Giza', 'Luxor'], 'sub': 'capitals'},
-        {'q': 'Which European country has the most UNESCO World Heritage Sites?', 'a': 'Italy', 'options': ['Italy', 'Spain', 'France', 'Germany'], 'sub': 'countries'},
-        {'q': 'What is the longest mountain range in the world?', 'a': 'Andes', 'options': ['Andes', 'Rocky Mountains', 'Himalayas', 'Alps'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Turkey?', 'a': 'Ankara', 'options': ['Ankara', 'Istanbul', 'Izmir', 'Antalya'], 'sub': 'capitals'},
-        {'q': 'What sea is bordered by Europe to the north and Africa to the south?', 'a': 'Mediterranean Sea', 'options': ['Mediterranean Sea', 'Red Sea', 'Black Sea', 'Caspian Sea'], 'sub': 'maps'},
-        {'q': 'What country has the most islands?', 'a': 'Sweden', 'options': ['Sweden', 'Finland', 'Indonesia', 'Philippines'], 'sub': 'countries'},
-        {'q': 'What is the capital of India?', 'a': 'New Delhi', 'options': ['New Delhi', 'Mumbai', 'Kolkata', 'Chennai'], 'sub': 'capitals'},
-        {'q': 'What is the deepest ocean trench?', 'a': 'Mariana Trench', 'options': ['Mariana Trench', 'Puerto Rico Trench', 'Java Trench', 'Philippine Trench'], 'sub': 'landmarks'},
-        {'q': 'Which two countries share the longest border?', 'a': 'Canada and USA', 'options': ['Canada and USA', 'Russia and China', 'Argentina and Chile', 'India and China'], 'sub': 'countries'},
-        {'q': 'What is the capital of Russia?', 'a': 'Moscow', 'options': ['Moscow', 'St. Petersburg', 'Novosibirsk', 'Yekaterinburg'], 'sub': 'capitals'},
-        {'q': 'What is the largest desert in the world?', 'a': 'Antarctic Desert', 'options': ['Antarctic Desert', 'Sahara', 'Arabian', 'Gobi'], 'sub': 'landmarks'},
-        {'q': 'Which country is known as the "Land of Fire and Ice"?', 'a': 'Iceland', 'options': ['Iceland', 'Norway', 'Greenland', 'Finland'], 'sub': 'countries'},
-        {'q': 'What is the capital of China?', 'a': 'Beijing', 'options': ['Beijing', 'Shanghai', 'Hong Kong', 'Guangzhou'], 'sub': 'capitals'},
-        {'q': 'What river runs through London?', 'a': 'Thames', 'options': ['Thames', 'Seine', 'Danube', 'Rhine'], 'sub': 'landmarks'},
-        {'q': 'How many continents are there?', 'a': '7', 'options': ['7', '6', '5', '8'], 'sub': 'continents'},
-        {'q': 'What is the capital of Mexico?', 'a': 'Mexico City', 'options': ['Mexico City', 'Guadalajara', 'Cancún', 'Monterrey'], 'sub': 'capitals'},
-        {'q': 'Which country has the most active volcanoes?', 'a': 'Indonesia', 'options': ['Indonesia', 'Japan', 'USA', 'Philippines'], 'sub': 'countries'},
-    ]
-}
+def _reload_question_bank_in_background():
+    global _question_bank_reloading
+    try:
+        reload_question_bank()
+    except Exception as e:
+        print(f"Question bank reload failed, keeping the current bank: {e}")
+    finally:
+        _question_bank_reloading = False
 
-# Hard mode questions - more challenging for experienced players
-HARD_QUESTIONS = {
-    'news': [
-        {'q': 'Which country withdrew from the International Criminal Court in 2023 citing bias?', 'a': 'Russia', 'options': ['Russia', 'China', 'Israel', 'Turkey'], 'sub': 'world_affairs'},
-        {'q': 'What percentage of global GDP does the G7 represent approximately?', 'a': '45%', 'options': ['45%', '30%', '60%', '75%'], 'sub': 'world_affairs'},
-        {'q': 'Which tech company faced a landmark antitrust ruling in 2024 over app store practices?', 'a': 'Apple', 'options': ['Apple', 'Google', 'Amazon', 'Meta'], 'sub': 'current_events'},
-        {'q': 'What was the inflation rate peak in the US during 2022?', 'a': '9.1%', 'options': ['9.1%', '7.5%', '11.2%', '6.8%'], 'sub': 'current_events'},
-        {'q': 'Which African nation joined BRICS in 2024?', 'a': 'Ethiopia', 'options': ['Ethiopia', 'Nigeria', 'Kenya', 'Ghana'], 'sub': 'world_affairs'},
-        {'q': 'Who became the first female president of the European Central Bank?', 'a': 'Christine Lagarde', 'options': ['Christine Lagarde', 'Janet Yellen', 'Ursula von der Leyen', 'Kristalina Georgieva'], 'sub': 'politics'},
-        {'q': 'What cryptocurrency exchange collapsed in November 2022?', 'a': 'FTX', 'options': ['FTX', 'Celsius', 'BlockFi', 'Voyager'], 'sub': 'current_events'},
-        {'q': 'Which country has the highest nominal GDP per capita as of 2024?', 'a': 'Luxembourg', 'options': ['Luxembourg', 'Switzerland', 'Norway', 'Singapore'], 'sub': 'world_affairs'},
-        {'q': 'What is the name of the US legislation that allocated $280B for semiconductor manufacturing?', 'a': 'CHIPS Act', 'options': ['CHIPS Act', 'Build Back Better', 'Infrastructure Act', 'Tech America Act'], 'sub': 'politics'},
-        {'q': 'Which social media platform reached 100 million users fastest in history?', 'a': 'Threads', 'options': ['Threads', 'ChatGPT', 'TikTok', 'Instagram'], 'sub': 'current_events'},
-        {'q': 'What is the name of the EU\'s comprehensive AI regulation passed in 2024?', 'a': 'AI Act', 'options': ['AI Act', 'Digital Services Act', 'GDPR 2.0', 'Tech Regulation Act'], 'sub': 'politics'},
-        {'q': 'Which country\'s currency lost over 80% of its value in 2023?', 'a': 'Argentina', 'options': ['Argentina', 'Turkey', 'Venezuela', 'Lebanon'], 'sub': 'world_affairs'},
-        {'q': 'What was the name of the cargo ship that collapsed the Francis Scott Key Bridge?', 'a': 'Dali', 'options': ['Dali', 'Ever Given', 'Ever Forward', 'Maersk Alabama'], 'sub': 'current_events'},
-        {'q': 'Which country became NATO\'s 31st member in 2023?', 'a': 'Finland', 'options': ['Finland', 'Sweden', 'Ukraine', 'Georgia'], 'sub': 'world_affairs'},
-        {'q': 'What is the Federal Reserve\'s target inflation rate?', 'a': '2%', 'options': ['2%', '3%', '1%', '4%'], 'sub': 'current_events'},
-        {'q': 'Who is the CEO of OpenAI as of 2024?', 'a': 'Sam Altman', 'options': ['Sam Altman', 'Elon Musk', 'Satya Nadella', 'Dario Amodei'], 'sub': 'current_events'},
-        {'q': 'What percentage of the world\'s population uses the internet?', 'a': '~65%', 'options': ['~65%', '~45%', '~80%', '~90%'], 'sub': 'current_events'},
-        {'q': 'Which country has the world\'s largest sovereign wealth fund?', 'a': 'Norway', 'options': ['Norway', 'UAE', 'Saudi Arabia', 'China'], 'sub': 'world_affairs'},
-        {'q': 'What is the name of China\'s Belt and Road Initiative\'s main financing bank?', 'a': 'AIIB', 'options': ['AIIB', 'World Bank', 'IMF', 'ADB'], 'sub': 'world_affairs'},
-        {'q': 'What was the largest corporate bankruptcy in US history by assets?', 'a': 'Lehman Brothers', 'options': ['Lehman Brothers', 'Enron', 'WorldCom', 'Washington Mutual'], 'sub': 'current_events'},
-        {'q': 'What is the unemployment rate threshold the Fed considers "full employment"?', 'a': '4-5%', 'options': ['4-5%', '2-3%', '6-7%', '0-1%'], 'sub': 'current_events'},
-        {'q': 'Which former Soviet state experienced a military coup attempt in 2023?', 'a': 'Russia', 'options': ['Russia', 'Belarus', 'Kazakhstan', 'Armenia'], 'sub': 'world_affairs'},
-        {'q': 'What is the name of the leader of Wagner Group who led that coup attempt?', 'a': 'Yevgeny Prigozhin', 'options': ['Yevgeny Prigozhin', 'Sergei Shoigu', 'Ramzan Kadyrov', 'Alexander Lukashenko'], 'sub': 'world_affairs'},
-        {'q': 'Which tech company laid off the highest percentage of workers in 2023?', 'a': 'Meta', 'options': ['Meta', 'Google', 'Amazon', 'Microsoft'], 'sub': 'current_events'},
-        {'q': 'What is the current US national debt approximately?', 'a': '$34 trillion', 'options': ['$34 trillion', '$20 trillion', '$50 trillion', '$15 trillion'], 'sub': 'politics'},
-        {'q': 'Which Middle Eastern country normalized relations with Israel in 2020 via the Abraham Accords?', 'a': 'UAE', 'options': ['UAE', 'Saudi Arabia', 'Qatar', 'Kuwait'], 'sub': 'world_affairs'},
-        {'q': 'What was the name of the SVB executive who sold stock before the bank\'s collapse?', 'a': 'Greg Becker', 'options': ['Greg Becker', 'Jamie Dimon', 'Lloyd Blankfein', 'Brian Moynihan'], 'sub': 'current_events'},
-        {'q': 'Which European country elected its first far-right government since WWII in 2022?', 'a': 'Italy', 'options': ['Italy', 'France', 'Germany', 'Spain'], 'sub': 'politics'},
-        {'q': 'What is the name of the Chinese spy balloon shot down over the US in 2023?', 'a': 'No official name given', 'options': ['No official name given', 'Dragon Eye', 'Sky Watch', 'Wind Rider'], 'sub': 'current_events'},
-        {'q': 'Which central bank was first to cut interest rates in 2024 among major economies?', 'a': 'Swiss National Bank', 'options': ['Swiss National Bank', 'Federal Reserve', 'ECB', 'Bank of England'], 'sub': 'world_affairs'},
-        {'q': 'What percentage of global CO2 emissions does China produce?', 'a': '~30%', 'options': ['~30%', '~15%', '~45%', '~50%'], 'sub': 'world_affairs'},
-        {'q': 'Which streaming service had the most subscribers globally in 2024?', 'a': 'Netflix', 'options': ['Netflix', 'Amazon Prime', 'Disney+', 'YouTube Premium'], 'sub': 'current_events'},
-        {'q': 'What was the name of the Russian opposition leader who died in prison in 2024?', 'a': 'Alexei Navalny', 'options': ['Alexei Navalny', 'Boris Nemtsov', 'Mikhail Khodorkovsky', 'Gary Kasparov'], 'sub': 'world_affairs'},
-        {'q': 'Which country produces the most lithium globally?', 'a': 'Australia', 'options': ['Australia', 'Chile', 'China', 'Argentina'], 'sub': 'world_affairs'},
-        {'q': 'What is the name of Apple\'s mixed reality headset?', 'a': 'Vision Pro', 'options': ['Vision Pro', 'Apple Glass', 'iVision', 'Reality One'], 'sub': 'current_events'},
-        {'q': 'Which country has the fastest 5G speeds on average?', 'a': 'South Korea', 'options': ['South Korea', 'USA', 'China', 'Japan'], 'sub': 'current_events'},
-        {'q': 'What percentage of US electricity comes from renewable sources?', 'a': '~22%', 'options': ['~22%', '~10%', '~35%', '~50%'], 'sub': 'current_events'},
-        {'q': 'Which billionaire lost the most wealth in 2022?', 'a': 'Elon Musk', 'options': ['Elon Musk', 'Mark Zuckerberg', 'Jeff Bezos', 'Bernard Arnault'], 'sub': 'current_events'},
-        {'q': 'What is the name of the EU\'s digital markets regulation targeting big tech?', 'a': 'Digital Markets Act', 'options': ['Digital Markets Act', 'Tech Antitrust Act', 'Platform Regulation', 'Digital Services Act'], 'sub': 'politics'},
-        {'q': 'Which Asian country had the highest GDP growth in 2023?', 'a': 'India', 'options': ['India', 'China', 'Vietnam', 'Indonesia'], 'sub': 'world_affairs'},
-        {'q': 'What is the current population of Earth approximately?', 'a': '8 billion', 'options': ['8 billion', '7 billion', '9 billion', '6 billion'], 'sub': 'world_affairs'},
-        {'q': 'Which country is building the largest offshore wind farm?', 'a': 'United Kingdom', 'options': ['United Kingdom', 'Denmark', 'Germany', 'China'], 'sub': 'current_events'},
-        {'q': 'What percentage of global oil production does OPEC control?', 'a': '~40%', 'options': ['~40%', '~60%', '~25%', '~80%'], 'sub': 'world_affairs'},
-        {'q': 'Which tech company\'s stock rose the most in 2023?', 'a': 'Nvidia', 'options': ['Nvidia', 'Apple', 'Microsoft', 'Tesla'], 'sub': 'current_events'},
-        {'q': 'What is the name of the largest AI language model released by Google?', 'a': 'Gemini', 'options': ['Gemini', 'Bard', 'PaLM', 'Lambda'], 'sub': 'current_events'},
-        {'q': 'Which European country generates the highest percentage of electricity from nuclear?', 'a': 'France', 'options': ['France', 'Sweden', 'Finland', 'Belgium'], 'sub': 'world_affairs'},
-        {'q': 'What was the peak price of Bitcoin in 2021?', 'a': '~$69,000', 'options': ['~$69,000', '~$50,000', '~$100,000', '~$40,000'], 'sub': 'current_events'},
-        {'q': 'Which country has the most billionaires per capita?', 'a': 'Monaco', 'options': ['Monaco', 'Switzerland', 'USA', 'Singapore'], 'sub': 'world_affairs'},
-        {'q': 'What is the name of Saudi Arabia\'s planned $500B megacity?', 'a': 'NEOM', 'options': ['NEOM', 'The Line', 'Vision City', 'Future Arabia'], 'sub': 'world_affairs'},
-    ],
-    'history': [
-        {'q': 'The Treaty of Westphalia in 1648 established what key concept in international relations?', 'a': 'National sovereignty', 'options': ['National sovereignty', 'Free trade', 'Human rights', 'Colonial boundaries'], 'sub': 'world_history'},
-        {'q': 'Which empire was ruled by Suleiman the Magnificent?', 'a': 'Ottoman Empire', 'options': ['Ottoman Empire', 'Mughal Empire', 'Persian Empire', 'Byzantine Empire'], 'sub': 'medieval'},
-        {'q': 'The Zimmermann Telegram, which helped bring the US into WWI, proposed an alliance with which country?', 'a': 'Mexico', 'options': ['Mexico', 'Japan', 'Spain', 'Brazil'], 'sub': 'wars'},
-        {'q': 'The Magna Carta was signed in which year?', 'a': '1215', 'options': ['1215', '1066', '1348', '1453'], 'sub': 'medieval'},
-        {'q': 'Which ancient civilization developed the concept of zero as a number?', 'a': 'Maya', 'options': ['Maya', 'Romans', 'Greeks', 'Egyptians'], 'sub': 'ancient'},
-        {'q': 'The Hundred Years\' War was fought primarily between which two countries?', 'a': 'England and France', 'options': ['England and France', 'Spain and Portugal', 'Germany and Italy', 'Austria and Prussia'], 'sub': 'wars'},
-        {'q': 'Which US president established the National Park Service?', 'a': 'Woodrow Wilson', 'options': ['Woodrow Wilson', 'Theodore Roosevelt', 'William Taft', 'Calvin Coolidge'], 'sub': 'presidents'},
-        {'q': 'The Partition of India in 1947 created which two nations?', 'a': 'India and Pakistan', 'options': ['India and Pakistan', 'India and Bangladesh', 'India and Sri Lanka', 'India and Myanmar'], 'sub': 'modern'},
-        {'q': 'What year was the Battle of Hastings?', 'a': '1066', 'options': ['1066', '1215', '1415', '1346'], 'sub': 'medieval'},
-        {'q': 'Who was the first Holy Roman Emperor?', 'a': 'Charlemagne', 'options': ['Charlemagne', 'Otto I', 'Frederick I', 'Charles V'], 'sub': 'medieval'},
-        {'q': 'The Thirty Years\' War primarily devastated which region?', 'a': 'Central Europe (Germany)', 'options': ['Central Europe (Germany)', 'France', 'England', 'Spain'], 'sub': 'wars'},
-        {'q': 'What was the code name for the D-Day invasion?', 'a': 'Operation Overlord', 'options': ['Operation Overlord', 'Operation Torch', 'Operation Market Garden', 'Operation Barbarossa'], 'sub': 'wars'},
-        {'q': 'Which US president purchased Louisiana from France?', 'a': 'Thomas Jefferson', 'options': ['Thomas Jefferson', 'James Madison', 'James Monroe', 'John Adams'], 'sub': 'presidents'},
-        {'q': 'The Boxer Rebellion occurred in which country?', 'a': 'China', 'options': ['China', 'Japan', 'Korea', 'Philippines'], 'sub': 'world_history'},
-        {'q': 'What year did Constantinople fall to the Ottoman Turks?', 'a': '1453', 'options': ['1453', '1389', '1492', '1517'], 'sub': 'medieval'},
-        {'q': 'Who was the last Tsar of Russia?', 'a': 'Nicholas II', 'options': ['Nicholas II', 'Alexander III', 'Nicholas I', 'Alexander II'], 'sub': 'modern'},
-        {'q': 'The Meiji Restoration occurred in which country?', 'a': 'Japan', 'options': ['Japan', 'China', 'Korea', 'Vietnam'], 'sub': 'world_history'},
-        {'q': 'What treaty ended World War I?', 'a': 'Treaty of Versailles', 'options': ['Treaty of Versailles', 'Treaty of Paris', 'Treaty of Ghent', 'Treaty of Westphalia'], 'sub': 'wars'},
-        {'q': 'Which pharaoh built the Great Pyramid of Giza?', 'a': 'Khufu', 'options': ['Khufu', 'Tutankhamun', 'Ramesses II', 'Cleopatra'], 'sub': 'ancient'},
-        {'q': 'The Opium Wars were fought between China and which country?', 'a': 'Britain', 'options': ['Britain', 'France', 'USA', 'Japan'], 'sub': 'world_history'},
-        {'q': 'Who was the first woman to win a Nobel Prize twice?', 'a': 'Marie Curie', 'options': ['Marie Curie', 'Irene Joliot-Curie', 'Dorothy Hodgkin', 'Ada Lovelace'], 'sub': 'modern'},
-        {'q': 'What was the name of the US policy to contain Soviet expansion?', 'a': 'Containment', 'options': ['Containment', 'Domino Theory', 'Marshall Plan', 'Truman Doctrine'], 'sub': 'modern'},
-        {'q': 'The Peloponnesian War was fought between Athens and which city-state?', 'a': 'Sparta', 'options': ['Sparta', 'Corinth', 'Thebes', 'Macedonia'], 'sub': 'ancient'},
-        {'q': 'Which US president signed the Civil Rights Act of 1964?', 'a': 'Lyndon B. Johnson', 'options': ['Lyndon B. Johnson', 'John F. Kennedy', 'Dwight Eisenhower', 'Richard Nixon'], 'sub': 'presidents'},
-        {'q': 'The Haitian Revolution was the only successful slave revolt that led to what?', 'a': 'An independent nation', 'options': ['An independent nation', 'A new colony', 'A civil war', 'A territory'], 'sub': 'world_history'},
-        {'q': 'Who was the British monarch during the American Revolution?', 'a': 'George III', 'options': ['George III', 'George II', 'George IV', 'William IV'], 'sub': 'world_history'},
-        {'q': 'The Khmer Rouge ruled which country?', 'a': 'Cambodia', 'options': ['Cambodia', 'Vietnam', 'Laos', 'Thailand'], 'sub': 'modern'},
-        {'q': 'What was the name of the ship that brought the first enslaved Africans to English North America?', 'a': 'White Lion', 'options': ['White Lion', 'Mayflower', 'San Juan Bautista', 'Amistad'], 'sub': 'world_history'},
-        {'q': 'The War of the Roses was a civil war in which country?', 'a': 'England', 'options': ['England', 'France', 'Spain', 'Germany'], 'sub': 'medieval'},
-        {'q': 'Who was the first US president to be assassinated?', 'a': 'Abraham Lincoln', 'options': ['Abraham Lincoln', 'James Garfield', 'William McKinley', 'John F. Kennedy'], 'sub': 'presidents'},
-        {'q': 'The Suez Crisis of 1956 involved which three countries attacking Egypt?', 'a': 'Britain, France, Israel', 'options': ['Britain, France, Israel', 'USA, Britain, France', 'USSR, Egypt, Syria', 'Britain, USA, Israel'], 'sub': 'modern'},
-        {'q': 'What ancient wonder was located in Babylon?', 'a': 'Hanging Gardens', 'options': ['Hanging Gardens', 'Lighthouse', 'Colossus', 'Mausoleum'], 'sub': 'ancient'},
-        {'q': 'The Scramble for Africa occurred primarily in which century?', 'a': '19th century', 'options': ['19th century', '18th century', '20th century', '17th century'], 'sub': 'world_history'},
-        {'q': 'Who was the youngest US president at inauguration?', 'a': 'Theodore Roosevelt', 'options': ['Theodore Roosevelt', 'John F. Kennedy', 'Bill Clinton', 'Barack Obama'], 'sub': 'presidents'},
-        {'q': 'The Treaty of Tordesillas divided the New World between which two countries?', 'a': 'Spain and Portugal', 'options': ['Spain and Portugal', 'England and France', 'Spain and England', 'Portugal and Netherlands'], 'sub': 'world_history'},
-        {'q': 'What was the primary religion of the Byzantine Empire?', 'a': 'Eastern Orthodox Christianity', 'options': ['Eastern Orthodox Christianity', 'Roman Catholicism', 'Islam', 'Judaism'], 'sub': 'medieval'},
-        {'q': 'The Long March was a military retreat by which group?', 'a': 'Chinese Communist Party', 'options': ['Chinese Communist Party', 'Kuomintang', 'Japanese Army', 'Viet Cong'], 'sub': 'modern'},
-        {'q': 'Who was the US president during the War of 1812?', 'a': 'James Madison', 'options': ['James Madison', 'Thomas Jefferson', 'James Monroe', 'John Adams'], 'sub': 'presidents'},
-        {'q': 'The Reconquista was the Christian reconquest of which peninsula?', 'a': 'Iberian Peninsula', 'options': ['Iberian Peninsula', 'Italian Peninsula', 'Balkan Peninsula', 'Scandinavian Peninsula'], 'sub': 'medieval'},
-        {'q': 'What year did the United States enter World War I?', 'a': '1917', 'options': ['1917', '1914', '1915', '1916'], 'sub': 'wars'},
-        {'q': 'The Sepoy Mutiny of 1857 occurred in which country?', 'a': 'India', 'options': ['India', 'China', 'Egypt', 'South Africa'], 'sub': 'world_history'},
-        {'q': 'The Bay of Pigs invasion was an attempt to overthrow which leader?', 'a': 'Fidel Castro', 'options': ['Fidel Castro', 'Che Guevara', 'Hugo Chavez', 'Daniel Ortega'], 'sub': 'modern'},
-        {'q': 'What was the name of the first permanent English settlement in America?', 'a': 'Jamestown', 'options': ['Jamestown', 'Plymouth', 'Roanoke', 'Boston'], 'sub': 'world_history'},
-        {'q': 'The Russo-Japanese War ended with what treaty?', 'a': 'Treaty of Portsmouth', 'options': ['Treaty of Portsmouth', 'Treaty of Shimonoseki', 'Treaty of Kanagawa', 'Treaty of Versailles'], 'sub': 'wars'},
-        {'q': 'Who was the first US president to resign from office?', 'a': 'Richard Nixon', 'options': ['Richard Nixon', 'Andrew Johnson', 'Bill Clinton', 'Donald Trump'], 'sub': 'presidents'},
-        {'q': 'The Dreyfus Affair was a political scandal in which country?', 'a': 'France', 'options': ['France', 'Germany', 'Britain', 'Russia'], 'sub': 'modern'},
-        {'q': 'What was the primary cause of the Taiping Rebellion?', 'a': 'Religious and political reform', 'options': ['Religious and political reform', 'Foreign invasion', 'Famine', 'Tax revolt'], 'sub': 'world_history'},
-        {'q': 'The Nuremberg Trials prosecuted leaders of which regime?', 'a': 'Nazi Germany', 'options': ['Nazi Germany', 'Imperial Japan', 'Fascist Italy', 'Soviet Union'], 'sub': 'wars'},
-        {'q': 'Who is credited as the first computer programmer?', 'a': 'Ada Lovelace', 'options': ['Ada Lovelace', 'Charles Babbage', 'Alan Turing', 'Grace Hopper'], 'sub': 'modern'},
-        {'q': 'What was the first country to grant women the right to vote?', 'a': 'New Zealand', 'options': ['New Zealand', 'United States', 'United Kingdom', 'Australia'], 'sub': 'modern'},
-    ],
-    'science': [
-        {'q': 'What is the half-life of Carbon-14, used in radiocarbon dating?', 'a': '5,730 years', 'options': ['5,730 years', '1,200 years', '12,000 years', '50,000 years'], 'sub': 'chemistry'},
-        {'q': 'Which planet has the strongest magnetic field in our solar system?', 'a': 'Jupiter', 'options': ['Jupiter', 'Earth', 'Saturn', 'Neptune'], 'sub': 'space'},
-        {'q': 'What is the name of the process by which cells divide to produce gametes?', 'a': 'Meiosis', 'options': ['Meiosis', 'Mitosis', 'Binary fission', 'Cytokinesis'], 'sub': 'biology'},
-        {'q': 'What is the Chandrasekhar limit approximately equal to?', 'a': '1.4 solar masses', 'options': ['1.4 solar masses', '3.0 solar masses', '0.5 solar masses', '10 solar masses'], 'sub': 'space'},
-        {'q': 'Which element has the highest electronegativity?', 'a': 'Fluorine', 'options': ['Fluorine', 'Oxygen', 'Chlorine', 'Nitrogen'], 'sub': 'chemistry'},
-        {'q': 'What type of bond holds the two strands of DNA together?', 'a': 'Hydrogen bonds', 'options': ['Hydrogen bonds', 'Covalent bonds', 'Ionic bonds', 'Metallic bonds'], 'sub': 'biology'},
-        {'q': 'What is the term for the bending of light as it passes through different media?', 'a': 'Refraction', 'options': ['Refraction', 'Reflection', 'Diffraction', 'Dispersion'], 'sub': 'physics'},
-        {'q': 'Which layer of Earth\'s atmosphere contains the ozone layer?', 'a': 'Stratosphere', 'options': ['Stratosphere', 'Troposphere', 'Mesosphere', 'Thermosphere'], 'sub': 'earth_science'},
-        {'q': 'What particle is exchanged in the strong nuclear force?', 'a': 'Gluon', 'options': ['Gluon', 'Photon', 'W boson', 'Graviton'], 'sub': 'physics'},
-        {'q': 'What is the approximate age of the Earth?', 'a': '4.5 billion years', 'options': ['4.5 billion years', '6,000 years', '1 billion years', '10 billion years'], 'sub': 'earth_science'},
-        {'q': 'What is the Heisenberg Uncertainty Principle about?', 'a': 'Position and momentum measurement limits', 'options': ['Position and momentum measurement limits', 'Speed of light', 'Atomic decay', 'Wave-particle duality'], 'sub': 'physics'},
-        {'q': 'Which organelle is responsible for protein synthesis?', 'a': 'Ribosome', 'options': ['Ribosome', 'Mitochondria', 'Golgi apparatus', 'Lysosome'], 'sub': 'biology'},
-        {'q': 'What is the Schwarzschild radius related to?', 'a': 'Black holes', 'options': ['Black holes', 'Neutron stars', 'White dwarfs', 'Pulsars'], 'sub': 'space'},
-        {'q': 'What is the most abundant protein in the human body?', 'a': 'Collagen', 'options': ['Collagen', 'Hemoglobin', 'Keratin', 'Actin'], 'sub': 'biology'},
-        {'q': 'What is Avogadro\'s number approximately?', 'a': '6.02 x 10^23', 'options': ['6.02 x 10^23', '3.14 x 10^23', '9.8 x 10^23', '1.6 x 10^23'], 'sub': 'chemistry'},
-        {'q': 'Which planet has the Great Red Spot?', 'a': 'Jupiter', 'options': ['Jupiter', 'Saturn', 'Neptune', 'Mars'], 'sub': 'space'},
-        {'q': 'What is the process called when a solid turns directly into a gas?', 'a': 'Sublimation', 'options': ['Sublimation', 'Evaporation', 'Condensation', 'Deposition'], 'sub': 'chemistry'},
-        {'q': 'What type of wave is sound?', 'a': 'Longitudinal', 'options': ['Longitudinal', 'Transverse', 'Electromagnetic', 'Surface'], 'sub': 'physics'},
-        {'q': 'What is the main component of natural gas?', 'a': 'Methane', 'options': ['Methane', 'Propane', 'Butane', 'Ethane'], 'sub': 'chemistry'},
-        {'q': 'Which blood type is the universal recipient?', 'a': 'AB positive', 'options': ['AB positive', 'O negative', 'A positive', 'B negative'], 'sub': 'biology'},
-        {'q': 'What is the escape velocity from Earth?', 'a': '11.2 km/s', 'options': ['11.2 km/s', '7.9 km/s', '15.0 km/s', '25.0 km/s'], 'sub': 'space'},
-        {'q': 'What is the name of the effect where light changes wavelength due to motion?', 'a': 'Doppler effect', 'options': ['Doppler effect', 'Photoelectric effect', 'Compton effect', 'Zeeman effect'], 'sub': 'physics'},
-        {'q': 'Which element has the atomic number 79?', 'a': 'Gold', 'options': ['Gold', 'Silver', 'Platinum', 'Mercury'], 'sub': 'chemistry'},
-        {'q': 'What is the name of the closest star to our solar system?', 'a': 'Proxima Centauri', 'options': ['Proxima Centauri', 'Alpha Centauri A', 'Sirius', 'Barnard\'s Star'], 'sub': 'space'},
-        {'q': 'What is the SI unit of electrical resistance?', 'a': 'Ohm', 'options': ['Ohm', 'Volt', 'Ampere', 'Watt'], 'sub': 'physics'},
-        {'q': 'Which vitamin is synthesized by gut bacteria?', 'a': 'Vitamin K', 'options': ['Vitamin K', 'Vitamin C', 'Vitamin A', 'Vitamin E'], 'sub': 'biology'},
-        {'q': 'What is the most reactive group of elements?', 'a': 'Alkali metals', 'options': ['Alkali metals', 'Halogens', 'Noble gases', 'Transition metals'], 'sub': 'chemistry'},
-        {'q': 'What type of rock is marble?', 'a': 'Metamorphic', 'options': ['Metamorphic', 'Igneous', 'Sedimentary', 'Volcanic'], 'sub': 'earth_science'},
-        {'q': 'What is the name of the boundary between Earth\'s crust and mantle?', 'a': 'Mohorovičić discontinuity', 'options': ['Mohorovičić discontinuity', 'Gutenberg discontinuity', 'Lehmann discontinuity', 'Conrad discontinuity'], 'sub': 'earth_science'},
-        {'q': 'Which particle has no electric charge?', 'a': 'Neutron', 'options': ['Neutron', 'Proton', 'Electron', 'Positron'], 'sub': 'physics'},
-        {'q': 'What is the name of the sugar found in DNA?', 'a': 'Deoxyribose', 'options': ['Deoxyribose', 'Ribose', 'Glucose', 'Fructose'], 'sub': 'biology'},
-        {'q': 'What phenomenon explains why the sky is blue?', 'a': 'Rayleigh scattering', 'options': ['Rayleigh scattering', 'Mie scattering', 'Raman scattering', 'Tyndall effect'], 'sub': 'physics'},
-        {'q': 'What is the critical temperature of water?', 'a': '374°C', 'options': ['374°C', '100°C', '212°C', '500°C'], 'sub': 'chemistry'},
-        {'q': 'Which moon of Saturn has a thick atmosphere?', 'a': 'Titan', 'options': ['Titan', 'Enceladus', 'Mimas', 'Rhea'], 'sub': 'space'},
-        {'q': 'What is the name of the process by which plants lose water through leaves?', 'a': 'Transpiration', 'options': ['Transpiration', 'Evaporation', 'Respiration', 'Perspiration'], 'sub': 'biology'},
-        {'q': 'What is Planck\'s constant used to calculate?', 'a': 'Energy of photons', 'options': ['Energy of photons', 'Mass of electrons', 'Speed of light', 'Gravitational force'], 'sub': 'physics'},
-        {'q': 'Which element is the best conductor of electricity?', 'a': 'Silver', 'options': ['Silver', 'Copper', 'Gold', 'Aluminum'], 'sub': 'chemistry'},
-        {'q': 'What is the name of the supercontinent that existed 335 million years ago?', 'a': 'Pangaea', 'options': ['Pangaea', 'Gondwana', 'Laurasia', 'Rodinia'], 'sub': 'earth_science'},
-        {'q': 'What is the function of telomerase?', 'a': 'Extends telomeres during cell division', 'options': ['Extends telomeres during cell division', 'Repairs DNA damage', 'Synthesizes proteins', 'Transports RNA'], 'sub': 'biology'},
-        {'q': 'What is the name of the effect where electrons are emitted from a surface when light hits it?', 'a': 'Photoelectric effect', 'options': ['Photoelectric effect', 'Compton effect', 'Doppler effect', 'Hall effect'], 'sub': 'physics'},
-        {'q': 'Which noble gas is used in neon signs?', 'a': 'Neon', 'options': ['Neon', 'Argon', 'Helium', 'Krypton'], 'sub': 'chemistry'},
-        {'q': 'What is the name of the Mars rover that landed in 2021?', 'a': 'Perseverance', 'options': ['Perseverance', 'Curiosity', 'Opportunity', 'Spirit'], 'sub': 'space'},
-        {'q': 'What is the name of the enzyme that unzips DNA?', 'a': 'Helicase', 'options': ['Helicase', 'Polymerase', 'Ligase', 'Primase'], 'sub': 'biology'},
-        {'q': 'What is the term for a material that does not conduct electricity?', 'a': 'Insulator', 'options': ['Insulator', 'Conductor', 'Semiconductor', 'Superconductor'], 'sub': 'physics'},
-        {'q': 'What is the name of the boundary where tectonic plates move apart?', 'a': 'Divergent boundary', 'options': ['Divergent boundary', 'Convergent boundary', 'Transform boundary', 'Subduction zone'], 'sub': 'earth_science'},
-        {'q': 'Which planet rotates backwards compared to most others?', 'a': 'Venus', 'options': ['Venus', 'Mercury', 'Uranus', 'Neptune'], 'sub': 'space'},
-        {'q': 'What is the name of the smallest unit of an element?', 'a': 'Atom', 'options': ['Atom', 'Molecule', 'Ion', 'Electron'], 'sub': 'chemistry'},
-        {'q': 'What percentage of the human brain is water?', 'a': '~75%', 'options': ['~75%', '~50%', '~90%', '~60%'], 'sub': 'biology'},
-        {'q': 'What is the only letter that does not appear on the periodic table?', 'a': 'J', 'options': ['J', 'Q', 'X', 'Z'], 'sub': 'chemistry'},
-        {'q': 'What metal has the highest melting point?', 'a': 'Tungsten', 'options': ['Tungsten', 'Iron', 'Titanium', 'Platinum'], 'sub': 'chemistry'},
-    ],
-    'entertainment': [
-        {'q': 'Which film holds the record for most Academy Award wins?', 'a': 'Ben-Hur, Titanic, and LOTR: ROTK', 'options': ['Ben-Hur, Titanic, and LOTR: ROTK', 'Gone with the Wind', 'West Side Story', 'The Godfather'], 'sub': 'movies'},
-        {'q': 'Who composed the opera "The Marriage of Figaro"?', 'a': 'Mozart', 'options': ['Mozart', 'Beethoven', 'Verdi', 'Wagner'], 'sub': 'music'},
-        {'q': 'Which TV series has won the most Emmy Awards overall?', 'a': 'Saturday Night Live', 'options': ['Saturday Night Live', 'Game of Thrones', 'The Simpsons', 'Frasier'], 'sub': 'tv'},
-        {'q': 'Who wrote "One Hundred Years of Solitude"?', 'a': 'Gabriel García Márquez', 'options': ['Gabriel García Márquez', 'Jorge Luis Borges', 'Pablo Neruda', 'Isabel Allende'], 'sub': 'literature'},
-        {'q': 'What band has sold the most albums worldwide?', 'a': 'The Beatles', 'options': ['The Beatles', 'Led Zeppelin', 'Pink Floyd', 'Eagles'], 'sub': 'music'},
-        {'q': 'Which director has the most Best Director Oscar nominations?', 'a': 'Martin Scorsese', 'options': ['Martin Scorsese', 'Steven Spielberg', 'William Wyler', 'John Ford'], 'sub': 'movies'},
-        {'q': 'What was the first music video played on MTV?', 'a': 'Video Killed the Radio Star', 'options': ['Video Killed the Radio Star', 'Thriller', 'Take On Me', 'Sweet Dreams'], 'sub': 'music'},
-        {'q': 'Which author has sold the most books of all time?', 'a': 'Agatha Christie', 'options': ['Agatha Christie', 'William Shakespeare', 'J.K. Rowling', 'Stephen King'], 'sub': 'literature'},
-        {'q': 'What streaming service produced "The Crown"?', 'a': 'Netflix', 'options': ['Netflix', 'Amazon Prime', 'HBO Max', 'Apple TV+'], 'sub': 'tv'},
-        {'q': 'Which album spent the most weeks at #1 on the Billboard 200?', 'a': 'Thriller', 'options': ['Thriller', '21', 'The Bodyguard Soundtrack', 'Purple Rain'], 'sub': 'music'},
-        {'q': 'Who directed "2001: A Space Odyssey"?', 'a': 'Stanley Kubrick', 'options': ['Stanley Kubrick', 'Steven Spielberg', 'Ridley Scott', 'George Lucas'], 'sub': 'movies'},
-        {'q': 'Which composer wrote "The Four Seasons"?', 'a': 'Vivaldi', 'options': ['Vivaldi', 'Bach', 'Mozart', 'Handel'], 'sub': 'music'},
-        {'q': 'What TV show has the most watched series finale?', 'a': 'M*A*S*H', 'options': ['M*A*S*H', 'Cheers', 'Seinfeld', 'Friends'], 'sub': 'tv'},
-        {'q': 'Who wrote "War and Peace"?', 'a': 'Leo Tolstoy', 'options': ['Leo Tolstoy', 'Fyodor Dostoevsky', 'Anton Chekhov', 'Ivan Turgenev'], 'sub': 'literature'},
-        {'q': 'Which film won the first Academy Award for Best Animated Feature?', 'a': 'Shrek', 'options': ['Shrek', 'Monsters, Inc.', 'Toy Story', 'Finding Nemo'], 'sub': 'movies'},
-        {'q': 'Who painted "Starry Night"?', 'a': 'Vincent van Gogh', 'options': ['Vincent van Gogh', 'Claude Monet', 'Pablo Picasso', 'Salvador Dalí'], 'sub': 'arts'},
-        {'q': 'Which band performed the longest concert in history?', 'a': 'The Flaming Lips', 'options': ['The Flaming Lips', 'Phish', 'Grateful Dead', 'Bruce Springsteen'], 'sub': 'music'},
-        {'q': 'Who created the TV series "The Twilight Zone"?', 'a': 'Rod Serling', 'options': ['Rod Serling', 'Steven Spielberg', 'Alfred Hitchcock', 'Gene Roddenberry'], 'sub': 'tv'},
-        {'q': 'Which novel begins with "Call me Ishmael"?', 'a': 'Moby-Dick', 'options': ['Moby-Dick', 'The Old Man and the Sea', 'Treasure Island', 'Robinson Crusoe'], 'sub': 'literature'},
-        {'q': 'What was Marilyn Monroe\'s birth name?', 'a': 'Norma Jeane Mortenson', 'options': ['Norma Jeane Mortenson', 'Mary Jane Baker', 'Patricia Anne Smith', 'Betty Jean Davis'], 'sub': 'movies'},
-        {'q': 'Which symphony is known as Beethoven\'s "Choral"?', 'a': 'Symphony No. 9', 'options': ['Symphony No. 9', 'Symphony No. 5', 'Symphony No. 6', 'Symphony No. 3'], 'sub': 'music'},
-        {'q': 'What TV show holds the record for most expensive episode?', 'a': 'The Rings of Power', 'options': ['The Rings of Power', 'Game of Thrones', 'The Crown', 'Stranger Things'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Canterbury Tales"?', 'a': 'Geoffrey Chaucer', 'options': ['Geoffrey Chaucer', 'William Shakespeare', 'John Milton', 'Edmund Spenser'], 'sub': 'literature'},
-        {'q': 'Which film has the highest box office gross of all time (unadjusted)?', 'a': 'Avatar', 'options': ['Avatar', 'Avengers: Endgame', 'Titanic', 'Star Wars: The Force Awakens'], 'sub': 'movies'},
-        {'q': 'What instrument did Miles Davis play?', 'a': 'Trumpet', 'options': ['Trumpet', 'Saxophone', 'Piano', 'Bass'], 'sub': 'music'},
-        {'q': 'Which show won the first Emmy for Outstanding Drama Series?', 'a': 'The U.S. Steel Hour', 'options': ['The U.S. Steel Hour', 'I Love Lucy', 'Playhouse 90', 'Studio One'], 'sub': 'tv'},
-        {'q': 'Who wrote "Don Quixote"?', 'a': 'Miguel de Cervantes', 'options': ['Miguel de Cervantes', 'Gabriel García Márquez', 'Jorge Luis Borges', 'Pablo Neruda'], 'sub': 'literature'},
-        {'q': 'Which actor has won the most Academy Awards?', 'a': 'Katharine Hepburn', 'options': ['Katharine Hepburn', 'Meryl Streep', 'Jack Nicholson', 'Daniel Day-Lewis'], 'sub': 'movies'},
-        {'q': 'Who composed the music for "Star Wars"?', 'a': 'John Williams', 'options': ['John Williams', 'Hans Zimmer', 'Jerry Goldsmith', 'James Horner'], 'sub': 'music'},
-        {'q': 'What was the first TV show to air a same-sex wedding?', 'a': 'Roseanne', 'options': ['Roseanne', 'Friends', 'Will & Grace', 'Ellen'], 'sub': 'tv'},
-        {'q': 'Who wrote "Ulysses"?', 'a': 'James Joyce', 'options': ['James Joyce', 'Samuel Beckett', 'Oscar Wilde', 'W.B. Yeats'], 'sub': 'literature'},
-        {'q': 'Which Pixar film was the first to be rated PG?', 'a': 'The Incredibles', 'options': ['The Incredibles', 'Up', 'Brave', 'Ratatouille'], 'sub': 'movies'},
-        {'q': 'What is considered the first rock and roll song?', 'a': 'Rocket 88', 'options': ['Rocket 88', 'Rock Around the Clock', 'Johnny B. Goode', 'Tutti Frutti'], 'sub': 'music'},
-        {'q': 'Which TV drama has the highest IMDB rating?', 'a': 'Breaking Bad', 'options': ['Breaking Bad', 'The Wire', 'The Sopranos', 'Game of Thrones'], 'sub': 'tv'},
-        {'q': 'Who wrote "Crime and Punishment"?', 'a': 'Fyodor Dostoevsky', 'options': ['Fyodor Dostoevsky', 'Leo Tolstoy', 'Anton Chekhov', 'Nikolai Gogol'], 'sub': 'literature'},
-        {'q': 'Which movie had the longest continuous shot (11 minutes)?', 'a': 'Touch of Evil', 'options': ['Touch of Evil', 'Birdman', '1917', 'Children of Men'], 'sub': 'movies'},
-        {'q': 'Who was the first musician to have a diamond-certified album?', 'a': 'Michael Jackson', 'options': ['Michael Jackson', 'The Beatles', 'Elvis Presley', 'Eagles'], 'sub': 'music'},
-        {'q': 'What was HBO\'s first original drama series?', 'a': 'Oz', 'options': ['Oz', 'The Sopranos', 'Six Feet Under', 'The Wire'], 'sub': 'tv'},
-        {'q': 'Who wrote "Frankenstein"?', 'a': 'Mary Shelley', 'options': ['Mary Shelley', 'Bram Stoker', 'Edgar Allan Poe', 'H.G. Wells'], 'sub': 'literature'},
-        {'q': 'Which director has made the most films?', 'a': 'Takashi Miike', 'options': ['Takashi Miike', 'Steven Spielberg', 'Woody Allen', 'Clint Eastwood'], 'sub': 'movies'},
-        {'q': 'What symphony orchestra is the oldest in the United States?', 'a': 'New York Philharmonic', 'options': ['New York Philharmonic', 'Boston Symphony', 'Chicago Symphony', 'Philadelphia Orchestra'], 'sub': 'music'},
-        {'q': 'Which TV show introduced the "bottle episode" concept?', 'a': 'Star Trek', 'options': ['Star Trek', 'The Twilight Zone', 'M*A*S*H', 'Cheers'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Divine Comedy"?', 'a': 'Dante Alighieri', 'options': ['Dante Alighieri', 'Giovanni Boccaccio', 'Petrarch', 'Virgil'], 'sub': 'literature'},
-        {'q': 'Which silent film star was known as "The Little Tramp"?', 'a': 'Charlie Chaplin', 'options': ['Charlie Chaplin', 'Buster Keaton', 'Harold Lloyd', 'Fatty Arbuckle'], 'sub': 'movies'},
-        {'q': 'What was the first album to be certified platinum?', 'a': 'Eagles - Their Greatest Hits', 'options': ['Eagles - Their Greatest Hits', 'Fleetwood Mac - Rumours', 'Boston - Boston', 'Led Zeppelin IV'], 'sub': 'music'},
-        {'q': 'Which TV network aired the first regularly scheduled news broadcast?', 'a': 'CBS', 'options': ['CBS', 'NBC', 'ABC', 'DuMont'], 'sub': 'tv'},
-        {'q': 'Who wrote "The Odyssey"?', 'a': 'Homer', 'options': ['Homer', 'Sophocles', 'Euripides', 'Virgil'], 'sub': 'literature'},
-        {'q': 'What was the first feature film made entirely with CGI?', 'a': 'Toy Story', 'options': ['Toy Story', 'Shrek', 'A Bug\'s Life', 'Antz'], 'sub': 'movies'},
-        {'q': 'Which female artist has won the most Grammy Awards?', 'a': 'Beyoncé', 'options': ['Beyoncé', 'Alison Krauss', 'Adele', 'Taylor Swift'], 'sub': 'music'},
-    ],
-    'sports': [
-        {'q': 'Which country has won the most FIFA World Cup titles in women\'s football?', 'a': 'United States', 'options': ['United States', 'Germany', 'Brazil', 'Japan'], 'sub': 'soccer'},
-        {'q': 'Who was the first African American head coach to win a Super Bowl?', 'a': 'Tony Dungy', 'options': ['Tony Dungy', 'Mike Tomlin', 'Lovie Smith', 'Herm Edwards'], 'sub': 'football'},
-        {'q': 'Which boxer retired undefeated with a 50-0 record?', 'a': 'Floyd Mayweather Jr.', 'options': ['Floyd Mayweather Jr.', 'Rocky Marciano', 'Muhammad Ali', 'Mike Tyson'], 'sub': 'misc'},
-        {'q': 'What year did the "Miracle on Ice" occur at the Winter Olympics?', 'a': '1980', 'options': ['1980', '1984', '1976', '1972'], 'sub': 'olympics'},
-        {'q': 'Who holds the record for most goals in a single Premier League season?', 'a': 'Erling Haaland', 'options': ['Erling Haaland', 'Mohamed Salah', 'Alan Shearer', 'Cristiano Ronaldo'], 'sub': 'soccer'},
-        {'q': 'What is the only country to have competed in every Summer Olympic Games?', 'a': 'Greece', 'options': ['Greece', 'United States', 'Great Britain', 'France'], 'sub': 'olympics'},
-        {'q': 'Who was the youngest player to score in a FIFA World Cup final?', 'a': 'Pelé', 'options': ['Pelé', 'Kylian Mbappé', 'Michael Owen', 'Diego Maradona'], 'sub': 'soccer'},
-        {'q': 'Which NBA player has the most career triple-doubles?', 'a': 'Russell Westbrook', 'options': ['Russell Westbrook', 'Oscar Robertson', 'Magic Johnson', 'LeBron James'], 'sub': 'basketball'},
-        {'q': 'What is the only major sports league to have had a team relocate to a different country?', 'a': 'MLB', 'options': ['MLB', 'NBA', 'NFL', 'NHL'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most career grand slams in MLB?', 'a': 'Lou Gehrig', 'options': ['Lou Gehrig', 'Alex Rodriguez', 'Manny Ramirez', 'Eddie Murray'], 'sub': 'baseball'},
-        {'q': 'Which golfer has the most career PGA Tour wins?', 'a': 'Sam Snead', 'options': ['Sam Snead', 'Tiger Woods', 'Jack Nicklaus', 'Arnold Palmer'], 'sub': 'golf'},
-        {'q': 'What is the longest winning streak in NBA history?', 'a': '33 games', 'options': ['33 games', '27 games', '24 games', '28 games'], 'sub': 'basketball'},
-        {'q': 'Who was the first African American to win a Grand Slam title?', 'a': 'Althea Gibson', 'options': ['Althea Gibson', 'Arthur Ashe', 'Serena Williams', 'Venus Williams'], 'sub': 'tennis'},
-        {'q': 'Which country has won the most Rugby World Cups?', 'a': 'South Africa/New Zealand', 'options': ['South Africa/New Zealand', 'Australia', 'England', 'France'], 'sub': 'misc'},
-        {'q': 'What is the fastest recorded tennis serve?', 'a': '163.7 mph', 'options': ['163.7 mph', '155.0 mph', '170.0 mph', '145.0 mph'], 'sub': 'tennis'},
-        {'q': 'Who has scored the most goals in a single calendar year?', 'a': 'Lionel Messi', 'options': ['Lionel Messi', 'Cristiano Ronaldo', 'Gerd Müller', 'Pelé'], 'sub': 'soccer'},
-        {'q': 'Which NHL team has won the most Stanley Cups?', 'a': 'Montreal Canadiens', 'options': ['Montreal Canadiens', 'Toronto Maple Leafs', 'Detroit Red Wings', 'Boston Bruins'], 'sub': 'hockey'},
-        {'q': 'What was the "Rumble in the Jungle"?', 'a': 'Ali vs Foreman boxing match', 'options': ['Ali vs Foreman boxing match', 'Ali vs Frazier', 'Tyson vs Holyfield', 'Foreman vs Frazier'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most consecutive games played in MLB?', 'a': 'Cal Ripken Jr.', 'options': ['Cal Ripken Jr.', 'Lou Gehrig', 'Pete Rose', 'Ty Cobb'], 'sub': 'baseball'},
-        {'q': 'Which country invented the sport of golf?', 'a': 'Scotland', 'options': ['Scotland', 'England', 'Netherlands', 'France'], 'sub': 'golf'},
-        {'q': 'What is the longest touchdown in NFL history?', 'a': '109 yards', 'options': ['109 yards', '108 yards', '107 yards', '105 yards'], 'sub': 'football'},
-        {'q': 'Who was the first player to be drafted #1 overall straight from high school in NBA?', 'a': 'Kwame Brown', 'options': ['Kwame Brown', 'LeBron James', 'Kobe Bryant', 'Kevin Garnett'], 'sub': 'basketball'},
-        {'q': 'Which cyclist won the most Tour de France titles before being stripped?', 'a': 'Lance Armstrong', 'options': ['Lance Armstrong', 'Miguel Indurain', 'Bernard Hinault', 'Eddy Merckx'], 'sub': 'misc'},
-        {'q': 'What is the diameter of a golf hole in inches?', 'a': '4.25 inches', 'options': ['4.25 inches', '4.5 inches', '4.0 inches', '3.75 inches'], 'sub': 'golf'},
-        {'q': 'Who was the first quarterback to throw for 5,000 yards in an NFL season?', 'a': 'Dan Marino', 'options': ['Dan Marino', 'Drew Brees', 'Peyton Manning', 'Tom Brady'], 'sub': 'football'},
-        {'q': 'Which swimmer has the most individual Olympic gold medals?', 'a': 'Michael Phelps', 'options': ['Michael Phelps', 'Mark Spitz', 'Ryan Lochte', 'Ian Thorpe'], 'sub': 'olympics'},
-        {'q': 'What is the weight of an official NBA basketball?', 'a': '22 ounces', 'options': ['22 ounces', '20 ounces', '24 ounces', '18 ounces'], 'sub': 'basketball'},
-        {'q': 'Who has the most career assists in NHL history?', 'a': 'Wayne Gretzky', 'options': ['Wayne Gretzky', 'Ron Francis', 'Mark Messier', 'Ray Bourque'], 'sub': 'hockey'},
-        {'q': 'What is the name of the annual soccer match between Real Madrid and Barcelona?', 'a': 'El Clásico', 'options': ['El Clásico', 'The Derby', 'La Final', 'El Grande'], 'sub': 'soccer'},
-        {'q': 'What is the oldest tennis tournament in the world?', 'a': 'Wimbledon', 'options': ['Wimbledon', 'US Open', 'French Open', 'Australian Open'], 'sub': 'tennis'},
-        {'q': 'Who holds the record for most home runs in a single MLB season?', 'a': 'Barry Bonds', 'options': ['Barry Bonds', 'Mark McGwire', 'Sammy Sosa', 'Roger Maris'], 'sub': 'baseball'},
-        {'q': 'Which Formula 1 driver has the most World Championships?', 'a': 'Michael Schumacher/Lewis Hamilton', 'options': ['Michael Schumacher/Lewis Hamilton', 'Juan Manuel Fangio', 'Alain Prost', 'Sebastian Vettel'], 'sub': 'misc'},
-        {'q': 'What is the length of an Olympic swimming pool in meters?', 'a': '50 meters', 'options': ['50 meters', '100 meters', '25 meters', '75 meters'], 'sub': 'olympics'},
-        {'q': 'Who was the first player to score 100 points in an NBA game?', 'a': 'Wilt Chamberlain', 'options': ['Wilt Chamberlain', 'Michael Jordan', 'Kobe Bryant', 'LeBron James'], 'sub': 'basketball'},
-        {'q': 'Which horse won the Triple Crown most recently before Justify?', 'a': 'American Pharoah', 'options': ['American Pharoah', 'Secretariat', 'Seattle Slew', 'Affirmed'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most goals in a single NHL season?', 'a': 'Wayne Gretzky', 'options': ['Wayne Gretzky', 'Brett Hull', 'Mario Lemieux', 'Alexander Mogilny'], 'sub': 'hockey'},
-        {'q': 'Who holds the women\'s 100m world record?', 'a': 'Florence Griffith-Joyner', 'options': ['Florence Griffith-Joyner', 'Shelly-Ann Fraser-Pryce', 'Elaine Thompson', 'Marion Jones'], 'sub': 'olympics'},
-        {'q': 'Which NFL team went undefeated in the regular season and won Super Bowl?', 'a': '1972 Miami Dolphins', 'options': ['1972 Miami Dolphins', '2007 New England Patriots', '1985 Chicago Bears', '1998 Denver Broncos'], 'sub': 'football'},
-        {'q': 'What is the highest possible break in snooker?', 'a': '147', 'options': ['147', '155', '180', '200'], 'sub': 'misc'},
-        {'q': 'Who has won the most Ballon d\'Or awards?', 'a': 'Lionel Messi', 'options': ['Lionel Messi', 'Cristiano Ronaldo', 'Michel Platini', 'Johan Cruyff'], 'sub': 'soccer'},
-        {'q': 'What is the marathon world record (men\'s)?', 'a': '2:00:35', 'options': ['2:00:35', '2:01:09', '2:02:57', '2:03:23'], 'sub': 'misc'},
-        {'q': 'Which pitcher has the most career strikeouts in MLB?', 'a': 'Nolan Ryan', 'options': ['Nolan Ryan', 'Randy Johnson', 'Roger Clemens', 'Steve Carlton'], 'sub': 'baseball'},
-        {'q': 'Who was the youngest world heavyweight boxing champion?', 'a': 'Mike Tyson', 'options': ['Mike Tyson', 'Muhammad Ali', 'Floyd Patterson', 'Leon Spinks'], 'sub': 'misc'},
-        {'q': 'What is the oldest trophy in international sports?', 'a': "America's Cup", 'options': ["America's Cup", 'Wimbledon', 'Stanley Cup', 'Ryder Cup'], 'sub': 'misc'},
-        {'q': 'Who holds the record for most career rebounds in NBA history?', 'a': 'Wilt Chamberlain', 'options': ['Wilt Chamberlain', 'Bill Russell', 'Kareem Abdul-Jabbar', 'Karl Malone'], 'sub': 'basketball'},
-        {'q': 'Which tennis player has won the most Grand Slam singles titles (women)?', 'a': 'Margaret Court', 'options': ['Margaret Court', 'Serena Williams', 'Steffi Graf', 'Chris Evert'], 'sub': 'tennis'},
-        {'q': 'What is the highest score ever recorded in an NBA game by one team?', 'a': '186 points', 'options': ['186 points', '173 points', '162 points', '150 points'], 'sub': 'basketball'},
-        {'q': 'Who was the first woman to run a sub-4 minute mile?', 'a': 'No woman has', 'options': ['No woman has', 'Sifan Hassan', 'Faith Kipyegon', 'Svetlana Masterkova'], 'sub': 'olympics'},
-        {'q': 'What country has hosted the most Olympic Games?', 'a': 'United States', 'options': ['United States', 'France', 'United Kingdom', 'Germany'], 'sub': 'olympics'},
-        {'q': 'What is the only city to host the Summer Olympics three times?', 'a': 'London', 'options': ['London', 'Paris', 'Athens', 'Los Angeles'], 'sub': 'olympics'},
-        {'q': 'What is the name of the annual horse race held in Louisville, Kentucky?', 'a': 'Kentucky Derby', 'options': ['Kentucky Derby', 'Preakness Stakes', 'Belmont Stakes', 'Breeders Cup'], 'sub': 'misc'},
-        {'q': 'Which pitcher threw the most no-hitters in MLB history?', 'a': 'Nolan Ryan', 'options': ['Nolan Ryan', 'Sandy Koufax', 'Bob Feller', 'Justin Verlander'], 'sub': 'baseball'},
-        {'q': 'What is the penalty for a false start in the NFL?', 'a': '5 yards', 'options': ['5 yards', '10 yards', '15 yards', 'Loss of down'], 'sub': 'football'},
-        {'q': 'Which country has won the most Davis Cup titles in tennis?', 'a': 'United States', 'options': ['United States', 'Australia', 'France', 'Great Britain'], 'sub': 'tennis'},
-        {'q': 'What is the name of the hockey move where a player fakes a shot then pulls the puck around the goalie?', 'a': 'Deke', 'options': ['Deke', 'Dangle', 'Snipe', 'Celly'], 'sub': 'hockey'},
-        {'q': 'Which baseball team plays at Wrigley Field?', 'a': 'Chicago Cubs', 'options': ['Chicago Cubs', 'Chicago White Sox', 'Milwaukee Brewers', 'St. Louis Cardinals'], 'sub': 'baseball'},
-        {'q': 'What is the yardage of the longest field goal in NFL history?', 'a': '66 yards', 'options': ['66 yards', '64 yards', '63 yards', '70 yards'], 'sub': 'football'},
-        {'q': 'Who was the first golfer to win all four major championships?', 'a': 'Gene Sarazen', 'options': ['Gene Sarazen', 'Bobby Jones', 'Ben Hogan', 'Jack Nicklaus'], 'sub': 'golf'},
-        {'q': 'What is the "yips" in sports?', 'a': 'Loss of fine motor skills under pressure', 'options': ['Loss of fine motor skills under pressure', 'A type of injury', 'A celebration dance', 'A training technique'], 'sub': 'misc'},
-        {'q': 'Which NHL goalie has the most career wins?', 'a': 'Martin Brodeur', 'options': ['Martin Brodeur', 'Patrick Roy', 'Roberto Luongo', 'Ed Belfour'], 'sub': 'hockey'},
-        {'q': 'What is the "Grand Slam" in golf?', 'a': 'Winning all four majors', 'options': ['Winning all four majors', 'Winning three majors', 'A hole-in-one on a par 5', 'Winning the same major twice'], 'sub': 'golf'},
-        {'q': 'Who invented the sport of volleyball?', 'a': 'William G. Morgan', 'options': ['William G. Morgan', 'James Naismith', 'Walter Camp', 'Abner Doubleday'], 'sub': 'misc'},
-        {'q': 'What does the "FIFA" in FIFA World Cup stand for?', 'a': 'Fédération Internationale de Football Association', 'options': ['Fédération Internationale de Football Association', 'Federation of International Football Authorities', 'Football International Federation Association', 'Federal International Football Alliance'], 'sub': 'soccer'},
-        {'q': 'Which MLB player was known as "The Iron Horse"?', 'a': 'Lou Gehrig', 'options': ['Lou Gehrig', 'Babe Ruth', 'Joe DiMaggio', 'Cal Ripken Jr.'], 'sub': 'baseball'},
-        {'q': 'What Olympic sport combines cross-country skiing and rifle shooting?', 'a': 'Biathlon', 'options': ['Biathlon', 'Pentathlon', 'Triathlon', 'Decathlon'], 'sub': 'olympics'},
-        {'q': 'Who was the first NBA player to be named MVP unanimously?', 'a': 'Stephen Curry', 'options': ['Stephen Curry', 'LeBron James', 'Michael Jordan', 'Shaquille O\'Neal'], 'sub': 'basketball'},
-        {'q': 'In tennis, what is it called when a player wins a game without the opponent scoring?', 'a': 'A love game', 'options': ['A love game', 'A shutout', 'A bagel', 'A golden game'], 'sub': 'tennis'},
-        {'q': 'What distance is the penalty spot from the goal line in soccer?', 'a': '12 yards', 'options': ['12 yards', '10 yards', '15 yards', '18 yards'], 'sub': 'soccer'},
-        {'q': 'Which NFL team is the only one to go 0-16 in a season?', 'a': '2008 Detroit Lions', 'options': ['2008 Detroit Lions', '2017 Cleveland Browns', '1976 Tampa Bay Buccaneers', '2001 Carolina Panthers'], 'sub': 'football'},
-        {'q': 'What is the circumference of an official baseball in inches?', 'a': '9 inches', 'options': ['9 inches', '10 inches', '8 inches', '11 inches'], 'sub': 'baseball'},
-        {'q': 'Which country has won the most gold medals in Olympic ice hockey?', 'a': 'Canada', 'options': ['Canada', 'Soviet Union/Russia', 'United States', 'Sweden'], 'sub': 'hockey'},
-        {'q': 'What is the minimum number of clubs a golfer can carry in a round?', 'a': 'No minimum', 'options': ['No minimum', '7', '10', '5'], 'sub': 'golf'},
-        {'q': 'Who was the first Black player in Major League Baseball?', 'a': 'Jackie Robinson', 'options': ['Jackie Robinson', 'Satchel Paige', 'Willie Mays', 'Hank Aaron'], 'sub': 'baseball'},
-        {'q': 'What year were women first allowed to compete in the Olympic Games?', 'a': '1900', 'options': ['1900', '1896', '1912', '1920'], 'sub': 'olympics'},
-        {'q': 'What is the term for scoring two goals in soccer?', 'a': 'Brace', 'options': ['Brace', 'Double', 'Pair', 'Combo'], 'sub': 'soccer'},
-        {'q': 'Which sport was invented by James Naismith?', 'a': 'Basketball', 'options': ['Basketball', 'Volleyball', 'Handball', 'Lacrosse'], 'sub': 'basketball'},
-        {'q': 'What is the name of the line that divides a tennis court in half for serves?', 'a': 'Center service line', 'options': ['Center service line', 'Baseline', 'Net line', 'Alley line'], 'sub': 'tennis'},
-        {'q': 'How many weight classes are there in Olympic boxing?', 'a': '13', 'options': ['13', '10', '8', '17'], 'sub': 'misc'},
-        {'q': 'What is the distance of an Ironman triathlon swim leg?', 'a': '2.4 miles', 'options': ['2.4 miles', '1.2 miles', '3.0 miles', '1.0 miles'], 'sub': 'misc'},
-    ],
-    'geography': [
-        {'q': 'What is the deepest point in the world\'s oceans?', 'a': 'Challenger Deep', 'options': ['Challenger Deep', 'Puerto Rico Trench', 'Java Trench', 'Philippine Trench'], 'sub': 'landmarks'},
-        {'q': 'Which African country has the largest economy by GDP?', 'a': 'Nigeria', 'options': ['Nigeria', 'South Africa', 'Egypt', 'Kenya'], 'sub': 'countries'},
-        {'q': 'What is the only country that borders both France and Portugal?', 'a': 'Spain', 'options': ['Spain', 'Andorra', 'Morocco', 'Belgium'], 'sub': 'countries'},
-        {'q': 'Lake Baikal, the world\'s deepest lake, is located in which country?', 'a': 'Russia', 'options': ['Russia', 'Kazakhstan', 'Mongolia', 'China'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Myanmar?', 'a': 'Naypyidaw', 'options': ['Naypyidaw', 'Yangon', 'Mandalay', 'Bagan'], 'sub': 'capitals'},
-        {'q': 'What channel separates England from France?', 'a': 'English Channel', 'options': ['English Channel', 'Strait of Dover', 'Irish Sea', 'North Sea'], 'sub': 'maps'},
-        {'q': 'How many time zones does Russia span?', 'a': '11', 'options': ['11', '9', '7', '13'], 'sub': 'countries'},
-        {'q': 'What is the smallest country in mainland Africa by area?', 'a': 'Gambia', 'options': ['Gambia', 'Eswatini', 'Lesotho', 'Djibouti'], 'sub': 'countries'},
-        {'q': 'Which desert is the largest hot desert in the world?', 'a': 'Sahara', 'options': ['Sahara', 'Arabian', 'Gobi', 'Kalahari'], 'sub': 'landmarks'},
-        {'q': 'What is the highest waterfall in the world by total height?', 'a': 'Angel Falls', 'options': ['Angel Falls', 'Niagara Falls', 'Victoria Falls', 'Iguazu Falls'], 'sub': 'landmarks'},
-        {'q': 'Which European country has the longest coastline?', 'a': 'Norway', 'options': ['Norway', 'Greece', 'Italy', 'United Kingdom'], 'sub': 'countries'},
-        {'q': 'What is the largest landlocked country by area?', 'a': 'Kazakhstan', 'options': ['Kazakhstan', 'Mongolia', 'Chad', 'Niger'], 'sub': 'countries'},
-        {'q': 'Which river forms part of the border between the US and Mexico?', 'a': 'Rio Grande', 'options': ['Rio Grande', 'Colorado River', 'Pecos River', 'Gila River'], 'sub': 'maps'},
-        {'q': 'What is the capital of Kazakhstan?', 'a': 'Astana', 'options': ['Astana', 'Almaty', 'Shymkent', 'Karaganda'], 'sub': 'capitals'},
-        {'q': 'Which country has the most languages spoken within its borders?', 'a': 'Papua New Guinea', 'options': ['Papua New Guinea', 'Indonesia', 'Nigeria', 'India'], 'sub': 'countries'},
-        {'q': 'What is the driest desert in the world?', 'a': 'Atacama Desert', 'options': ['Atacama Desert', 'Sahara Desert', 'Gobi Desert', 'Namib Desert'], 'sub': 'landmarks'},
-        {'q': 'Which sea is the saltiest in the world?', 'a': 'Dead Sea', 'options': ['Dead Sea', 'Red Sea', 'Mediterranean Sea', 'Black Sea'], 'sub': 'maps'},
-        {'q': 'What is the capital of Sri Lanka?', 'a': 'Sri Jayawardenepura Kotte', 'options': ['Sri Jayawardenepura Kotte', 'Colombo', 'Kandy', 'Galle'], 'sub': 'capitals'},
-        {'q': 'Which European country is divided into 26 cantons?', 'a': 'Switzerland', 'options': ['Switzerland', 'Austria', 'Belgium', 'Netherlands'], 'sub': 'countries'},
-        {'q': 'What percentage of the Netherlands is below sea level?', 'a': '26%', 'options': ['26%', '50%', '10%', '75%'], 'sub': 'countries'},
-        {'q': 'Which African country was never colonized?', 'a': 'Ethiopia', 'options': ['Ethiopia', 'Liberia', 'Egypt', 'Morocco'], 'sub': 'countries'},
-        {'q': 'What is the largest lake in Africa?', 'a': 'Lake Victoria', 'options': ['Lake Victoria', 'Lake Tanganyika', 'Lake Malawi', 'Lake Chad'], 'sub': 'landmarks'},
-        {'q': 'What is the only continent without an active volcano?', 'a': 'Australia', 'options': ['Australia', 'Antarctica', 'Europe', 'Africa'], 'sub': 'countries'},
-        {'q': 'What is the capital of Bhutan?', 'a': 'Thimphu', 'options': ['Thimphu', 'Paro', 'Punakha', 'Phuntsholing'], 'sub': 'capitals'},
-        {'q': 'Which is the only country through which both the Equator and Tropic of Capricorn pass?', 'a': 'Brazil', 'options': ['Brazil', 'Indonesia', 'Kenya', 'Ecuador'], 'sub': 'maps'},
-        {'q': 'What is the smallest country in Asia by area?', 'a': 'Maldives', 'options': ['Maldives', 'Singapore', 'Bahrain', 'Brunei'], 'sub': 'countries'},
-        {'q': 'Which mountain range separates France from Spain?', 'a': 'Pyrenees', 'options': ['Pyrenees', 'Alps', 'Carpathians', 'Apennines'], 'sub': 'landmarks'},
-        {'q': 'What is the capital of Mongolia?', 'a': 'Ulaanbaatar', 'options': ['Ulaanbaatar', 'Darkhan', 'Erdenet', 'Choibalsan'], 'sub': 'capitals'},
-        {'q': 'What is the deepest lake in the United States?', 'a': 'Crater Lake', 'options': ['Crater Lake', 'Lake Tahoe', 'Lake Superior', 'Lake Chelan'], 'sub': 'landmarks'},
-        {'q': 'Which European country has the lowest population density?', 'a': 'Iceland', 'options': ['Iceland', 'Norway', 'Finland', 'Sweden'], 'sub': 'countries'},
-        {'q': 'What is the capital of Malta?', 'a': 'Valletta', 'options': ['Valletta', 'Mdina', 'Sliema', 'St. Julian\'s'], 'sub': 'capitals'},
-        {'q': 'Which country is the world\'s largest producer of coffee?', 'a': 'Brazil', 'options': ['Brazil', 'Colombia', 'Vietnam', 'Ethiopia'], 'sub': 'countries'},
-        {'q': 'What is the highest peak in Africa?', 'a': 'Mount Kilimanjaro', 'options': ['Mount Kilimanjaro', 'Mount Kenya', 'Mount Stanley', 'Ras Dashen'], 'sub': 'landmarks'},
-        {'q': 'Which country has the most neighbor countries?', 'a': 'China/Russia', 'options': ['China/Russia', 'Brazil', 'Germany', 'France'], 'sub': 'countries'},
-        {'q': 'What is the capital of Liechtenstein?', 'a': 'Vaduz', 'options': ['Vaduz', 'Schaan', 'Balzers', 'Triesen'], 'sub': 'capitals'},
-        {'q': 'Which strait connects the Black Sea to the Mediterranean?', 'a': 'Bosphorus and Dardanelles', 'options': ['Bosphorus and Dardanelles', 'Strait of Gibraltar', 'Suez Canal', 'Strait of Messina'], 'sub': 'maps'},
-        {'q': 'What is the largest island in the Mediterranean Sea?', 'a': 'Sicily', 'options': ['Sicily', 'Sardinia', 'Cyprus', 'Corsica'], 'sub': 'maps'},
-        {'q': 'Which country has the highest average elevation?', 'a': 'Bhutan', 'options': ['Bhutan', 'Nepal', 'Switzerland', 'Lesotho'], 'sub': 'countries'},
-        {'q': 'What is the capital of Ecuador?', 'a': 'Quito', 'options': ['Quito', 'Guayaquil', 'Cuenca', 'Ambato'], 'sub': 'capitals'},
-        {'q': 'Which body of water separates Iran from Arabia?', 'a': 'Persian Gulf', 'options': ['Persian Gulf', 'Red Sea', 'Arabian Sea', 'Gulf of Oman'], 'sub': 'maps'},
-        {'q': 'What is the only capital city that borders two countries?', 'a': 'Bratislava', 'options': ['Bratislava', 'Vienna', 'Luxembourg City', 'Bern'], 'sub': 'capitals'},
-        {'q': 'What is the largest country in Africa by area?', 'a': 'Algeria', 'options': ['Algeria', 'Democratic Republic of Congo', 'Sudan', 'Libya'], 'sub': 'countries'},
-        {'q': 'What is the world\'s largest coral reef system?', 'a': 'Great Barrier Reef', 'options': ['Great Barrier Reef', 'Belize Barrier Reef', 'Red Sea Coral Reef', 'Maldives Coral Reef'], 'sub': 'landmarks'},
-        {'q': 'Which European capital is built on 14 islands?', 'a': 'Stockholm', 'options': ['Stockholm', 'Copenhagen', 'Amsterdam', 'Venice'], 'sub': 'capitals'},
-        {'q': 'What is the largest country in South America by area?', 'a': 'Brazil', 'options': ['Brazil', 'Argentina', 'Peru', 'Colombia'], 'sub': 'countries'},
-        {'q': 'Which river flows through the most countries?', 'a': 'Danube', 'options': ['Danube', 'Nile', 'Rhine', 'Mekong'], 'sub': 'maps'},
-        {'q': 'What is the capital of Papua New Guinea?', 'a': 'Port Moresby', 'options': ['Port Moresby', 'Lae', 'Mount Hagen', 'Madang'], 'sub': 'capitals'},
-        {'q': 'What sea lies between Japan and the Korean Peninsula?', 'a': 'Sea of Japan', 'options': ['Sea of Japan', 'Yellow Sea', 'South China Sea', 'Philippine Sea'], 'sub': 'maps'},
-    ]
-}
 
-# Curated questions for specific dates (overrides random selection)
-# Used for launch days or special events where question quality matters most
-CURATED_QUESTIONS = {
-    '2026-02-12': {
-        'easy': {
-            'news': 'Who owns The Washington Post?',
-            'history': 'Who was the first man to walk on the moon?',
-            'science': 'What is the largest planet in our solar system?',
-            'entertainment': 'Who played Iron Man in the Marvel Cinematic Universe?',
-            'sports': 'Which country has won the most FIFA World Cup titles?',
-            'geography': 'What is the capital of Australia?',
-        },
-        'hard': {
-            'news': 'What cryptocurrency exchange collapsed in November 2022?',
-            'history': 'What was the code name for the D-Day invasion?',
-            'science': 'What is the name of the closest star to our solar system?',
-            'entertainment': 'Which film has the highest box office gross of all time (unadjusted)?',
-            'sports': 'What country has hosted the most Olympic Games?',
-            'geography': 'Which country has the most languages spoken within its borders?',
-        }
-    }
-}
+@app.before_request
+def check_question_bank():
+    """Start a background reload if the bank's files changed since it was loaded."""
+    global _question_bank_checked_at, _question_bank_reloading
+    if not QUESTION_BANK_CHECK_INTERVAL or _question_bank is None:
+        return
+    now = time.monotonic()
+    if now - _question_bank_checked_at < QUESTION_BANK_CHECK_INTERVAL:
+        return
+    _question_bank_checked_at = now
+    if _question_bank_reloading or question_bank_signature() == _question_bank_signature:
+        return
+    with _question_bank_lock:
+        if _question_bank_reloading:
+            return
+        _question_bank_reloading = True
+    threading.Thread(target=_reload_question_bank_in_background, daemon=True).start()
 
-# Onboarding quiz questions - 50 questions for building user knowledge profile
-# Medium difficulty - not too easy, not too hard
-ONBOARDING_QUESTIONS = [
-    # News/Current Events (8 questions)
-    {'q': 'What country most recently joined the European Union?', 'a': 'Croatia', 'options': ['Croatia', 'Romania', 'Bulgaria', 'Montenegro'], 'category': 'news', 'sub': 'world_affairs'},
-    {'q': 'What ride-sharing company went public in 2019 in one of the largest tech IPOs?', 'a': 'Uber', 'options': ['Uber', 'Lyft', 'DoorDash', 'Airbnb'], 'category': 'news', 'sub': 'current_events'},
-    {'q': 'What social media platform did Mark Zuckerberg rename to "Meta" in 2021?', 'a': 'Facebook', 'options': ['Facebook', 'Instagram', 'WhatsApp', 'Twitter'], 'category': 'news', 'sub': 'current_events'},
-    {'q': 'Which country hosted the G20 summit in 2023?', 'a': 'India', 'options': ['India', 'Indonesia', 'Brazil', 'Japan'], 'category': 'news', 'sub': 'world_affairs'},
-    {'q': 'Which streaming service released the show "Squid Game"?', 'a': 'Netflix', 'options': ['Netflix', 'Amazon Prime', 'Disney+', 'HBO Max'], 'category': 'news', 'sub': 'current_events'},
-    {'q': 'Who became the UK Prime Minister after Boris Johnson?', 'a': 'Liz Truss', 'options': ['Liz Truss', 'Rishi Sunak', 'Keir Starmer', 'Jeremy Hunt'], 'category': 'news', 'sub': 'politics'},
-    {'q': 'What electric vehicle company became the most valuable car company in 2020?', 'a': 'Tesla', 'options': ['Tesla', 'Rivian', 'NIO', 'BYD'], 'category': 'news', 'sub': 'current_events'},
-    {'q': 'Which company launched the James Webb Space Telescope?', 'a': 'NASA', 'options': ['NASA', 'SpaceX', 'ESA', 'Blue Origin'], 'category': 'news', 'sub': 'current_events'},
-
-    # History (9 questions)
-    {'q': 'Who was the first person to reach the South Pole?', 'a': 'Roald Amundsen', 'options': ['Roald Amundsen', 'Robert Scott', 'Ernest Shackleton', 'Richard Byrd'], 'category': 'history', 'sub': 'modern'},
-    {'q': 'Who was the first woman to win a Nobel Prize?', 'a': 'Marie Curie', 'options': ['Marie Curie', 'Mother Teresa', 'Jane Addams', 'Irene Joliot-Curie'], 'category': 'history', 'sub': 'modern'},
-    {'q': 'What was the longest war in United States history?', 'a': 'War in Afghanistan', 'options': ['War in Afghanistan', 'Vietnam War', 'Civil War', 'War of 1812'], 'category': 'history', 'sub': 'wars'},
-    {'q': 'Who was the first president of South Africa after apartheid?', 'a': 'Nelson Mandela', 'options': ['Nelson Mandela', 'Desmond Tutu', 'F.W. de Klerk', 'Thabo Mbeki'], 'category': 'history', 'sub': 'modern'},
-    {'q': 'What was the name of the first satellite launched into space?', 'a': 'Sputnik', 'options': ['Sputnik', 'Explorer 1', 'Vostok', 'Gemini'], 'category': 'history', 'sub': 'modern'},
-    {'q': 'What medieval code of conduct governed the behavior of knights?', 'a': 'Chivalry', 'options': ['Chivalry', 'Feudalism', 'Vassalage', 'Heraldry'], 'category': 'history', 'sub': 'medieval'},
-    {'q': 'What was the codename for the Allied invasion of Normandy in 1944?', 'a': 'D-Day', 'options': ['D-Day', 'Operation Torch', 'Operation Overlord', 'Battle of the Bulge'], 'category': 'history', 'sub': 'wars'},
-    {'q': 'Which president delivered the Gettysburg Address?', 'a': 'Abraham Lincoln', 'options': ['Abraham Lincoln', 'George Washington', 'Thomas Jefferson', 'Ulysses S. Grant'], 'category': 'history', 'sub': 'presidents'},
-    {'q': 'The Great Fire of London occurred in which century?', 'a': '17th century', 'options': ['17th century', '18th century', '16th century', '19th century'], 'category': 'history', 'sub': 'world_history'},
-
-    # Science (9 questions)
-    {'q': 'What is the chemical symbol for sodium?', 'a': 'Na', 'options': ['Na', 'So', 'Sd', 'N'], 'category': 'science', 'sub': 'chemistry'},
-    {'q': 'How many chambers does the human heart have?', 'a': '4', 'options': ['4', '2', '3', '6'], 'category': 'science', 'sub': 'biology'},
-    {'q': 'Light travels fastest through which medium?', 'a': 'Vacuum', 'options': ['Vacuum', 'Air', 'Water', 'Glass'], 'category': 'science', 'sub': 'physics'},
-    {'q': 'What gas do humans exhale that plants need for photosynthesis?', 'a': 'Carbon dioxide', 'options': ['Carbon dioxide', 'Oxygen', 'Nitrogen', 'Hydrogen'], 'category': 'science', 'sub': 'biology'},
-    {'q': 'What process do plants use to convert sunlight into energy?', 'a': 'Photosynthesis', 'options': ['Photosynthesis', 'Respiration', 'Fermentation', 'Osmosis'], 'category': 'science', 'sub': 'biology'},
-    {'q': 'What is the hottest planet in our solar system?', 'a': 'Venus', 'options': ['Venus', 'Mercury', 'Mars', 'Jupiter'], 'category': 'science', 'sub': 'astronomy'},
-    {'q': 'What unit is used to measure electrical current?', 'a': 'Ampere', 'options': ['Ampere', 'Volt', 'Watt', 'Ohm'], 'category': 'science', 'sub': 'physics'},
-    {'q': 'DNA stands for what?', 'a': 'Deoxyribonucleic acid', 'options': ['Deoxyribonucleic acid', 'Dinitrogen acid', 'Dual nucleic acid', 'Dynamic nucleic acid'], 'category': 'science', 'sub': 'biology'},
-    {'q': 'What type of animal is a whale?', 'a': 'Mammal', 'options': ['Mammal', 'Fish', 'Reptile', 'Amphibian'], 'category': 'science', 'sub': 'biology'},
-
-    # Entertainment (8 questions)
-    {'q': 'Who directed the movie "Inception"?', 'a': 'Christopher Nolan', 'options': ['Christopher Nolan', 'Steven Spielberg', 'Martin Scorsese', 'Denis Villeneuve'], 'category': 'entertainment', 'sub': 'movies'},
-    {'q': 'Which band released the album "Abbey Road"?', 'a': 'The Beatles', 'options': ['The Beatles', 'The Rolling Stones', 'Led Zeppelin', 'Pink Floyd'], 'category': 'entertainment', 'sub': 'music'},
-    {'q': 'What fictional country is Black Panther from?', 'a': 'Wakanda', 'options': ['Wakanda', 'Zamunda', 'Latveria', 'Genosha'], 'category': 'entertainment', 'sub': 'movies'},
-    {'q': 'Who played the Joker in "The Dark Knight"?', 'a': 'Heath Ledger', 'options': ['Heath Ledger', 'Joaquin Phoenix', 'Jared Leto', 'Jack Nicholson'], 'category': 'entertainment', 'sub': 'movies'},
-    {'q': 'What animated TV show has been on air since 1989 featuring a yellow-skinned family?', 'a': 'The Simpsons', 'options': ['The Simpsons', 'Family Guy', 'South Park', 'Bob\'s Burgers'], 'category': 'entertainment', 'sub': 'tv'},
-    {'q': 'Who wrote "The Lord of the Rings" trilogy?', 'a': 'J.R.R. Tolkien', 'options': ['J.R.R. Tolkien', 'C.S. Lewis', 'George R.R. Martin', 'Terry Pratchett'], 'category': 'entertainment', 'sub': 'literature'},
-    {'q': 'Who painted the Mona Lisa?', 'a': 'Leonardo da Vinci', 'options': ['Leonardo da Vinci', 'Michelangelo', 'Raphael', 'Pablo Picasso'], 'category': 'entertainment', 'sub': 'arts'},
-    {'q': 'What video game franchise features a character named Master Chief?', 'a': 'Halo', 'options': ['Halo', 'Call of Duty', 'Gears of War', 'Destiny'], 'category': 'entertainment', 'sub': 'games'},
-
-    # Sports (8 questions)
-    {'q': 'What is the standard height of a basketball hoop?', 'a': '10 feet', 'options': ['10 feet', '8 feet', '12 feet', '9 feet'], 'category': 'sports', 'sub': 'basketball'},
-    {'q': 'What color card results in a player being ejected from a soccer match?', 'a': 'Red', 'options': ['Red', 'Yellow', 'Blue', 'Black'], 'category': 'sports', 'sub': 'soccer'},
-    {'q': 'In tennis, what is a score of zero called?', 'a': 'Love', 'options': ['Love', 'Nil', 'Zero', 'Duck'], 'category': 'sports', 'sub': 'tennis'},
-    {'q': 'What sport is played at Wimbledon?', 'a': 'Tennis', 'options': ['Tennis', 'Golf', 'Cricket', 'Rugby'], 'category': 'sports', 'sub': 'tennis'},
-    {'q': 'In which sport did Michael Jordan become famous?', 'a': 'Basketball', 'options': ['Basketball', 'Baseball', 'Football', 'Golf'], 'category': 'sports', 'sub': 'basketball'},
-    {'q': 'What is the national sport of Japan?', 'a': 'Sumo wrestling', 'options': ['Sumo wrestling', 'Judo', 'Karate', 'Baseball'], 'category': 'sports', 'sub': 'misc'},
-    {'q': 'How many innings are in a standard baseball game?', 'a': '9', 'options': ['9', '7', '6', '12'], 'category': 'sports', 'sub': 'baseball'},
-    {'q': 'How many quarters are in an American football game?', 'a': '4', 'options': ['4', '2', '3', '6'], 'category': 'sports', 'sub': 'football'},
-
-    # Geography (8 questions)
-    {'q': 'What is the official language of Brazil?', 'a': 'Portuguese', 'options': ['Portuguese', 'Spanish', 'English', 'French'], 'category': 'geography', 'sub': 'countries'},
-    {'q': 'What is the tallest building in the world as of 2024?', 'a': 'Burj Khalifa', 'options': ['Burj Khalifa', 'Shanghai Tower', 'One World Trade Center', 'Taipei 101'], 'category': 'geography', 'sub': 'landmarks'},
-    {'q': 'In which country would you find the city of Mumbai?', 'a': 'India', 'options': ['India', 'Pakistan', 'Bangladesh', 'Nepal'], 'category': 'geography', 'sub': 'countries'},
-    {'q': 'Which mountain is the tallest in North America?', 'a': 'Denali', 'options': ['Denali', 'Mount Whitney', 'Mount Rainier', 'Mount Logan'], 'category': 'geography', 'sub': 'landmarks'},
-    {'q': 'What is the most populous country in Africa?', 'a': 'Nigeria', 'options': ['Nigeria', 'Ethiopia', 'Egypt', 'South Africa'], 'category': 'geography', 'sub': 'countries'},
-    {'q': 'What waterfall on the border of Zambia and Zimbabwe is one of the largest in the world?', 'a': 'Victoria Falls', 'options': ['Victoria Falls', 'Niagara Falls', 'Iguazu Falls', 'Angel Falls'], 'category': 'geography', 'sub': 'landmarks'},
-    {'q': 'What currency is used in Japan?', 'a': 'Yen', 'options': ['Yen', 'Yuan', 'Won', 'Ringgit'], 'category': 'geography', 'sub': 'countries'},
-    {'q': 'What European country is shaped like a boot?', 'a': 'Italy', 'options': ['Italy', 'Greece', 'Spain', 'Portugal'], 'category': 'geography', 'sub': 'countries'},
-]
 
+def question_id_for(q):
+    """ID of a daily question dict; sets cached before IDs existed are matched by text."""
+    return q.get('id') or question_bank().ids_by_text.get(q['q'])
 
 # User class for Flask-Login
 class User(UserMixin):
@@ -1158,11 +232,302 @@ def get_db():
         from psycopg2.extras import RealDictCursor
         conn = psycopg2.connect(DATABASE_URL)
         conn.cursor_factory = RealDictCursor
-        return conn
+        return InstrumentedConnection(conn)
     else:
         conn = sqlite3.connect(DATABASE)
         conn.row_factory = sqlite3.Row
-        return conn
+        return InstrumentedConnection(conn)
+
+
+# ============ DB INSTRUMENTATION ============
+# Every connection from get_db() is wrapped so each statement's time is added
+# to the current request's totals (query count, DB time, slowest statement).
+# after_request turns those into a Server-Timing header, the slow-request
+# log and the per-route aggregates below.
+
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', 500))
+
+# Most queries a route may run. With QUERY_BUDGET_ASSERT=1 (or
+# app.config['QUERY_BUDGET_ASSERT']) going over raises QueryBudgetExceeded,
+# so an N+1 regression fails loudly in testing instead of slowly in production.
+QUERY_BUDGETS = {
+    'bootstrap': 8,
+    'start_game': 8,
+    'daily_questions_payload': 2,
+    'submit_answer': 4,
+    'submit_answers': 5,
+    'practice': 6,
+    'archive_dates': 1,
+    'archive_questions': 1,
+    'start_archive_game': 4,
+    'get_history': 5,
+    'get_stats': 5,
+    'get_share_text': 3,
+    'api_get_friends': 5,
+    'api_leaderboard': 10,
+    'check_hard_mode_eligibility': 5,
+    'sitemap_xml': 3,
+}
+# Allowed on top when a request draws the day's set from the question schedule
+# (once per day and difficulty): lock, schedule, re-check, save, insert, plus
+# the one-off scan of past sets the first time a schedule is created
+QUERY_BUDGET_DAILY_DRAW = 6
+
+route_stats = {}
+route_stats_lock = threading.Lock()
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def record_query(started, sql):
+    """Add one statement to the current request's DB totals."""
+    if not has_request_context():
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats = g.setdefault('db_stats', {'queries': 0, 'db_ms': 0.0, 'slowest_ms': 0.0, 'slowest_sql': None})
+    stats['queries'] += 1
+    stats['db_ms'] += elapsed_ms
+    if elapsed_ms > stats['slowest_ms']:
+        stats['slowest_ms'] = elapsed_ms
+        stats['slowest_sql'] = ' '.join(str(sql).split())[:300]
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that times execute/executemany; everything else passes through."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, sql, params=()):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(sql, params)
+        finally:
+            record_query(started, sql)
+
+    def executemany(self, sql, seq_of_params):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(sql, seq_of_params)
+        finally:
+            record_query(started, sql)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Connection wrapper whose cursors are InstrumentedCursors."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._open = True
+        DB_CONNECTIONS_IN_USE.inc()
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs))
+
+    def close(self):
+        self._release()
+        return self._conn.close()
+
+    def _release(self):
+        if self._open:
+            self._open = False
+            DB_CONNECTIONS_IN_USE.dec()
+
+    def __del__(self):
+        # Connections dropped on an error path without close() still leave the gauge
+        self._release()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        if name in ('_conn', '_open'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+
+@app.before_request
+def start_request_timing():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def finish_request_timing(response):
+    """Server-Timing header, slow-request log, per-route aggregates and the query budget."""
+    if 'request_started' not in g:
+        return response
+    total_ms = (time.perf_counter() - g.request_started) * 1000
+    stats = g.get('db_stats') or {'queries': 0, 'db_ms': 0.0, 'slowest_ms': 0.0, 'slowest_sql': None}
+    route = request.endpoint or 'unmatched'
+
+    REQUEST_LATENCY.labels(route, request.method).observe(total_ms / 1000)
+    REQUESTS.labels(route, request.method, str(response.status_code)).inc()
+    DB_REQUEST_TIME.labels(route).observe(stats['db_ms'] / 1000)
+    DB_QUERIES.labels(route).inc(stats['queries'])
+
+    response.headers['Server-Timing'] = (
+        f'db;dur={stats["db_ms"]:.1f};desc="{stats["queries"]} queries", '
+        f'app;dur={total_ms - stats["db_ms"]:.1f}, total;dur={total_ms:.1f}'
+    )
+
+    if total_ms > SLOW_REQUEST_MS:
+        print(f"Slow request: {request.method} {request.path} {total_ms:.0f}ms, "
+              f"{stats['queries']} queries, {stats['db_ms']:.0f}ms in DB, "
+              f"slowest {stats['slowest_ms']:.0f}ms: {stats['slowest_sql']}")
+
+    with route_stats_lock:
+        agg = route_stats.setdefault(route, {
+            'requests': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'db_ms': 0.0, 'queries': 0, 'max_queries': 0
+        })
+        agg['requests'] += 1
+        agg['total_ms'] += total_ms
+        agg['max_ms'] = max(agg['max_ms'], total_ms)
+        agg['db_ms'] += stats['db_ms']
+        agg['queries'] += stats['queries']
+        agg['max_queries'] = max(agg['max_queries'], stats['queries'])
+
+    budget = QUERY_BUDGETS.get(route)
+    if budget is not None and g.get('drew_daily_questions'):
+        budget += QUERY_BUDGET_DAILY_DRAW
+    if budget is not None and stats['queries'] > budget and \
+            (app.config.get('QUERY_BUDGET_ASSERT') or os.environ.get('QUERY_BUDGET_ASSERT') == '1'):
+        raise QueryBudgetExceeded(f"{route} ran {stats['queries']} queries (budget {budget})")
+    return response
+
+
+# ============ METRICS ============
+# Prometheus metrics, served at /metrics. Under gunicorn every worker writes
+# its samples to PROMETHEUS_MULTIPROC_DIR (set up in gunicorn.conf.py) and
+# /metrics sums the files, so a scrape sees all workers whichever one answers.
+# Without that variable (python app.py, tests) the process-local registry is used.
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+REQUEST_LATENCY = Histogram('uptriv_request_duration_seconds', 'Request latency by route',
+                            ['route', 'method'])
+REQUESTS = Counter('uptriv_requests_total', 'Responses by route and status code',
+                   ['route', 'method', 'status'])
+DB_REQUEST_TIME = Histogram('uptriv_db_duration_seconds', 'Time spent in SQL per request, by route',
+                            ['route'], buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5))
+DB_QUERIES = Counter('uptriv_db_queries_total', 'SQL statements run, by route', ['route'])
+DB_CONNECTIONS_IN_USE = Gauge('uptriv_db_connections_in_use', 'Database connections currently open',
+                              multiprocess_mode='livesum')
+WORKER_THREADS = Gauge('uptriv_worker_threads', 'Request threads available to hold a connection',
+                       multiprocess_mode='livesum')
+CACHE_LOOKUPS = Counter('uptriv_cache_lookups_total', 'In-process cache lookups', ['cache', 'result'])
+GAMES_STARTED = Counter('uptriv_games_started_total', 'Daily games with a first answer stored', ['difficulty'])
+GAMES_COMPLETED = Counter('uptriv_games_completed_total', 'Daily games with every answer stored', ['difficulty'])
+
+# Pool utilisation is uptriv_db_connections_in_use / uptriv_worker_threads:
+# each request thread holds at most one connection at a time.
+WORKER_THREADS.set(int(os.environ.get('GUNICORN_THREADS', 2)))
+
+# There is no queue-depth gauge: nothing is written by a background queue.
+# Answers and visits are written in the request, and the only background
+# threads (bank reload, health snapshot) run one at a time and only read.
+
+
+def record_game_progress(difficulty, started, completed):
+    """Count a game as started when its first question's answer is stored and
+    completed when the request that stored its last missing answer commits.
+    Callers pass only what their own insert changed, so a retried answer,
+    which is not stored twice, doesn't count the game again."""
+    if started:
+        GAMES_STARTED.labels(difficulty).inc()
+    if completed:
+        GAMES_COMPLETED.labels(difficulty).inc()
+
+
+# ============ PROFILING ============
+# An admin can profile a single request by sending "X-Profile: 1" (or adding
+# ?_profile=1); PROFILE_SAMPLE_RATE profiles that fraction of all requests.
+# Each capture is a pstats file in PROFILE_DIR, which all workers share, and
+# /admin/profiles lists the latest per route. When neither is in use a request
+# pays for one header lookup and one comparison.
+
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_DIR = os.environ.get('PROFILE_DIR') or os.path.join(tempfile.gettempdir(), 'uptriv-profiles')
+PROFILE_KEEP_PER_ROUTE = int(os.environ.get('PROFILE_KEEP_PER_ROUTE', 20))
+
+
+def profile_requested():
+    if request.headers.get('X-Profile') == '1' or request.args.get('_profile') == '1':
+        return current_user.is_authenticated and current_user.email in ADMIN_EMAILS
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+@app.before_request
+def start_profile():
+    if not profile_requested():
+        return
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ allows one active profiler per process; skip this one
+        return
+    g.profiler = profiler
+
+
+@app.after_request
+def save_profile(response):
+    profiler = g.pop('profiler', None)
+    if profiler is None:
+        return response
+    profiler.disable()
+    route = request.endpoint or 'unmatched'
+    total_ms = (time.perf_counter() - g.request_started) * 1000
+    profile_id = f"{route}__{int(time.time() * 1000)}__{total_ms:.0f}__{os.getpid()}.pstats"
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        profiler.dump_stats(os.path.join(PROFILE_DIR, profile_id))
+        prune_profiles(route)
+        response.headers['X-Profile-Id'] = profile_id
+    except OSError as e:
+        print(f"Could not save profile {profile_id}: {e}")
+    return response
+
+
+def list_profiles():
+    """Saved captures by route, newest first, parsed from their file names."""
+    try:
+        names = os.listdir(PROFILE_DIR)
+    except FileNotFoundError:
+        return {}
+    by_route = {}
+    for name in names:
+        parts = name[:-len('.pstats')].split('__') if name.endswith('.pstats') else []
+        if len(parts) != 4:
+            continue
+        route, captured_ms, total_ms, pid = parts
+        by_route.setdefault(route, []).append({
+            'id': name,
+            'captured_at': datetime.fromtimestamp(int(captured_ms) / 1000).isoformat(timespec='seconds'),
+            'duration_ms': int(total_ms),
+            'pid': int(pid)
+        })
+    for captures in by_route.values():
+        captures.sort(key=lambda c: int(c['id'].split('__')[1]), reverse=True)
+    return by_route
+
+
+def prune_profiles(route):
+    for capture in list_profiles().get(route, [])[PROFILE_KEEP_PER_ROUTE:]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, capture['id']))
+        except FileNotFoundError:
+            pass  # Another worker pruned it first
 
 
 def init_db():
@@ -1200,32 +565,31 @@ def init_db():
             CREATE TABLE IF NOT EXISTS game_results (
                 id SERIAL PRIMARY KEY,
                 user_id INTEGER NOT NULL REFERENCES users(id),
-                game_date TEXT NOT NULL,
-                category TEXT NOT NULL,
-                subcategory TEXT NOT NULL,
-                question TEXT NOT NULL,
-                correct_answer TEXT NOT NULL,
-                user_answer TEXT,
-                correct INTEGER NOT NULL,
-                time_taken REAL NOT NULL,
+                game_date DATE NOT NULL,
+                mode TEXT NOT NULL DEFAULT 'daily',
                 difficulty TEXT DEFAULT 'easy',
+                question_id INTEGER NOT NULL,
+                answer_index SMALLINT,
+                options_version INTEGER,
+                correct SMALLINT NOT NULL,
+                time_ms INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                idempotency_key TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
 
-        # Add difficulty column to game_results if it doesn't exist
-        try:
-            cur.execute("ALTER TABLE game_results ADD COLUMN difficulty TEXT DEFAULT 'easy'")
-            conn.commit()
-        except Exception:
-            conn.rollback()
-
-        # Change game_date from DATE to TEXT to support onboarding prefix
-        try:
-            cur.execute("ALTER TABLE game_results ALTER COLUMN game_date TYPE TEXT")
-            conn.commit()
-        except Exception:
-            conn.rollback()
+        # Add columns to game_results if they don't exist
+        for col_sql in [
+            "ALTER TABLE game_results ADD COLUMN difficulty TEXT DEFAULT 'easy'",
+            'ALTER TABLE game_results ADD COLUMN question_id INTEGER',
+            'ALTER TABLE game_results ADD COLUMN idempotency_key TEXT'
+        ]:
+            try:
+                cur.execute(col_sql)
+                conn.commit()
+            except Exception:
+                conn.rollback()
 
         cur.execute('''
             CREATE TABLE IF NOT EXISTS daily_questions (
@@ -1307,15 +671,16 @@ def init_db():
             CREATE TABLE IF NOT EXISTS game_results (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER NOT NULL,
-                game_date TEXT NOT NULL,
-                category TEXT NOT NULL,
-                subcategory TEXT NOT NULL,
-                question TEXT NOT NULL,
-                correct_answer TEXT NOT NULL,
-                user_answer TEXT,
-                correct INTEGER NOT NULL,
-                time_taken REAL NOT NULL,
+                game_date DATE NOT NULL,
+                mode TEXT NOT NULL DEFAULT 'daily',
                 difficulty TEXT DEFAULT 'easy',
+                question_id INTEGER NOT NULL,
+                answer_index INTEGER,
+                options_version INTEGER,
+                correct INTEGER NOT NULL,
+                time_ms INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                idempotency_key TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
@@ -1388,7 +753,9 @@ def init_db():
 
         # SQLite migrations for existing databases
         for col_sql in [
-            'ALTER TABLE game_results ADD COLUMN difficulty TEXT DEFAULT \'easy\''
+            'ALTER TABLE game_results ADD COLUMN difficulty TEXT DEFAULT \'easy\'',
+            'ALTER TABLE game_results ADD COLUMN question_id INTEGER',
+            'ALTER TABLE game_results ADD COLUMN idempotency_key TEXT'
         ]:
             try:
                 cur.execute(col_sql)
@@ -1421,30 +788,610 @@ def init_db():
             )
         ''')
 
+    # Question registry: every question ever served, so game_results rows can
+    # store just a question_id. Negative IDs are retired questions recovered
+    # from old rows that are no longer in the bank.
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY,
+            question TEXT NOT NULL,
+            correct_answer TEXT NOT NULL,
+            options_json TEXT NOT NULL,
+            category TEXT NOT NULL,
+            subcategory TEXT NOT NULL
+        )
+    ''')
+    # One row per game start-game has handed a token out for (see record_game_start)
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS game_starts (
+            user_id INTEGER NOT NULL,
+            game_date DATE NOT NULL,
+            mode TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, game_date, mode, difficulty)
+        )
+    ''')
+    # Every option list a question has had, so an answer_index stored against
+    # an older list (game_results.options_version) still decodes after a bank edit
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS question_options (
+            question_id INTEGER NOT NULL,
+            version INTEGER NOT NULL,
+            options_json TEXT NOT NULL,
+            PRIMARY KEY (question_id, version)
+        )
+    ''')
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    ''')
+    # Per-user bitsets of every question answered in any mode, and of those
+    # answered wrong (see SEEN QUESTIONS)
+    cur.execute(f'''
+        CREATE TABLE IF NOT EXISTS seen_questions (
+            user_id INTEGER PRIMARY KEY REFERENCES users(id),
+            bits {'BYTEA' if USE_POSTGRES else 'BLOB'} NOT NULL,
+            missed_bits {'BYTEA' if USE_POSTGRES else 'BLOB'}
+        )
+    ''')
+    # Daily question cursor per pool (see DAILY QUESTION SCHEDULE). skip_bits
+    # holds the questions used before the schedule existed, for cycle 1 only.
+    cur.execute(f'''
+        CREATE TABLE IF NOT EXISTS question_schedule (
+            difficulty TEXT NOT NULL,
+            category TEXT NOT NULL,
+            cycle INTEGER NOT NULL,
+            last_key BIGINT NOT NULL,
+            skip_bits {'BYTEA' if USE_POSTGRES else 'BLOB'},
+            PRIMARY KEY (difficulty, category)
+        )
+    ''')
+    conn.commit()
+    sync_questions_table(conn)
+
+    # One-off migrations for databases created before game_results was slimmed down
+    if 'question' in table_columns(cur, 'game_results'):
+        migrate_answer_uniqueness(conn)
+        migrate_slim_game_results(conn)
+    if 'mode' not in table_columns(cur, 'game_results'):
+        migrate_game_modes(conn)
+    if 'options_version' not in table_columns(cur, 'game_results'):
+        cur.execute('ALTER TABLE game_results ADD COLUMN options_version INTEGER')
+        conn.commit()
+    cur.execute('SELECT 1 FROM question_options LIMIT 1')
+    if cur.fetchone() is None:
+        record_question_options(conn, question_bank())
+        conn.commit()
+
+    # Build the seen sets from past answers the first time the table exists,
+    # and again when missed_bits is added to it
+    cur.execute('SELECT 1 FROM seen_questions LIMIT 1')
+    rebuild_seen = cur.fetchone() is None
+    if 'missed_bits' not in table_columns(cur, 'seen_questions'):
+        cur.execute(f"ALTER TABLE seen_questions ADD COLUMN missed_bits {'BYTEA' if USE_POSTGRES else 'BLOB'}")
+        conn.commit()
+        rebuild_seen = True
+    if rebuild_seen:
+        users = rebuild_seen_questions(conn)
+        if users:
+            print(f"Built seen-question sets for {users} users")
+
+    # Covering indexes for the hot game_results reads. Postgres carries the
+    # payload columns with INCLUDE; SQLite has to put them in the key.
+    if USE_POSTGRES:
+        covering_indexes = [
+            # Score lookups by user and day: start-game's played-today check, share text, profile stats
+            'CREATE INDEX IF NOT EXISTS idx_results_user_scores ON game_results(user_id, mode, game_date, difficulty) INCLUDE (category, correct)',
+            # Per-question percentages
+            'CREATE INDEX IF NOT EXISTS idx_results_question_scores ON game_results(question_id) INCLUDE (correct)',
+        ]
+    else:
+        covering_indexes = [
+            'CREATE INDEX IF NOT EXISTS idx_results_user_scores ON game_results(user_id, mode, game_date, difficulty, category, correct)',
+            'CREATE INDEX IF NOT EXISTS idx_results_question_scores ON game_results(question_id, correct)',
+        ]
+
     # Create indexes for better query performance
     # These speed up the most common queries significantly
-    index_statements = [
-        'CREATE INDEX IF NOT EXISTS idx_results_user_date ON game_results(user_id, game_date)',
-        'CREATE INDEX IF NOT EXISTS idx_results_question ON game_results(question)',
-        'CREATE INDEX IF NOT EXISTS idx_results_category ON game_results(category)',
-        'CREATE INDEX IF NOT EXISTS idx_results_game_date ON game_results(game_date)',
+    index_statements = covering_indexes + [
+        # Superseded by the covering indexes above; category is never filtered on alone
+        'DROP INDEX IF EXISTS idx_results_question_id',
+        'DROP INDEX IF EXISTS idx_results_category',
+        'DROP INDEX IF EXISTS idx_results_mode_user',
+        # Per-day lookups across users (admin counts, flushing today's games)
+        'CREATE INDEX IF NOT EXISTS idx_results_mode_date ON game_results(mode, game_date)',
         'CREATE INDEX IF NOT EXISTS idx_daily_questions_date_user ON daily_questions(game_date, user_id)',
         'CREATE INDEX IF NOT EXISTS idx_friendships_requester ON friendships(requester_id)',
         'CREATE INDEX IF NOT EXISTS idx_friendships_addressee ON friendships(addressee_id)',
         'CREATE INDEX IF NOT EXISTS idx_visits_path ON visits(path)',
         'CREATE INDEX IF NOT EXISTS idx_visits_visited_at ON visits(visited_at)',
+        # One answer per question per game; retries hit this and are ignored.
+        # Also serves every per-user lookup by mode and date range.
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_results_game_answer ON game_results(user_id, mode, game_date, difficulty, question_id)',
+        # Client-supplied idempotency keys are unique per user
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_results_idempotency ON game_results(user_id, idempotency_key) WHERE idempotency_key IS NOT NULL',
     ]
 
     for stmt in index_statements:
         try:
             cur.execute(stmt)
+            conn.commit()
         except Exception as e:
+            # Roll back so one failed statement doesn't abort the rest on Postgres
+            conn.rollback()
             print(f"Index creation note: {e}")
 
-    conn.commit()
     conn.close()
 
 
+def table_columns(cur, table):
+    """Column names of a table in the current database."""
+    if USE_POSTGRES:
+        cur.execute(f'SELECT column_name FROM information_schema.columns WHERE table_name = {get_placeholder()}', (table,))
+        return {row['column_name'] for row in cur.fetchall()}
+    cur.execute(f'PRAGMA table_info({table})')
+    return {row['name'] for row in cur.fetchall()}
+
+
+def sync_questions_table(conn, bank=None):
+    """Upsert every question of the bank (default: the loaded one) into the
+    questions table. Skipped when questions.json hasn't changed since the last
+    sync, so starting a worker doesn't load the bank."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+    digest = bank.digest if bank else question_bank_data.source_digest()
+    cur.execute("SELECT value FROM app_meta WHERE key = 'questions_sha256'")
+    row = cur.fetchone()
+    if row and row['value'] == digest:
+        return
+
+    rows = [
+        (qid, q['q'], q['a'], json.dumps(q['options']), q['category'], q['sub'])
+        for qid, q in (bank or question_bank()).by_id.items()
+    ]
+    row_sql = '(' + ', '.join([ph] * 6) + ')'
+    for start in range(0, len(rows), 100):
+        chunk = rows[start:start + 100]
+        cur.execute(f'''
+            INSERT INTO questions (id, question, correct_answer, options_json, category, subcategory)
+            VALUES {', '.join([row_sql] * len(chunk))}
+            ON CONFLICT (id) DO UPDATE SET
+                question = excluded.question, correct_answer = excluded.correct_answer,
+                options_json = excluded.options_json, category = excluded.category,
+                subcategory = excluded.subcategory
+            WHERE questions.question <> excluded.question OR questions.options_json <> excluded.options_json
+        ''', tuple(value for row in chunk for value in row))
+    record_question_options(conn, bank or question_bank())
+    cur.execute(f'''
+        INSERT INTO app_meta (key, value) VALUES ('questions_sha256', {ph})
+        ON CONFLICT (key) DO UPDATE SET value = excluded.value
+    ''', (digest,))
+    conn.commit()
+
+
+def options_version(options):
+    """31-bit fingerprint of an option list, stored next to each answer_index."""
+    return int.from_bytes(hashlib.sha256(json.dumps(list(options)).encode()).digest()[:4], 'big') >> 1
+
+
+def record_question_options(conn, bank):
+    """Add the bank's current option lists to question_options (the caller commits)."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+    rows = [(qid, options_version(q['options']), json.dumps(list(q['options']))) for qid, q in bank.by_id.items()]
+    row_sql = '(' + ', '.join([ph] * 3) + ')'
+    for start in range(0, len(rows), 100):
+        chunk = rows[start:start + 100]
+        cur.execute(f'''
+            INSERT INTO question_options (question_id, version, options_json)
+            VALUES {', '.join([row_sql] * len(chunk))}
+            ON CONFLICT (question_id, version) DO NOTHING
+        ''', tuple(value for row in chunk for value in row))
+
+
+def resolve_questions(cur, question_ids):
+    """Question dicts by ID: the in-memory bank first, then the questions table
+    for retired questions that are no longer in the bank."""
+    by_id = question_bank().by_id
+    resolved = {qid: by_id[qid] for qid in question_ids if qid in by_id}
+    missing = [qid for qid in question_ids if qid not in resolved]
+    if missing:
+        ph = get_placeholder()
+        cur.execute(f'''
+            SELECT id, question, correct_answer, options_json, category, subcategory
+            FROM questions WHERE id IN ({', '.join([ph] * len(missing))})
+        ''', tuple(missing))
+        for row in cur.fetchall():
+            resolved[row['id']] = {
+                'id': row['id'],
+                'category': row['category'],
+                'q': row['question'],
+                'a': row['correct_answer'],
+                'options': json.loads(row['options_json']),
+                'sub': row['subcategory']
+            }
+        unknown = [qid for qid in missing if qid not in resolved]
+        if unknown:
+            print(f"WARNING: question IDs in neither the bank nor the questions table: {sorted(unknown)[:20]}")
+    return resolved
+
+
+def stored_daily_set(cur, questions_json):
+    """A stored daily set with every question's ID filled in. Sets stored
+    before questions had IDs are matched by text, in the bank and then in the
+    questions table; a question found in neither (its text has been edited
+    since) is logged and left out, since a game can't refer to it."""
+    questions = json.loads(questions_json)
+    ids_by_text = question_bank().ids_by_text
+    missing = {q['q'] for q in questions if not q.get('id') and q['q'] not in ids_by_text}
+    found = {}
+    if missing:
+        ph = get_placeholder()
+        cur.execute(f'SELECT id, question FROM questions WHERE question IN ({", ".join([ph] * len(missing))})',
+                    tuple(missing))
+        found = {row['question']: row['id'] for row in cur.fetchall()}
+    resolved = []
+    for q in questions:
+        question_id = q.get('id') or ids_by_text.get(q['q']) or found.get(q['q'])
+        if not question_id:
+            print(f"WARNING: leaving out a stored daily question with no known ID: {q['q']!r}")
+            continue
+        resolved.append(dict(q, id=question_id))
+    return resolved
+
+
+def answer_index_for(q, answer):
+    """Position of the chosen answer in the registered question's options (the
+    order history reads them back in), or None for no answer."""
+    options = question_bank().by_id.get(question_id_for(q), q)['options']
+    return options.index(answer) if answer in options else None
+
+
+def options_version_for(q):
+    """options_version of the list answer_index_for() indexes into."""
+    return options_version(question_bank().by_id.get(question_id_for(q), q)['options'])
+
+
+def decode_answers(cur, rows, questions_by_id):
+    """Chosen option text for each game_results row, in order. Rows stored
+    against an option list the bank has since changed are read back with that
+    list from question_options; an index that still doesn't fit is unknown."""
+    current = {qid: options_version(q['options']) for qid, q in questions_by_id.items()}
+    stale = {(r['question_id'], r['options_version']) for r in rows
+             if r['answer_index'] is not None and r['options_version'] is not None
+             and r['options_version'] != current.get(r['question_id'])}
+    archived = {}
+    if stale:
+        ph = get_placeholder()
+        cur.execute(f'''
+            SELECT question_id, version, options_json FROM question_options
+            WHERE {' OR '.join([f'(question_id = {ph} AND version = {ph})'] * len(stale))}
+        ''', tuple(value for key in stale for value in key))
+        archived = {(row['question_id'], row['version']): json.loads(row['options_json']) for row in cur.fetchall()}
+
+    answers = []
+    for r in rows:
+        if r['answer_index'] is None:
+            answers.append('(No answer)')
+            continue
+        if r['options_version'] is None or r['options_version'] == current.get(r['question_id']):
+            q = questions_by_id.get(r['question_id'])
+            options = q['options'] if q else ()
+        else:
+            options = archived.get((r['question_id'], r['options_version']), ())
+        answers.append(options[r['answer_index']] if 0 <= r['answer_index'] < len(options) else '(Unknown answer)')
+    return answers
+
+
+def time_ms_for(time_taken):
+    """Answer time in whole milliseconds; clients send seconds."""
+    try:
+        return int(round(float(time_taken) * 1000))
+    except (TypeError, ValueError):
+        return 10000
+
+
+def migrate_slim_game_results(conn):
+    """One-off: move game_results from full question/answer text to question_id
+    plus the chosen option index.
+
+    Questions that are no longer in the bank are registered in the questions
+    table under negative IDs, with every answer anyone gave as their options,
+    so no history is lost. SQLite rebuilds the table; Postgres alters it in
+    place (run VACUUM FULL game_results afterwards to reclaim the space)."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+
+    # Register retired questions
+    cur.execute('SELECT MIN(id) AS min_id FROM questions')
+    next_retired_id = min((cur.fetchone()['min_id'] or 0), 0) - 1
+    cur.execute('''
+        SELECT question, correct_answer, MIN(category) AS category, MIN(subcategory) AS subcategory
+        FROM game_results GROUP BY question, correct_answer
+    ''')
+    question_map = {}
+    for row in cur.fetchall():
+        if row['question'] in question_map:
+            continue
+        question_id = question_bank().ids_by_text.get(row['question'])
+        if question_id is None:
+            question_id = next_retired_id
+            next_retired_id -= 1
+            cur.execute(f'''
+                SELECT DISTINCT user_answer FROM game_results
+                WHERE question = {ph} AND user_answer IS NOT NULL AND user_answer <> {ph}
+            ''', (row['question'], row['correct_answer']))
+            options = [row['correct_answer']] + sorted(r['user_answer'] for r in cur.fetchall())
+            cur.execute(f'''
+                INSERT INTO questions (id, question, correct_answer, options_json, category, subcategory)
+                VALUES ({ph}, {ph}, {ph}, {ph}, {ph}, {ph})
+            ''', (question_id, row['question'], row['correct_answer'], json.dumps(options),
+                  row['category'], row['subcategory']))
+        question_map[row['question']] = question_id
+
+    # Map each (question, user_answer) pair to an option index
+    questions_by_id = resolve_questions(cur, set(question_map.values()))
+    cur.execute('SELECT DISTINCT question, user_answer FROM game_results WHERE user_answer IS NOT NULL')
+    answer_rows = []
+    for row in cur.fetchall():
+        q = questions_by_id.get(question_map[row['question']])
+        if q is None:
+            continue
+        answer_index = answer_index_for(q, row['user_answer'])
+        if answer_index is not None:
+            answer_rows.append((row['question'], row['user_answer'], answer_index))
+
+    cur.execute('CREATE TEMPORARY TABLE question_map (question TEXT, question_id INTEGER)')
+    cur.execute('CREATE TEMPORARY TABLE answer_map (question TEXT, user_answer TEXT, answer_index INTEGER)')
+    cur.executemany(f'INSERT INTO question_map VALUES ({ph}, {ph})', list(question_map.items()))
+    cur.executemany(f'INSERT INTO answer_map VALUES ({ph}, {ph}, {ph})', answer_rows)
+
+    if USE_POSTGRES:
+        cur.execute('ALTER TABLE game_results ADD COLUMN answer_index SMALLINT')
+        cur.execute('ALTER TABLE game_results ADD COLUMN time_ms INTEGER')
+        cur.execute('''
+            UPDATE game_results g SET question_id = m.question_id
+            FROM question_map m WHERE m.question = g.question AND g.question_id IS NULL
+        ''')
+        cur.execute('''
+            UPDATE game_results g SET answer_index = a.answer_index
+            FROM answer_map a WHERE a.question = g.question AND a.user_answer = g.user_answer
+        ''')
+        cur.execute('UPDATE game_results SET time_ms = ROUND(time_taken * 1000)')
+        cur.execute('ALTER TABLE game_results ALTER COLUMN question_id SET NOT NULL')
+        cur.execute('ALTER TABLE game_results ALTER COLUMN time_ms SET NOT NULL')
+        cur.execute('ALTER TABLE game_results ALTER COLUMN correct TYPE SMALLINT')
+        for column in ['question', 'correct_answer', 'user_answer', 'time_taken', 'subcategory']:
+            cur.execute(f'ALTER TABLE game_results DROP COLUMN {column}')
+    else:
+        cur.execute('''
+            CREATE TABLE game_results_slim (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                game_date TEXT NOT NULL,
+                difficulty TEXT DEFAULT 'easy',
+                question_id INTEGER NOT NULL,
+                answer_index INTEGER,
+                correct INTEGER NOT NULL,
+                time_ms INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                idempotency_key TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+        ''')
+        cur.execute('''
+            INSERT INTO game_results_slim (id, user_id, game_date, difficulty, question_id, answer_index,
+                                           correct, time_ms, category, idempotency_key, created_at)
+            SELECT g.id, g.user_id, g.game_date, g.difficulty, m.question_id, a.answer_index,
+                   g.correct, CAST(ROUND(g.time_taken * 1000) AS INTEGER), g.category, g.idempotency_key, g.created_at
+            FROM game_results g
+            JOIN question_map m ON m.question = g.question
+            LEFT JOIN answer_map a ON a.question = g.question AND a.user_answer = g.user_answer
+        ''')
+        cur.execute('DROP TABLE game_results')
+        cur.execute('ALTER TABLE game_results_slim RENAME TO game_results')
+
+    cur.execute('DROP TABLE question_map')
+    cur.execute('DROP TABLE answer_map')
+    conn.commit()
+    print(f"Migrated game_results to question IDs ({len(question_map)} questions)")
+
+
+def index_exists(cur, name):
+    """Check whether an index exists in the current database."""
+    ph = get_placeholder()
+    if USE_POSTGRES:
+        cur.execute(f'SELECT 1 FROM pg_indexes WHERE indexname = {ph}', (name,))
+    else:
+        cur.execute(f"SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = {ph}", (name,))
+    return cur.fetchone() is not None
+
+
+def migrate_game_modes(conn):
+    """One-off: replace 'onboarding-YYYY-MM-DD' game dates with a mode column
+    and a real date, so mode and date filters can run against the indexes.
+    SQLite keeps the column's declared type; its ISO date strings already
+    compare correctly."""
+    cur = conn.cursor()
+
+    cur.execute("ALTER TABLE game_results ADD COLUMN mode TEXT NOT NULL DEFAULT 'daily'")
+    cur.execute('''
+        UPDATE game_results SET mode = 'onboarding', game_date = SUBSTR(game_date, 12)
+        WHERE game_date LIKE 'onboarding-%'
+    ''')
+    print(f"Moved {cur.rowcount} onboarding answers to mode = 'onboarding'")
+    if USE_POSTGRES:
+        cur.execute('ALTER TABLE game_results ALTER COLUMN game_date TYPE DATE USING game_date::date')
+
+    # Superseded by idx_results_game_answer and idx_results_mode_date
+    for index in ['idx_results_unique_answer', 'idx_results_user_date', 'idx_results_game_date']:
+        cur.execute(f'DROP INDEX IF EXISTS {index}')
+    conn.commit()
+
+
+def migrate_answer_uniqueness(conn):
+    """One-off: backfill question_id, drop duplicate answers from double-taps and
+    retries, then add the (user, date, difficulty, question) uniqueness key.
+    Skipped once the unique index exists."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+
+    if index_exists(cur, 'idx_results_unique_answer'):
+        return
+
+    cur.execute("UPDATE game_results SET difficulty = 'easy' WHERE difficulty IS NULL")
+
+    cur.execute('SELECT DISTINCT question FROM game_results WHERE question_id IS NULL')
+    for row in cur.fetchall():
+        question_id = question_bank().ids_by_text.get(row['question'])
+        if question_id:
+            cur.execute(
+                f'UPDATE game_results SET question_id = {ph} WHERE question = {ph} AND question_id IS NULL',
+                (question_id, row['question'])
+            )
+
+    # Keep the first answer to each question; question_id follows from the text,
+    # so grouping by text also catches retired questions that have no ID
+    cur.execute('''
+        DELETE FROM game_results WHERE id NOT IN (
+            SELECT MIN(id) FROM game_results
+            GROUP BY user_id, game_date, difficulty, question
+        )
+    ''')
+    print(f"Removed {cur.rowcount} duplicate game_results rows")
+
+    cur.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_results_unique_answer
+        ON game_results(user_id, game_date, difficulty, question_id)
+    ''')
+    conn.commit()
+
+
+# ============ SEEN QUESTIONS ============
+# Every question a user has answered, in any mode, as a bitset keyed by
+# question ID: bit n of seen_questions.bits (little-endian, bit 0 of byte 0
+# first) is question n, so ~700 questions take under 100 bytes per user.
+# missed_bits is the same for the questions they have ever answered wrong.
+# In Python a set is a plain int: membership is has_seen(bits, qid), and
+# union, intersection and difference of whole sets are |, & and & ~.
+# Postgres' get_bit()/set_bit() on the bytea use the same numbering.
+# Retired questions have negative IDs and are left out.
+
+SEEN_REBUILD_BATCH_USERS = 1000
+
+
+def seen_bits(question_ids):
+    """Bitset of the given question IDs."""
+    bits = 0
+    for qid in question_ids:
+        if qid > 0:
+            bits |= 1 << qid
+    return bits
+
+
+def seen_ids(bits):
+    """Question IDs in a bitset, ascending."""
+    return [qid for qid, bit in enumerate(bin(bits)[:1:-1]) if bit == '1']
+
+
+def has_seen(bits, question_id):
+    return question_id > 0 and (bits >> question_id) & 1 == 1
+
+
+def seen_bits_to_blob(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+
+def seen_bits_from_blob(blob):
+    # psycopg2 returns bytea as a memoryview
+    return int.from_bytes(bytes(blob), 'little') if blob is not None else 0
+
+
+def get_seen_questions(cur, user_ids):
+    """(seen, missed) bitsets by user ID, in one query; (0, 0) for users with
+    no answers."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    ph = get_placeholder()
+    cur.execute(f'''
+        SELECT user_id, bits, missed_bits FROM seen_questions
+        WHERE user_id IN ({', '.join([ph] * len(user_ids))})
+    ''', tuple(user_ids))
+    seen = {user_id: (0, 0) for user_id in user_ids}
+    for row in cur.fetchall():
+        seen[row['user_id']] = (seen_bits_from_blob(row['bits']), seen_bits_from_blob(row['missed_bits']))
+    return seen
+
+
+def mark_questions_seen(cur, user_id, question_ids, missed_ids=()):
+    """Add question IDs to a user's seen set, and missed_ids (those answered
+    wrong) to their missed set. Call it in the transaction that stored the
+    answers, after the insert: on SQLite that insert already holds the write
+    lock, and on Postgres the row is locked here, so two answers arriving
+    together can't drop each other's bits."""
+    ph = get_placeholder()
+    cur.execute(f"SELECT bits, missed_bits FROM seen_questions WHERE user_id = {ph}{' FOR UPDATE' if USE_POSTGRES else ''}",
+                (user_id,))
+    row = cur.fetchone()
+    current = seen_bits_from_blob(row['bits']) if row else 0
+    current_missed = seen_bits_from_blob(row['missed_bits']) if row else 0
+    updated = current | seen_bits(question_ids)
+    updated_missed = current_missed | seen_bits(missed_ids)
+    if updated == current and updated_missed == current_missed:
+        return
+    if row:
+        cur.execute(f'UPDATE seen_questions SET bits = {ph}, missed_bits = {ph} WHERE user_id = {ph}',
+                    (seen_bits_to_blob(updated), seen_bits_to_blob(updated_missed), user_id))
+        return
+    cur.execute(f'''
+        INSERT INTO seen_questions (user_id, bits, missed_bits) VALUES ({ph}, {ph}, {ph})
+        ON CONFLICT (user_id) DO NOTHING
+    ''', (user_id, seen_bits_to_blob(updated), seen_bits_to_blob(updated_missed)))
+    if not cur.rowcount:
+        # Another request created the row in the meantime; merge into it
+        mark_questions_seen(cur, user_id, question_ids, missed_ids)
+
+
+def rebuild_seen_questions(conn):
+    """Recompute every user's seen and missed sets from game_results, a batch
+    of users at a time. Returns the number of users with a set."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+    cur.execute('SELECT MIN(user_id) AS low, MAX(user_id) AS high FROM game_results')
+    bounds = cur.fetchone()
+    if bounds['low'] is None:
+        return 0
+    users = 0
+    row_sql = f'({ph}, {ph}, {ph})'
+    for low in range(bounds['low'], bounds['high'] + 1, SEEN_REBUILD_BATCH_USERS):
+        cur.execute(f'''
+            SELECT user_id, question_id, correct FROM game_results
+            WHERE user_id >= {ph} AND user_id < {ph} AND question_id > 0
+        ''', (low, low + SEEN_REBUILD_BATCH_USERS))
+        bits_by_user = {}
+        missed_by_user = {}
+        for row in cur.fetchall():
+            bits_by_user[row['user_id']] = bits_by_user.get(row['user_id'], 0) | 1 << row['question_id']
+            if not row['correct']:
+                missed_by_user[row['user_id']] = missed_by_user.get(row['user_id'], 0) | 1 << row['question_id']
+        rows = [(user_id, seen_bits_to_blob(bits), seen_bits_to_blob(missed_by_user.get(user_id, 0)))
+                for user_id, bits in bits_by_user.items()]
+        for start in range(0, len(rows), 100):
+            chunk = rows[start:start + 100]
+            cur.execute(f'''
+                INSERT INTO seen_questions (user_id, bits, missed_bits) VALUES {', '.join([row_sql] * len(chunk))}
+                ON CONFLICT (user_id) DO UPDATE SET bits = excluded.bits, missed_bits = excluded.missed_bits
+            ''', tuple(value for row in chunk for value in row))
+        users += len(rows)
+    conn.commit()
+    return users
+
+
 def get_or_create_user_by_google(google_id, email, name, picture):
     """Get or create user from Google OAuth data."""
     conn = get_db()
@@ -1494,135 +1441,355 @@ def get_or_create_user_by_google(google_id, email, name, picture):
     return dict(user)
 
 
-def get_user_difficulty(user_id):
-    """Get user's difficulty setting."""
-    conn = get_db()
+def get_user_difficulty(user_id, conn=None):
+    """Get user's difficulty setting. Reuses conn if the caller already has one open."""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db()
     cur = conn.cursor()
     ph = get_placeholder()
     cur.execute(f'SELECT difficulty FROM users WHERE id = {ph}', (user_id,))
     result = cur.fetchone()
-    conn.close()
+    if own_conn:
+        conn.close()
     return result['difficulty'] if result and result['difficulty'] else 'easy'
 
 
-def get_recently_used_questions(difficulty, days=None):
-    """Get all previously used questions to avoid repeats across ALL modes.
-    If days is None, checks all history. Otherwise limits to N days."""
-    conn = get_db()
-    cur = conn.cursor()
-    ph = get_placeholder()
+# ============ DAILY QUESTION SCHEDULE ============
+# Each (difficulty, category) pool is served in a fixed pseudo-random order.
+# A question's place in cycle c is schedule_key(difficulty, category, c, id),
+# and question_schedule keeps the key of the last question served, so the
+# next pick is the first key after that cursor: no look at past sets. New
+# questions join the current cycle wherever their key falls and removed ones
+# drop out. Once every key has been served the cycle number goes up, which
+# reorders the pool, and questions start to repeat.
+
+SCHEDULE_ORDER_CACHE_SIZE = 64
+# Furthest ahead /admin/preview-questions will simulate the schedule
+SCHEDULE_PREVIEW_MAX_DAYS = 3660
+
+_schedule_orders = {}
+
+
+def schedule_key(difficulty, category, cycle, question_id):
+    """Position of a question in its pool for one cycle; 63 bits, so it fits a BIGINT."""
+    digest = hashlib.sha256(f'{difficulty}:{category}:{cycle}:{question_id}'.encode()).digest()
+    return int.from_bytes(digest[:8], 'big') >> 1
+
+
+def schedule_order(bank, difficulty, category, cycle, skip_bits=0):
+    """(keys, questions) of a pool in cycle order, without the questions in
+    skip_bits. Cached, so a worker sorts each pool once per cycle and bank."""
+    cache_key = (bank.digest, difficulty, category, cycle, skip_bits)
+    order = _schedule_orders.get(cache_key)
+    if order is None:
+        keyed = sorted(((schedule_key(difficulty, category, cycle, q.id), q)
+                        for q in bank.for_difficulty(difficulty)[category] if not has_seen(skip_bits, q.id)),
+                       key=lambda item: item[0])
+        order = ([key for key, _ in keyed], [q for _, q in keyed])
+        if len(_schedule_orders) >= SCHEDULE_ORDER_CACHE_SIZE:
+            _schedule_orders.clear()
+        _schedule_orders[cache_key] = order
+    return order
+
+
+def next_scheduled_question(bank, difficulty, category, cursor):
+    """The question after cursor ([cycle, last_key, skip_bits]), which is advanced in place."""
+    cycle, last_key, skip_bits = cursor
+    keys, questions = schedule_order(bank, difficulty, category, cycle, skip_bits)
+    i = bisect.bisect_right(keys, last_key)
+    if i == len(keys):
+        # Pool used up: start the next cycle
+        cycle, skip_bits = cycle + 1, 0
+        keys, questions = schedule_order(bank, difficulty, category, cycle)
+        i = 0
+    cursor[:] = [cycle, keys[i], skip_bits]
+    return questions[i]
+
+
+def remaining_in_cycle(bank, difficulty, category, cursor):
+    """Questions of the cursor's cycle not served yet."""
+    cycle, last_key, skip_bits = cursor
+    keys, _ = schedule_order(bank, difficulty, category, cycle, skip_bits)
+    return len(keys) - bisect.bisect_right(keys, last_key)
+
+
+def daily_question(q, difficulty):
+    return {
+        'category': q['category'],
+        'category_name': CATEGORIES[q['category']]['name'],
+        'color': CATEGORIES[q['category']]['color'],
+        'difficulty': difficulty,
+        **q
+    }
 
-    # Query questions from daily_questions table
-    # We look for any user's cached questions since they're the same for all users at same difficulty
-    if days is not None:
-        today = get_user_today()
-        recent_dates = [(today - timedelta(days=i)).isoformat() for i in range(0, days + 1)]
-        placeholders = ','.join([ph] * len(recent_dates))
-        cur.execute(f'''
-            SELECT DISTINCT questions_json FROM daily_questions
-            WHERE game_date IN ({placeholders})
-        ''', tuple(recent_dates))
-    else:
-        cur.execute('SELECT DISTINCT questions_json FROM daily_questions')
 
-    results = cur.fetchall()
-    conn.close()
+def curated_daily_questions(bank, game_date, difficulty):
+    """The curated set for this date (launch days / special events), or None."""
+    curated_picks = (bank.curated.get(game_date) or {}).get(difficulty)
+    if not curated_picks:
+        return None
+    pools = bank.for_difficulty(difficulty)
+    questions = []
+    for cat_key in CATEGORIES:
+        target_q = curated_picks.get(cat_key)
+        match = next((q for q in pools[cat_key] if q['q'] == target_q), None) if target_q else None
+        # Fallback: first question of the category if the curated one isn't found
+        questions.append(daily_question(match or pools[cat_key][0], difficulty))
+    rng_curated = random.Random(int(hashlib.md5(f"{game_date}-{difficulty}-curated".encode()).hexdigest(), 16))
+    rng_curated.shuffle(questions)
+    return questions
 
-    # Extract question texts from the JSON - track ALL difficulties to prevent cross-mode duplicates
-    used_questions = set()
-    for row in results:
+
+def plan_daily_questions(bank, game_date, difficulty, cursors):
+    """The next scheduled question of each category, in a date-seeded order.
+    Advances cursors (category -> [cycle, last_key, skip_bits]) in place."""
+    questions = [daily_question(next_scheduled_question(bank, difficulty, cat_key, cursors[cat_key]), difficulty)
+                 for cat_key in CATEGORIES]
+    rng = random.Random(int(hashlib.md5(f"{game_date}-{difficulty}".encode()).hexdigest(), 16))
+    rng.shuffle(questions)
+    return questions
+
+
+def scheduled_days(bank, difficulty, start, end):
+    """Days from start to end (inclusive) that draw from the schedule, i.e. aren't curated."""
+    day = start
+    while day <= end:
+        if not (bank.curated.get(day.isoformat()) or {}).get(difficulty):
+            yield day
+        day += timedelta(days=1)
+
+
+def next_schedule_day(cur, difficulty):
+    """Today, or tomorrow if today's set is already stored: the next day to draw from the schedule."""
+    ph = get_placeholder()
+    today = get_user_today()
+    cur.execute(
+        f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+        (today.isoformat(), difficulty)
+    )
+    return today + timedelta(days=1) if cur.fetchone() else today
+
+
+def used_daily_question_ids(cur, bank):
+    """Bitset of the bank questions any stored daily set has used."""
+    cur.execute('SELECT DISTINCT questions_json FROM daily_questions')
+    used = set()
+    for row in cur.fetchall():
         try:
-            questions = json.loads(row['questions_json'])
-            for q in questions:
-                used_questions.add(q.get('q'))
-        except:
+            for q in json.loads(row['questions_json']):
+                used.add(bank.ids_by_text.get(q.get('q')))
+        except (ValueError, TypeError, AttributeError):
             pass
+    used.discard(None)
+    return seen_bits(used)
 
-    return used_questions
-
-
-def _generate_daily_questions(today, difficulty):
-    """Generate the canonical set of daily questions for a given date and difficulty."""
-    # Check for curated questions for this date (used for launch days / special events)
-    curated = CURATED_QUESTIONS.get(today)
-    if curated:
-        curated_picks = curated.get(difficulty)
-        if curated_picks:
-            question_bank = HARD_QUESTIONS if difficulty == 'hard' else QUESTIONS
-            questions = []
-            for cat_key in ['news', 'history', 'science', 'entertainment', 'sports', 'geography']:
-                target_q = curated_picks.get(cat_key)
-                if target_q:
-                    match = next((q for q in question_bank[cat_key] if q['q'] == target_q), None)
-                    if match:
-                        questions.append({
-                            'category': cat_key,
-                            'category_name': CATEGORIES[cat_key]['name'],
-                            'color': CATEGORIES[cat_key]['color'],
-                            'difficulty': difficulty,
-                            **match
-                        })
-                        continue
-                # Fallback: pick first question from category if curated not found
-                q = question_bank[cat_key][0]
-                questions.append({
-                    'category': cat_key,
-                    'category_name': CATEGORIES[cat_key]['name'],
-                    'color': CATEGORIES[cat_key]['color'],
-                    'difficulty': difficulty,
-                    **q
-                })
-            rng_curated = random.Random(int(hashlib.md5(f"{today}-{difficulty}-curated".encode()).hexdigest(), 16))
-            rng_curated.shuffle(questions)
-            return questions
 
-    # Get recently used questions to avoid repeats
-    recently_used = get_recently_used_questions(difficulty)
+def load_question_schedule(cur, bank, difficulty, lock=False):
+    """Cursor per category of the difficulty: [cycle, last_key, skip_bits].
 
-    # Generate questions using date + difficulty as seed
-    seed = int(hashlib.md5(f"{today}-{difficulty}".encode()).hexdigest(), 16)
-    rng = random.Random(seed)
+    A category without a row starts cycle 1 skipping every question a stored
+    daily set already used, which takes one scan of daily_questions. With
+    lock, the difficulty's rows are held until the transaction ends (on
+    SQLite the caller holds the database's write lock instead), so one
+    request at a time advances them. Two requests that both find no rows
+    compute the same cursors and the same set, so that race is harmless."""
+    ph = get_placeholder()
+    cur.execute(f'''
+        SELECT category, cycle, last_key, skip_bits FROM question_schedule
+        WHERE difficulty = {ph}{' FOR UPDATE' if lock and USE_POSTGRES else ''}
+    ''', (difficulty,))
+    cursors = {row['category']: [row['cycle'], row['last_key'], seen_bits_from_blob(row['skip_bits'])]
+               for row in cur.fetchall()}
+    missing = [cat_key for cat_key in CATEGORIES if cat_key not in cursors]
+    if missing:
+        used = used_daily_question_ids(cur, bank)
+        pools = bank.for_difficulty(difficulty)
+        for cat_key in missing:
+            cursors[cat_key] = [1, -1, used & seen_bits(q.id for q in pools[cat_key])]
+    return cursors
+
+
+# Unreleased bitsets per (date, difficulty), cached per worker like today's
+# sets. Drawing or flushing a day's set only moves questions between the
+# schedule and the stored sets, so the union holds for the day; it's only
+# cached once today's set exists, since a draw that starts a new cycle puts
+# every question back in the schedule.
+_unreleased_cache = {}
+_unreleased_cache_lock = threading.Lock()
+
+
+def unreleased_daily_question_ids(cur, bank, difficulty):
+    """Bitset of the difficulty's questions that haven't been a past day's
+    question yet: today's and any later stored sets (either difficulty), plus
+    every question the current cycle hasn't served, which later days will."""
+    today = get_user_today().isoformat()
+    with _unreleased_cache_lock:
+        cached = _unreleased_cache.get((today, difficulty))
+    if cached and cached[1] == bank.digest and time.time() - cached[0] < DAILY_QUESTIONS_CACHE_TTL:
+        CACHE_LOOKUPS.labels('unreleased', 'hit').inc()
+        return cached[2]
+    CACHE_LOOKUPS.labels('unreleased', 'miss').inc()
 
-    question_bank = HARD_QUESTIONS if difficulty == 'hard' else QUESTIONS
+    ph = get_placeholder()
+    unreleased = 0
+    for cat_key, (cycle, last_key, skip_bits) in load_question_schedule(cur, bank, difficulty).items():
+        keys, questions = schedule_order(bank, difficulty, cat_key, cycle, skip_bits)
+        unreleased |= seen_bits(q.id for q in questions[bisect.bisect_right(keys, last_key):])
+    cur.execute(
+        f'SELECT game_date, difficulty, questions_json FROM daily_questions WHERE game_date >= {ph} AND user_id IS NULL',
+        (today,)
+    )
+    drawn_today = False
+    for row in cur.fetchall():
+        unreleased |= seen_bits(question_id_for(q) or 0 for q in json.loads(row['questions_json']))
+        drawn_today = drawn_today or (str(row['game_date']) == today and row['difficulty'] == difficulty)
+    if drawn_today:
+        with _unreleased_cache_lock:
+            for key in [k for k in _unreleased_cache if k[0] != today]:
+                del _unreleased_cache[key]
+            _unreleased_cache[(today, difficulty)] = (time.time(), bank.digest, unreleased)
+    return unreleased
+
+
+def save_question_schedule(cur, difficulty, cursors):
+    """Write every category's cursor in one statement, creating missing rows."""
+    ph = get_placeholder()
+    rows = [(difficulty, cat_key, cycle, last_key, seen_bits_to_blob(skip_bits))
+            for cat_key, (cycle, last_key, skip_bits) in cursors.items()]
+    row_sql = '(' + ', '.join([ph] * 5) + ')'
+    cur.execute(f'''
+        INSERT INTO question_schedule (difficulty, category, cycle, last_key, skip_bits)
+        VALUES {', '.join([row_sql] * len(rows))}
+        ON CONFLICT (difficulty, category) DO UPDATE SET
+            cycle = excluded.cycle, last_key = excluded.last_key, skip_bits = excluded.skip_bits
+    ''', tuple(value for row in rows for value in row))
+
+
+def rewind_question_schedule(cur, bank, difficulty, questions):
+    """Move each category's cursor back to just before its question in
+    questions, the latest set drawn, so the next draw serves them again.
+    A cursor that has moved past that question since is left alone. The
+    caller holds the write lock (BEGIN IMMEDIATE on SQLite) and commits."""
+    cursors = load_question_schedule(cur, bank, difficulty, lock=True)
+    rewound = False
+    for q in questions:
+        cursor = cursors.get(q['category'])
+        question_id = question_id_for(q)
+        if cursor is None or not question_id:
+            continue
+        cycle, last_key, skip_bits = cursor
+        if last_key != schedule_key(difficulty, q['category'], cycle, question_id):
+            continue
+        keys, _ = schedule_order(bank, difficulty, q['category'], cycle, skip_bits)
+        i = bisect.bisect_left(keys, last_key)
+        cursor[1] = keys[i - 1] if i else -1
+        rewound = True
+    if rewound:
+        save_question_schedule(cur, difficulty, cursors)
+    return rewound
+
+
+def create_daily_questions(conn, game_date, difficulty):
+    """Pick and store the global set for a date, advancing the schedule in
+    the same transaction. Returns the stored set, which is another request's
+    if that one got there first."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+    # One reference for the whole set, so a reload mid-way can't mix two banks
+    bank = question_bank()
+    try:
+        questions = curated_daily_questions(bank, game_date, difficulty)
+        if questions is None:
+            if not USE_POSTGRES and not conn.in_transaction:
+                # SQLite locks the whole database: take the write lock before reading
+                cur.execute('BEGIN IMMEDIATE')
+            cursors = load_question_schedule(cur, bank, difficulty, lock=True)
+            # Another request may have stored the set while this one waited for the lock
+            cur.execute(
+                f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+                (game_date, difficulty)
+            )
+            result = cur.fetchone()
+            if result:
+                conn.commit()
+                return stored_daily_set(cur, result['questions_json'])
+
+            cycles = {cat_key: cursor[0] for cat_key, cursor in cursors.items()}
+            questions = plan_daily_questions(bank, game_date, difficulty, cursors)
+            for cat_key, cursor in cursors.items():
+                if cursor[0] != cycles[cat_key]:
+                    print(f"WARNING: every {difficulty} {cat_key} question has been used; "
+                          f"cycle {cursor[0]} starts repeating them on {game_date}")
+            save_question_schedule(cur, difficulty, cursors)
+            if has_request_context():
+                g.drew_daily_questions = True
+
+        questions_json = json.dumps(questions)
+        if USE_POSTGRES:
+            cur.execute(
+                f'''INSERT INTO daily_questions (game_date, user_id, difficulty, questions_json)
+                    VALUES ({ph}, NULL, {ph}, {ph})
+                    ON CONFLICT DO NOTHING''',
+                (game_date, difficulty, questions_json)
+            )
+        else:
+            cur.execute(
+                f'''INSERT OR IGNORE INTO daily_questions (game_date, user_id, difficulty, questions_json)
+                    VALUES ({ph}, NULL, {ph}, {ph})''',
+                (game_date, difficulty, questions_json)
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return questions
 
-    questions = []
-    for cat_key in ['news', 'history', 'science', 'entertainment', 'sports', 'geography']:
-        category_questions = question_bank[cat_key]
 
-        # Filter out recently used questions
-        available = [q for q in category_questions if q['q'] not in recently_used]
+# Today's question sets per (date, difficulty), cached per worker process.
+# The TTL bounds how long another worker's admin flush can go unnoticed.
+DAILY_QUESTIONS_CACHE_TTL = 300
+_daily_questions_cache = {}
+# Request threads and the post-fork warm-up write it; /readyz reads it
+_daily_questions_cache_lock = threading.Lock()
 
-        # If all questions were recently used, allow repeats
-        if not available:
-            available = category_questions
 
-        # Use seeded random to pick, prefer non-recently-used
-        rng.shuffle(available)
-        q = available[0]
-        for candidate in available:
-            if candidate['q'] not in recently_used:
-                q = candidate
-                break
+def _cache_daily_questions(game_date, difficulty, questions):
+    with _daily_questions_cache_lock:
+        # Drop other days' entries so the cache never grows past today's sets
+        for key in [k for k in _daily_questions_cache if k[0] != game_date]:
+            del _daily_questions_cache[key]
+        _daily_questions_cache[(game_date, difficulty)] = (time.time(), questions)
+    return questions
 
-        questions.append({
-            'category': cat_key,
-            'category_name': CATEGORIES[cat_key]['name'],
-            'color': CATEGORIES[cat_key]['color'],
-            'difficulty': difficulty,
-            **q
-        })
 
-    rng.shuffle(questions)
-    return questions
+def _uncache_daily_questions(game_date, difficulties=('easy', 'hard')):
+    with _daily_questions_cache_lock:
+        for difficulty in difficulties:
+            _daily_questions_cache.pop((game_date, difficulty), None)
+    with _unreleased_cache_lock:
+        for difficulty in difficulties:
+            _unreleased_cache.pop((game_date, difficulty), None)
 
 
-def get_daily_questions_for_user(user_id):
+def get_daily_questions_for_user(user_id, conn=None, difficulty=None):
     """Get today's questions - same for all users at same difficulty.
-    Uses a single global row (user_id=NULL) per (date, difficulty) as the source of truth."""
+    Uses a single global row (user_id=NULL) per (date, difficulty) as the source of truth.
+    Pass conn/difficulty when the caller already has them to avoid extra round trips."""
     today = get_user_today().isoformat()
-    difficulty = get_user_difficulty(user_id)
-
-    conn = get_db()
+    if difficulty is None:
+        difficulty = get_user_difficulty(user_id, conn=conn)
+
+    with _daily_questions_cache_lock:
+        cached = _daily_questions_cache.get((today, difficulty))
+    if cached and time.time() - cached[0] < DAILY_QUESTIONS_CACHE_TTL:
+        CACHE_LOOKUPS.labels('daily_questions', 'hit').inc()
+        return cached[1]
+    CACHE_LOOKUPS.labels('daily_questions', 'miss').inc()
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db()
     cur = conn.cursor()
     ph = get_placeholder()
 
@@ -1634,73 +1801,51 @@ def get_daily_questions_for_user(user_id):
     result = cur.fetchone()
 
     if result:
-        conn.close()
-        return json.loads(result['questions_json'])
-
-    # 2. No global row yet — generate questions and try to insert
-    questions = _generate_daily_questions(today, difficulty)
-    questions_json = json.dumps(questions)
-
-    if USE_POSTGRES:
-        # Use INSERT ... ON CONFLICT DO NOTHING to handle race conditions
-        cur.execute(
-            f'''INSERT INTO daily_questions (game_date, user_id, difficulty, questions_json)
-                VALUES ({ph}, NULL, {ph}, {ph})
-                ON CONFLICT DO NOTHING''',
-            (today, difficulty, questions_json)
-        )
-        conn.commit()
-
-        # Re-read to get the winning row (in case another request won the race)
-        cur.execute(
-            f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
-            (today, difficulty)
-        )
-        result = cur.fetchone()
-        conn.close()
-        if result:
-            return json.loads(result['questions_json'])
-        # Shouldn't happen, but fall back to what we generated
-        return questions
-    else:
-        # SQLite: use INSERT OR IGNORE
-        try:
-            cur.execute(
-                f'''INSERT OR IGNORE INTO daily_questions (game_date, user_id, difficulty, questions_json)
-                    VALUES ({ph}, NULL, {ph}, {ph})''',
-                (today, difficulty, questions_json)
-            )
-            conn.commit()
-        except Exception:
-            conn.rollback()
+        questions = stored_daily_set(cur, result['questions_json'])
+        if own_conn:
+            conn.close()
+        return _cache_daily_questions(today, difficulty, questions)
 
-        # Re-read
-        cur.execute(
-            f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
-            (today, difficulty)
-        )
-        result = cur.fetchone()
+    # 2. No global row yet: draw today's set from the schedule and store it
+    questions = create_daily_questions(conn, today, difficulty)
+    if own_conn:
         conn.close()
-        if result:
-            return json.loads(result['questions_json'])
-        return questions
+    return _cache_daily_questions(today, difficulty, questions)
 
 
 def calculate_user_stats(user_id):
     """Calculate comprehensive stats for a user."""
+    return calculate_users_stats([user_id])[user_id]
+
+
+def calculate_users_stats(user_ids):
+    """Stats for several users from one game_results query (friends, leaderboard)."""
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
     conn = get_db()
     cur = conn.cursor()
 
     placeholder = '%s' if USE_POSTGRES else '?'
+    placeholders = ', '.join([placeholder] * len(user_ids))
 
     cur.execute(f'''
-        SELECT category, subcategory, correct, time_taken, COALESCE(difficulty, 'easy') as difficulty
+        SELECT user_id, question_id, category, correct, COALESCE(difficulty, 'easy') as difficulty
         FROM game_results
-        WHERE user_id = {placeholder}
-    ''', (user_id,))
-    results = cur.fetchall()
+        WHERE user_id IN ({placeholders}) AND mode IN ('daily', 'onboarding')
+    ''', tuple(user_ids))
+    rows = cur.fetchall()
+    questions_by_id = resolve_questions(cur, {r['question_id'] for r in rows})
     conn.close()
 
+    results_by_user = {user_id: [] for user_id in user_ids}
+    for r in rows:
+        results_by_user[r['user_id']].append(r)
+    return {user_id: build_user_stats(results, questions_by_id)
+            for user_id, results in results_by_user.items()}
+
+
+def build_user_stats(results, questions_by_id):
     if not results:
         return {
             'total_games': 0,
@@ -1719,7 +1864,8 @@ def calculate_user_stats(user_id):
 
     for r in results:
         cat = r['category']
-        sub = r['subcategory']
+        q = questions_by_id.get(r['question_id'])
+        sub = q['sub'] if q else None
         correct = r['correct']
         difficulty = r['difficulty'] if r['difficulty'] in ('easy', 'hard') else 'easy'
 
@@ -1738,6 +1884,8 @@ def calculate_user_stats(user_id):
             overall_diff['easy_total'] += 1
             overall_diff['easy_correct'] += correct
 
+        if sub is None:
+            continue
         if sub not in sub_stats:
             sub_stats[sub] = {'correct': 0, 'total': 0, 'category': cat}
         sub_stats[sub]['total'] += 1
@@ -1815,6 +1963,7 @@ def generate_player_summary(stats, dismissed_titles=None):
 
     if dismissed_titles is None:
         dismissed_titles = set()
+    learning_resources = question_bank().learning_resources
 
     total_questions = stats['total_questions']
     overall = stats['overall_percentage']
@@ -1874,8 +2023,8 @@ def generate_player_summary(stats, dismissed_titles=None):
     # Get resources for weak areas
     for sub_name, sub_stats in weak_subs[:4]:  # Top 4 weakest
         cat = sub_stats['category']
-        if cat in LEARNING_RESOURCES:
-            cat_resources = LEARNING_RESOURCES[cat]
+        if cat in learning_resources:
+            cat_resources = learning_resources[cat]
             # Try exact subcategory match first
             if sub_name in cat_resources:
                 for resource in cat_resources[sub_name]:
@@ -1896,9 +2045,9 @@ def generate_player_summary(stats, dismissed_titles=None):
     if len(recommendations) < 4:
         for cat_key, cat_stats in sorted_cats[-3:]:  # 3 worst categories
             if cat_stats['total'] >= 3 and cat_stats['percentage'] < 60:
-                if cat_key in LEARNING_RESOURCES:
+                if cat_key in learning_resources:
                     # Get first available subcategory resources
-                    for sub_key, resources in LEARNING_RESOURCES[cat_key].items():
+                    for sub_key, resources in learning_resources[cat_key].items():
                         for resource in resources:
                             resource_key = resource['title']
                             if resource_key not in seen_resources and resource_key not in dismissed_titles:
@@ -1925,8 +2074,8 @@ def generate_player_summary(stats, dismissed_titles=None):
 
     for sub_name, sub_stats in strong_subs[:6]:
         cat = sub_stats['category']
-        if cat in LEARNING_RESOURCES:
-            cat_resources = LEARNING_RESOURCES[cat]
+        if cat in learning_resources:
+            cat_resources = learning_resources[cat]
             if sub_name in cat_resources:
                 for resource in cat_resources[sub_name]:
                     resource_key = resource['title']
@@ -1945,8 +2094,8 @@ def generate_player_summary(stats, dismissed_titles=None):
     if len(interest_recs) < 4:
         for cat_key, cat_stats in sorted_cats[:3]:  # 3 best categories
             if cat_stats['total'] >= 3 and cat_stats['percentage'] >= 60:
-                if cat_key in LEARNING_RESOURCES:
-                    for sub_key, resources in LEARNING_RESOURCES[cat_key].items():
+                if cat_key in learning_resources:
+                    for sub_key, resources in learning_resources[cat_key].items():
                         for resource in resources:
                             resource_key = resource['title']
                             if resource_key not in seen_interest and resource_key not in seen_resources and resource_key not in dismissed_titles:
@@ -1984,6 +2133,16 @@ def get_user_today():
     central_now = utc_now + central_offset
     return central_now.date()
 
+def central_day_bounds(day):
+    """UTC start and end of a US Central calendar day, formatted like stored
+    CURRENT_TIMESTAMP values so visited_at filters are plain range scans."""
+    from datetime import timezone
+    from zoneinfo import ZoneInfo
+    start = datetime.combine(day, datetime.min.time(), ZoneInfo('America/Chicago'))
+    end = start + timedelta(days=1)
+    return tuple(t.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S') for t in (start, end))
+
+
 def has_played_today(user_id, difficulty=None):
     """Check if user has already played today, optionally at a specific difficulty."""
     today = get_user_today().isoformat()
@@ -1993,12 +2152,12 @@ def has_played_today(user_id, difficulty=None):
 
     if difficulty:
         cur.execute(
-            f'SELECT COUNT(*) as count FROM game_results WHERE user_id = {placeholder} AND game_date = {placeholder} AND difficulty = {placeholder}',
+            f'SELECT COUNT(*) as count FROM game_results WHERE user_id = {placeholder} AND mode = \'daily\' AND game_date = {placeholder} AND difficulty = {placeholder}',
             (user_id, today, difficulty)
         )
     else:
         cur.execute(
-            f'SELECT COUNT(*) as count FROM game_results WHERE user_id = {placeholder} AND game_date = {placeholder}',
+            f'SELECT COUNT(*) as count FROM game_results WHERE user_id = {placeholder} AND mode = \'daily\' AND game_date = {placeholder}',
             (user_id, today)
         )
     result = cur.fetchone()
@@ -2006,28 +2165,22 @@ def has_played_today(user_id, difficulty=None):
     return result['count'] > 0
 
 
-def get_played_difficulties_today(user_id):
+def get_played_difficulties_today(user_id, conn=None):
     """Get list of difficulties user has played today."""
     today = get_user_today().isoformat()
-    conn = get_db()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db()
     cur = conn.cursor()
     placeholder = '%s' if USE_POSTGRES else '?'
-    # Fetch all results for user and filter in Python to avoid SQL type issues
-    cur.execute(
-        f'SELECT game_date, COALESCE(difficulty, \'easy\') as difficulty FROM game_results WHERE user_id = {placeholder}',
-        (user_id,)
-    )
+    cur.execute(f'''
+        SELECT DISTINCT COALESCE(difficulty, 'easy') as difficulty FROM game_results
+        WHERE user_id = {placeholder} AND mode = 'daily' AND game_date = {placeholder}
+    ''', (user_id, today))
     results = cur.fetchall()
-    conn.close()
-
-    # Filter to today's games in Python
-    difficulties = set()
-    for r in results:
-        game_date = str(r['game_date'])
-        # Handle both DATE objects and strings
-        if game_date == today or game_date.startswith(today):
-            difficulties.add(r['difficulty'] or 'easy')
-    return list(difficulties)
+    if own_conn:
+        conn.close()
+    return [r['difficulty'] for r in results]
 
 
 def get_friends(user_id):
@@ -2036,18 +2189,18 @@ def get_friends(user_id):
     cur = conn.cursor()
     placeholder = '%s' if USE_POSTGRES else '?'
 
+    # One branch per direction so each side can use its friendships index
     cur.execute(f'''
         SELECT u.id, u.username, u.profile_picture, f.status, f.created_at
         FROM friendships f
-        JOIN users u ON (
-            CASE
-                WHEN f.requester_id = {placeholder} THEN f.addressee_id = u.id
-                ELSE f.requester_id = u.id
-            END
-        )
-        WHERE (f.requester_id = {placeholder} OR f.addressee_id = {placeholder})
-        AND f.status = 'accepted'
-    ''', (user_id, user_id, user_id))
+        JOIN users u ON u.id = f.addressee_id
+        WHERE f.requester_id = {placeholder} AND f.status = 'accepted'
+        UNION ALL
+        SELECT u.id, u.username, u.profile_picture, f.status, f.created_at
+        FROM friendships f
+        JOIN users u ON u.id = f.requester_id
+        WHERE f.addressee_id = {placeholder} AND f.status = 'accepted'
+    ''', (user_id, user_id))
 
     friends = [dict(row) for row in cur.fetchall()]
     conn.close()
@@ -2078,14 +2231,14 @@ def get_pending_requests(user_id):
 def google_login():
     """Redirect to Google for OAuth."""
     redirect_uri = url_for('google_callback', _external=True)
-    return google.authorize_redirect(redirect_uri)
+    return google_oauth().authorize_redirect(redirect_uri)
 
 
 @app.route('/auth/google/callback')
 def google_callback():
     """Handle Google OAuth callback."""
     try:
-        token = google.authorize_access_token()
+        token = google_oauth().authorize_access_token()
         user_info = token.get('userinfo')
 
         if user_info:
@@ -2401,13 +2554,18 @@ def onboarding_status():
     conn.close()
 
     completed = result['onboarding_completed'] if result else 0
-    return jsonify({
+    return jsonify(onboarding_progress(completed))
+
+
+def onboarding_progress(completed):
+    """Summarize onboarding quiz progress from the user's completed count."""
+    return {
         'completed': completed,
         'total': 50,
         'is_complete': completed >= 50,
         'next_set': (completed // 10) + 1 if completed < 50 else None,
         'questions_in_set': min(10, 50 - completed)
-    })
+    }
 
 
 @app.route('/api/start-onboarding', methods=['POST'])
@@ -2432,7 +2590,7 @@ def start_onboarding():
     # Get next 10 questions (or remaining if less than 10)
     start_index = completed
     end_index = min(completed + 10, 50)
-    questions = ONBOARDING_QUESTIONS[start_index:end_index]
+    questions = question_bank().onboarding[start_index:end_index]
 
     # Format questions for frontend
     safe_questions = []
@@ -2469,28 +2627,30 @@ def submit_onboarding_answer():
     user_answer = data.get('answer')
     time_taken = data.get('time_taken', 10)
 
-    if question_index is None or question_index >= len(ONBOARDING_QUESTIONS):
+    onboarding_questions = question_bank().onboarding
+    if question_index is None or question_index >= len(onboarding_questions):
         return jsonify({'error': 'Invalid question index'}), 400
 
-    question = ONBOARDING_QUESTIONS[question_index]
+    question = onboarding_questions[question_index]
     correct = user_answer == question['a']
 
-    # Store result in game_results with special game_date for onboarding
+    # Store result in game_results, flagged as an onboarding answer
     conn = get_db()
     cur = conn.cursor()
     ph = get_placeholder()
-
-    # Use a special date format for onboarding results: 'onboarding-YYYY-MM-DD'
     today = get_user_today().isoformat()
-    onboarding_date = f"onboarding-{today}"
 
     cur.execute(f'''
-        INSERT INTO game_results (user_id, game_date, category, subcategory, question, correct_answer, user_answer, correct, time_taken)
-        VALUES ({ph}, {ph}, {ph}, {ph}, {ph}, {ph}, {ph}, {ph}, {ph})
-    ''', (user_id, onboarding_date, question['category'], question['sub'], question['q'], question['a'], user_answer, 1 if correct else 0, time_taken))
+        INSERT INTO game_results (user_id, game_date, mode, question_id, answer_index, options_version, correct, time_ms, category)
+        VALUES ({ph}, {ph}, 'onboarding', {ph}, {ph}, {ph}, {ph}, {ph}, {ph})
+        ON CONFLICT DO NOTHING
+    ''', (user_id, today, question['id'], answer_index_for(question, user_answer), options_version_for(question),
+          1 if correct else 0, time_ms_for(time_taken), question['category']))
 
-    # Update onboarding_completed count
-    cur.execute(f'UPDATE users SET onboarding_completed = onboarding_completed + 1 WHERE id = {ph}', (user_id,))
+    # Update onboarding_completed count (a retried answer was ignored above, so don't count it twice)
+    if cur.rowcount:
+        cur.execute(f'UPDATE users SET onboarding_completed = onboarding_completed + 1 WHERE id = {ph}', (user_id,))
+        mark_questions_seen(cur, user_id, [question['id']], [] if correct else [question['id']])
 
     conn.commit()
 
@@ -2537,18 +2697,14 @@ def onboarding_results():
         cur = conn.cursor()
         ph = get_placeholder()
 
-        # Get all results and filter in Python to avoid SQL type issues
         cur.execute(f'''
-            SELECT game_date, category, correct
+            SELECT category, correct
             FROM game_results
-            WHERE user_id = {ph}
+            WHERE user_id = {ph} AND mode = 'onboarding'
         ''', (user_id,))
-        all_results = cur.fetchall()
+        results = cur.fetchall()
         conn.close()
 
-        # Filter to onboarding results in Python
-        results = [r for r in all_results if str(r['game_date']).startswith('onboarding')]
-
         if not results:
             return jsonify({'success': False, 'error': 'No onboarding results found'})
 
@@ -2630,7 +2786,7 @@ def check_hard_mode_eligibility():
     cur.execute(f'''
         SELECT COUNT(*) as total, SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as correct_count
         FROM game_results
-        WHERE user_id = {ph} AND game_date NOT LIKE 'onboarding-%'
+        WHERE user_id = {ph} AND mode = 'daily'
     ''', (user_id,))
     user_stats = cur.fetchone()
 
@@ -2646,7 +2802,7 @@ def check_hard_mode_eligibility():
                COUNT(*) as total,
                SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as correct_count
         FROM game_results
-        WHERE game_date NOT LIKE 'onboarding-%'
+        WHERE mode = 'daily'
         GROUP BY user_id
         HAVING COUNT(*) >= 6
     ''')
@@ -2801,11 +2957,11 @@ def sitemap_xml():
         cur = conn.cursor()
         cur.execute("""
             SELECT u.username FROM users u
+            JOIN (
+                SELECT user_id FROM game_results WHERE mode = 'daily'
+                GROUP BY user_id HAVING COUNT(DISTINCT game_date) >= 3
+            ) g ON g.user_id = u.id
             WHERE u.username IS NOT NULL AND u.username != ''
-            AND EXISTS (
-                SELECT 1 FROM game_results g WHERE g.user_id = u.id
-                GROUP BY g.user_id HAVING COUNT(DISTINCT g.game_date) >= 3
-            )
         """)
         users = cur.fetchall()
         conn.close()
@@ -2842,7 +2998,22 @@ def privacy():
 def play():
     if request.args:
         return redirect(url_for('play', _external=True), 301)
-    return render_template('play.html', categories=CATEGORIES)
+
+    # Inline the bootstrap payload for known users so first paint needs no fetches.
+    # New visitors get None and the page falls back to POST /api/bootstrap.
+    bootstrap_data = None
+    try:
+        conn = get_db()
+        cur = conn.cursor()
+        anonymous_id = None if current_user.is_authenticated else request.cookies.get('uptriv_anonymous_id')
+        user = load_bootstrap_user(cur, anonymous_id)
+        if user:
+            bootstrap_data = build_bootstrap(conn, user, anonymous_id)
+        conn.close()
+    except Exception as e:
+        print(f"Error building inline bootstrap: {e}")
+
+    return render_template('play.html', categories=CATEGORIES, bootstrap=bootstrap_data)
 
 
 @app.route('/onboarding')
@@ -2885,13 +3056,13 @@ def history_user(username):
                 SELECT COUNT(DISTINCT game_date) AS games_played,
                        SUM(correct) AS total_correct,
                        COUNT(*) AS total_questions
-                FROM game_results WHERE user_id = {p}
+                FROM game_results WHERE user_id = {p} AND mode IN ('daily', 'onboarding')
             ''', (uid,))
             overall = cur.fetchone()
             cur.execute(f'''
                 SELECT category,
                        SUM(correct) * 100 / COUNT(*) AS cat_pct
-                FROM game_results WHERE user_id = {p}
+                FROM game_results WHERE user_id = {p} AND mode IN ('daily', 'onboarding')
                 GROUP BY category ORDER BY cat_pct DESC LIMIT 1
             ''', (uid,))
             best = cur.fetchone()
@@ -2935,16 +3106,18 @@ def admin_page():
     cur = conn.cursor()
     ph = get_placeholder()
 
-    # Get visit stats
-    today = get_user_today().isoformat()
-
-    # Today's visits (convert UTC to Central time)
-    cur.execute(f"SELECT COUNT(*) as count FROM visits WHERE DATE(visited_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/Chicago') = {ph}", (today,))
-    today_visits = cur.fetchone()['count']
+    # Get visit stats. visited_at is stored in UTC, so Central days are UTC ranges
+    today = get_user_today()
+    today_start, today_end = central_day_bounds(today)
 
-    # Today's unique IPs (convert UTC to Central time)
-    cur.execute(f"SELECT COUNT(DISTINCT ip_address) as count FROM visits WHERE DATE(visited_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/Chicago') = {ph}", (today,))
-    today_unique = cur.fetchone()['count']
+    # Today's visits and unique IPs
+    cur.execute(f'''
+        SELECT COUNT(*) as count, COUNT(DISTINCT ip_address) as unique_count
+        FROM visits WHERE visited_at >= {ph} AND visited_at < {ph}
+    ''', (today_start, today_end))
+    row = cur.fetchone()
+    today_visits = row['count']
+    today_unique = row['unique_count']
 
     # Total visits all time
     cur.execute("SELECT COUNT(*) as count FROM visits")
@@ -2963,7 +3136,11 @@ def admin_page():
     google_users = cur.fetchone()['count']
 
     # Total games played
-    cur.execute("SELECT COUNT(DISTINCT user_id || game_date || COALESCE(difficulty, 'easy')) as count FROM game_results")
+    cur.execute("""
+        SELECT COUNT(*) as count FROM (
+            SELECT DISTINCT user_id, game_date, COALESCE(difficulty, 'easy') FROM game_results WHERE mode = 'daily'
+        ) games
+    """)
     total_games = cur.fetchone()['count']
 
     # Visits by page (top 10)
@@ -2976,27 +3153,31 @@ def admin_page():
     ''')
     page_visits = [dict(row) for row in cur.fetchall()]
 
-    # Daily visits for last 7 days (convert UTC to Central time)
-    cur.execute('''
-        SELECT DATE(visited_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/Chicago') as date,
-               COUNT(*) as visits,
-               COUNT(DISTINCT ip_address) as unique_visitors
-        FROM visits
-        GROUP BY DATE(visited_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/Chicago')
-        ORDER BY date DESC
-        LIMIT 7
-    ''')
-    daily_stats = [dict(row) for row in cur.fetchall()]
-
-    # Recent logins (users who visited today, convert UTC to Central time)
+    # Visits on each of the last 7 calendar days, newest first, from one range
+    # scan grouped by day; the CASE buckets by each day's Central-time start
+    days = [today - timedelta(days=days_ago) for days_ago in range(7)]
+    day_starts = [central_day_bounds(day)[0] for day in days]
+    cur.execute(f'''
+        SELECT CASE {' '.join(f'WHEN visited_at >= {ph} THEN {i}' for i in range(len(days)))} END as days_ago,
+               COUNT(*) as visits, COUNT(DISTINCT ip_address) as unique_visitors
+        FROM visits WHERE visited_at >= {ph} AND visited_at < {ph}
+        GROUP BY days_ago
+    ''', (*day_starts, day_starts[-1], today_end))
+    visits_by_day = {row['days_ago']: row for row in cur.fetchall()}
+    daily_stats = [{'date': day,
+                    'visits': visits_by_day[i]['visits'] if i in visits_by_day else 0,
+                    'unique_visitors': visits_by_day[i]['unique_visitors'] if i in visits_by_day else 0}
+                   for i, day in enumerate(days)]
+
+    # Recent logins (users who visited today)
     cur.execute(f'''
         SELECT DISTINCT u.username, u.email, u.profile_picture,
             u.google_id, u.anonymous_id, u.created_at
         FROM visits v
         JOIN users u ON v.user_id = u.id
-        WHERE DATE(v.visited_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/Chicago') = {ph}
+        WHERE v.visited_at >= {ph} AND v.visited_at < {ph}
         ORDER BY u.username
-    ''', (today,))
+    ''', (today_start, today_end))
     today_logins = [dict(row) for row in cur.fetchall()]
 
     conn.close()
@@ -3015,6 +3196,93 @@ def admin_page():
     )
 
 
+@app.route('/admin/route-stats')
+@login_required
+def admin_route_stats():
+    """Admin-only: per-route request and DB aggregates for this worker process."""
+    if not current_user.email or current_user.email not in ADMIN_EMAILS:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    with route_stats_lock:
+        snapshot = {route: dict(agg) for route, agg in route_stats.items()}
+
+    routes = []
+    for route, agg in snapshot.items():
+        routes.append({
+            'route': route,
+            'requests': agg['requests'],
+            'mean_ms': round(agg['total_ms'] / agg['requests'], 1),
+            'max_ms': round(agg['max_ms'], 1),
+            'mean_db_ms': round(agg['db_ms'] / agg['requests'], 1),
+            'mean_queries': round(agg['queries'] / agg['requests'], 1),
+            'max_queries': agg['max_queries'],
+            'query_budget': QUERY_BUDGETS.get(route)
+        })
+    routes.sort(key=lambda r: r['mean_ms'] * r['requests'], reverse=True)
+    return jsonify({'pid': os.getpid(), 'routes': routes})
+
+
+@app.route('/admin/profiles')
+@login_required
+def admin_profiles():
+    """Admin-only: the latest request profiles per route, from every worker."""
+    if not current_user.email or current_user.email not in ADMIN_EMAILS:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    routes = [{'route': route, 'captures': captures[:10]} for route, captures in list_profiles().items()]
+    routes.sort(key=lambda r: r['captures'][0]['captured_at'], reverse=True)
+    return jsonify({'sample_rate': PROFILE_SAMPLE_RATE, 'directory': PROFILE_DIR, 'routes': routes})
+
+
+@app.route('/admin/profiles/<profile_id>')
+@login_required
+def admin_profile(profile_id):
+    """Admin-only: one capture as a pstats report (?sort=cumulative&limit=40),
+    or the raw file with ?format=pstats for snakeviz, flameprof or gprof2dot."""
+    if not current_user.email or current_user.email not in ADMIN_EMAILS:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    from flask import send_from_directory
+    if not profile_id.endswith('.pstats') or not os.path.isfile(os.path.join(PROFILE_DIR, os.path.basename(profile_id))):
+        return jsonify({'error': 'Profile not found'}), 404
+    if request.args.get('format') == 'pstats':
+        return send_from_directory(PROFILE_DIR, profile_id, as_attachment=True)
+
+    import io
+    import pstats
+    out = io.StringIO()
+    stats = pstats.Stats(os.path.join(PROFILE_DIR, profile_id), stream=out)
+    sort = request.args.get('sort', 'cumulative')
+    stats.strip_dirs().sort_stats(sort if sort in pstats.Stats.sort_arg_dict_default else 'cumulative')
+    stats.print_stats(request.args.get('limit', 40, type=int))
+    return Response(out.getvalue(), mimetype='text/plain')
+
+
+@app.route('/admin/reload-questions', methods=['POST'])
+@login_required
+def admin_reload_questions():
+    """Admin-only: reload the question bank here now, and in every other worker
+    at its next check (questions.json is touched to signal them)."""
+    if not current_user.email or current_user.email not in ADMIN_EMAILS:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    try:
+        os.utime(question_bank_data.SOURCE_PATH)
+        bank = reload_question_bank()
+    except question_bank_data.QuestionBankError as e:
+        return jsonify({'error': 'questions.json does not validate', 'problems': e.problems}), 400
+    except OSError as e:
+        return jsonify({'error': f'Could not read the question bank: {e}'}), 500
+
+    return jsonify({
+        'success': True,
+        'questions': len(bank.by_id),
+        'next_id': bank.next_id,
+        'sha256': bank.digest,
+        'other_workers_within_seconds': QUESTION_BANK_CHECK_INTERVAL or None
+    })
+
+
 @app.route('/admin/flush-questions', methods=['POST'])
 @login_required
 def flush_daily_questions():
@@ -3033,24 +3301,44 @@ def flush_daily_questions():
     questions_deleted = 0
     results_deleted = 0
 
+    # Put the schedule back where it was before today's draw, in the same
+    # transaction, so the flushed questions are drawn again instead of skipped
+    if not USE_POSTGRES and not conn.in_transaction:
+        cur.execute('BEGIN IMMEDIATE')
+    bank = question_bank()
+    for flushed in (('easy', 'hard') if difficulty == 'all' else (difficulty,)):
+        cur.execute(
+            f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+            (today, flushed)
+        )
+        row = cur.fetchone()
+        if row and curated_daily_questions(bank, today, flushed) is None:
+            rewind_question_schedule(cur, bank, flushed, json.loads(row['questions_json']))
+
     if difficulty == 'all':
         # Clear all cached question sets for today
         cur.execute(f'DELETE FROM daily_questions WHERE game_date = {ph}', (today,))
         questions_deleted = cur.rowcount
         # Clear all game results for today (so everyone can replay)
-        cur.execute(f'DELETE FROM game_results WHERE game_date = {ph}', (today,))
+        cur.execute(f"DELETE FROM game_results WHERE mode = 'daily' AND game_date = {ph}", (today,))
         results_deleted = cur.rowcount
+        cur.execute(f"DELETE FROM game_starts WHERE mode = 'daily' AND game_date = {ph}", (today,))
     else:
         # Delete cached global questions matching the specified difficulty
         cur.execute(f'DELETE FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph}', (today, difficulty))
         questions_deleted = cur.rowcount
 
         # Clear game results for today at this difficulty (so everyone can replay it)
-        cur.execute(f'DELETE FROM game_results WHERE game_date = {ph} AND COALESCE(difficulty, \'easy\') = {ph}', (today, difficulty))
+        cur.execute(f"DELETE FROM game_results WHERE mode = 'daily' AND game_date = {ph} AND COALESCE(difficulty, 'easy') = {ph}", (today, difficulty))
         results_deleted = cur.rowcount
+        cur.execute(f"DELETE FROM game_starts WHERE mode = 'daily' AND game_date = {ph} AND difficulty = {ph}", (today, difficulty))
 
     conn.commit()
     conn.close()
+
+    # Other workers pick up the change when their cache entry expires
+    _uncache_daily_questions(today, ('easy', 'hard') if difficulty == 'all' else (difficulty,))
+
     return jsonify({
         'success': True,
         'questions_flushed': questions_deleted,
@@ -3063,7 +3351,8 @@ def flush_daily_questions():
 @app.route('/admin/preview-questions', methods=['POST'])
 @login_required
 def preview_questions():
-    """Admin-only: generate questions for a future date without caching anything."""
+    """Admin-only: the questions a future date will get, by running the schedule
+    forward from its current cursors. Nothing is saved."""
     if not current_user.email or current_user.email not in ADMIN_EMAILS:
         return jsonify({'error': 'Unauthorized'}), 403
 
@@ -3077,84 +3366,38 @@ def preview_questions():
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD.'}), 400
     else:
         preview_date = get_user_today() + timedelta(days=1)
+    if preview_date > get_user_today() + timedelta(days=SCHEDULE_PREVIEW_MAX_DAYS):
+        return jsonify({'error': f'Can only preview up to {SCHEDULE_PREVIEW_MAX_DAYS} days ahead.'}), 400
 
-    # Get all previously used questions to avoid repeats
     conn = get_db()
     cur = conn.cursor()
-    cur.execute('SELECT DISTINCT questions_json FROM daily_questions')
-    recently_used = set()
-    for row in cur.fetchall():
-        try:
-            questions = json.loads(row['questions_json'])
-            for q in questions:
-                recently_used.add(q.get('q'))
-        except:
-            pass
-    conn.close()
-
+    ph = get_placeholder()
     result = {}
-    curated = CURATED_QUESTIONS.get(preview_date.isoformat())
+    loaded_bank = question_bank()
     is_curated = False
 
     for difficulty in ['easy', 'hard']:
-        question_bank = HARD_QUESTIONS if difficulty == 'hard' else QUESTIONS
-
-        # Check for curated questions first
-        if curated and curated.get(difficulty):
-            curated_picks = curated[difficulty]
-            questions = []
-            for cat_key in ['news', 'history', 'science', 'entertainment', 'sports', 'geography']:
-                target_q = curated_picks.get(cat_key)
-                if target_q:
-                    match = next((q for q in question_bank[cat_key] if q['q'] == target_q), None)
-                    if match:
-                        questions.append({
-                            'category': cat_key,
-                            'category_name': CATEGORIES[cat_key]['name'],
-                            'color': CATEGORIES[cat_key]['color'],
-                            'difficulty': difficulty,
-                            **match
-                        })
-                        continue
-                # Fallback
-                q = question_bank[cat_key][0]
-                questions.append({
-                    'category': cat_key,
-                    'category_name': CATEGORIES[cat_key]['name'],
-                    'color': CATEGORIES[cat_key]['color'],
-                    'difficulty': difficulty,
-                    **q
-                })
-            rng_curated = random.Random(int(hashlib.md5(f"{preview_date.isoformat()}-{difficulty}-curated".encode()).hexdigest(), 16))
-            rng_curated.shuffle(questions)
+        cur.execute(
+            f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+            (preview_date.isoformat(), difficulty)
+        )
+        stored = cur.fetchone()
+        questions = curated_daily_questions(loaded_bank, preview_date.isoformat(), difficulty)
+        if stored:
+            questions = json.loads(stored['questions_json'])
+        elif questions is not None:
             is_curated = True
         else:
-            seed = int(hashlib.md5(f"{preview_date.isoformat()}-{difficulty}".encode()).hexdigest(), 16)
-            rng = random.Random(seed)
-
-            questions = []
-            for cat_key in ['news', 'history', 'science', 'entertainment', 'sports', 'geography']:
-                category_questions = question_bank[cat_key]
-                available = [q for q in category_questions if q['q'] not in recently_used]
-                if not available:
-                    available = category_questions
-                rng.shuffle(available)
-                q = available[0]
-                for candidate in available:
-                    if candidate['q'] not in recently_used:
-                        q = candidate
-                        break
-                questions.append({
-                    'category': cat_key,
-                    'category_name': CATEGORIES[cat_key]['name'],
-                    'color': CATEGORIES[cat_key]['color'],
-                    'difficulty': difficulty,
-                    **q
-                })
-            rng.shuffle(questions)
+            cursors = load_question_schedule(cur, loaded_bank, difficulty)
+            start = next_schedule_day(cur, difficulty)
+            # Every scheduled day up to the preview date draws first
+            for day in scheduled_days(loaded_bank, difficulty, start, preview_date - timedelta(days=1)):
+                plan_daily_questions(loaded_bank, day.isoformat(), difficulty, cursors)
+            questions = plan_daily_questions(loaded_bank, preview_date.isoformat(), difficulty, cursors)
 
         label = 'normal' if difficulty == 'easy' else 'expert'
         result[label] = questions
+    conn.close()
 
     return jsonify({
         'success': True,
@@ -3164,6 +3407,52 @@ def preview_questions():
     })
 
 
+@app.route('/admin/question-forecast')
+@login_required
+def question_forecast():
+    """Admin-only: how many more days each category can go before its
+    questions start repeating, from the schedule's cursors."""
+    if not current_user.email or current_user.email not in ADMIN_EMAILS:
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    conn = get_db()
+    cur = conn.cursor()
+    loaded_bank = question_bank()
+    result = {}
+
+    for difficulty in ['easy', 'hard']:
+        cursors = load_question_schedule(cur, loaded_bank, difficulty)
+        start = next_schedule_day(cur, difficulty)
+        pools = loaded_bank.for_difficulty(difficulty)
+        categories = {}
+        for cat_key in CATEGORIES:
+            cycle = cursors[cat_key][0]
+            remaining = remaining_in_cycle(loaded_bank, difficulty, cat_key, cursors[cat_key])
+            # Curated days don't draw from the schedule, so they push the end back
+            days = scheduled_days(loaded_bank, difficulty, start,
+                                  start + timedelta(days=remaining + len(loaded_bank.curated)))
+            last_day = list(itertools.islice(days, remaining))[-1] if remaining else None
+            categories[cat_key] = {
+                'pool_size': len(pools[cat_key]),
+                'cycle': cycle,
+                'days_remaining': remaining,
+                'last_unrepeated_day': last_day.isoformat() if last_day else None
+            }
+        first = min(categories.items(), key=lambda item: item[1]['days_remaining'])
+        result[difficulty] = {
+            'next_scheduled_day': start.isoformat(),
+            'days_remaining': first[1]['days_remaining'],
+            'first_exhausted_category': first[0],
+            'categories': categories
+        }
+    conn.close()
+
+    return jsonify({
+        'success': True,
+        'forecast': result
+    })
+
+
 # ============ GAME API ROUTES ============
 
 @app.route('/api/debug-time')
@@ -3181,10 +3470,107 @@ def debug_time():
     })
 
 
-@app.route('/api/health')
-def health_check():
-    """Health check endpoint with performance metrics for monitoring."""
-    import time
+@app.route('/metrics')
+def metrics():
+    """Prometheus text exposition, summed across gunicorn workers."""
+    if METRICS_TOKEN and request.headers.get('Authorization') != f'Bearer {METRICS_TOKEN}':
+        return Response('Forbidden', status=403)
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+# ============ HEALTH ============
+# /livez and /readyz are for the platform's probes and never touch the big
+# tables. /api/health keeps its row counts for humans and dashboards, but
+# serves a snapshot that is recomputed in the background at most every
+# HEALTH_SNAPSHOT_INTERVAL seconds, so frequent probes cost nothing.
+
+HEALTH_SNAPSHOT_INTERVAL = int(os.environ.get('HEALTH_SNAPSHOT_INTERVAL', 60))
+
+_probe_conn = None
+_probe_lock = threading.Lock()
+_health_snapshot = None
+_health_refreshing = False
+_health_lock = threading.Lock()
+
+
+def _connect_for_probes():
+    # A plain connection: it stays open for the life of the worker, so it is
+    # kept out of the request instrumentation and the connections-in-use gauge
+    if USE_POSTGRES:
+        import psycopg2
+        conn = psycopg2.connect(DATABASE_URL, connect_timeout=5)
+        conn.autocommit = True
+        return conn
+    return sqlite3.connect(DATABASE, timeout=5, check_same_thread=False)
+
+
+def probe_database():
+    """SELECT 1 on this worker's reused probe connection, reconnecting once if it has dropped."""
+    global _probe_conn
+    with _probe_lock:
+        for attempt in range(2):
+            try:
+                if _probe_conn is None:
+                    _probe_conn = _connect_for_probes()
+                cur = _probe_conn.cursor()
+                cur.execute('SELECT 1')
+                cur.fetchone()
+                return
+            except Exception:
+                try:
+                    _probe_conn.close()
+                except Exception:
+                    pass
+                _probe_conn = None
+                if attempt:
+                    raise
+
+
+def warm_daily_questions_cache():
+    """Load any of today's question sets missing from this worker's cache.
+    Returns 'warm' if nothing was missing, else 'warmed'."""
+    today = get_user_today().isoformat()
+    with _daily_questions_cache_lock:
+        missing = [difficulty for difficulty in ('easy', 'hard')
+                   if (today, difficulty) not in _daily_questions_cache]
+    for difficulty in missing:
+        get_daily_questions_for_user(None, difficulty=difficulty)
+    return 'warmed' if missing else 'warm'
+
+
+@app.route('/livez')
+def livez():
+    """Liveness: the worker is up and serving requests."""
+    return jsonify({'status': 'ok'})
+
+
+@app.route('/readyz')
+def readyz():
+    """Readiness: the database answers and the question bank is loaded.
+
+    Read-only: whether today's sets are cached is reported, not fixed. Filling
+    the cache can draw and store today's set, which is left to the post-fork
+    warm-up and the first request that needs it."""
+    try:
+        probe_database()
+        bank = question_bank()
+        if not bank.by_id:
+            raise RuntimeError('Question bank is empty')
+    except Exception as e:
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+    today = get_user_today().isoformat()
+    with _daily_questions_cache_lock:
+        cached = all((today, difficulty) in _daily_questions_cache for difficulty in ('easy', 'hard'))
+    return jsonify({'status': 'ready', 'cache': 'warm' if cached else 'cold'})
+
+
+def collect_health_snapshot():
+    """Row counts and how long they took to compute."""
     start = time.time()
 
     try:
@@ -3202,7 +3588,7 @@ def health_check():
         # Count today's games
         today = get_user_today().isoformat()
         ph = get_placeholder()
-        cur.execute(f"SELECT COUNT(DISTINCT user_id) as count FROM game_results WHERE game_date = {ph}", (today,))
+        cur.execute(f"SELECT COUNT(DISTINCT user_id) as count FROM game_results WHERE mode = 'daily' AND game_date = {ph}", (today,))
         today_players = cur.fetchone()['count']
 
         conn.close()
@@ -3222,7 +3608,7 @@ def health_check():
         if result_count > 100000 and db_time > 0.3:
             warnings.append('Large dataset - consider adding caching')
 
-        return jsonify({
+        return {
             'status': status,
             'timestamp': datetime.now().isoformat(),
             'metrics': {
@@ -3233,14 +3619,91 @@ def health_check():
             },
             'warnings': warnings if warnings else None,
             'database': 'postgresql' if USE_POSTGRES else 'sqlite'
-        })
+        }
 
     except Exception as e:
-        return jsonify({
+        return {
             'status': 'unhealthy',
             'error': str(e),
             'timestamp': datetime.now().isoformat()
-        }), 500
+        }
+
+
+def refresh_health_snapshot():
+    global _health_snapshot, _health_refreshing
+    snapshot = collect_health_snapshot()
+    with _health_lock:
+        _health_snapshot = (time.time(), snapshot)
+        _health_refreshing = False
+
+
+def get_health_snapshot():
+    """The latest snapshot and its age in seconds; a stale one is returned while
+    a background thread replaces it. Only a worker's first call waits."""
+    global _health_refreshing
+    with _health_lock:
+        current = _health_snapshot
+        stale = current is None or time.time() - current[0] >= HEALTH_SNAPSHOT_INTERVAL
+        start_refresh = stale and not _health_refreshing
+        if start_refresh:
+            _health_refreshing = True
+
+    if current is None:
+        if start_refresh:
+            refresh_health_snapshot()
+        else:
+            # Another thread is computing the first snapshot
+            while _health_snapshot is None and _health_refreshing:
+                time.sleep(0.05)
+        current = _health_snapshot or (time.time(), collect_health_snapshot())
+    elif start_refresh:
+        threading.Thread(target=refresh_health_snapshot, daemon=True).start()
+
+    collected_at, snapshot = current
+    return snapshot, round(time.time() - collected_at, 1)
+
+
+@app.route('/api/health')
+def health_check():
+    """Health check with table metrics for monitoring, served from a cached snapshot."""
+    snapshot, age = get_health_snapshot()
+    body = dict(snapshot, snapshot_age_seconds=age)
+    return jsonify(body), (500 if snapshot['status'] == 'unhealthy' else 200)
+
+
+# ============ PRELOAD ============
+# With gunicorn's preload_app (gunicorn.conf.py) the master imports this module
+# once, builds the read-only state below and forks the workers from it, so
+# they share those pages copy-on-write instead of each building its own.
+# Anything per-process (DB connections, metric files, caches that expire) is
+# set up after the fork instead.
+
+def warm_templates():
+    """Compile every template into Jinja's cache. Returns how many there are."""
+    names = app.jinja_env.list_templates()
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
+
+
+def preload():
+    """Build the shared read-only state in the gunicorn master, before it forks."""
+    bank = question_bank()
+    templates = warm_templates()
+    print(f"Preloaded {len(bank.by_id)} questions and {templates} templates")
+
+
+def after_fork(threads):
+    """Per-worker warm-up, run by gunicorn's post_fork hook: open this worker's
+    probe connection and load today's questions before the first request."""
+    # Metric values set in the master don't survive the fork
+    WORKER_THREADS.set(threads)
+    try:
+        probe_database()
+        warm_daily_questions_cache()
+    except Exception as e:
+        # Requests load today's sets on demand, so the worker can still start
+        print(f"Worker warm-up failed: {e}")
 
 
 @app.route('/api/reset-today', methods=['POST'])
@@ -3253,7 +3716,8 @@ def reset_today():
     ph = get_placeholder()
 
     # Delete today's game results (global questions row stays intact for other users)
-    cur.execute(f'DELETE FROM game_results WHERE user_id = {ph} AND game_date = {ph}', (current_user.id, today))
+    cur.execute(f"DELETE FROM game_results WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph}", (current_user.id, today))
+    cur.execute(f"DELETE FROM game_starts WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph}", (current_user.id, today))
 
     conn.commit()
     conn.close()
@@ -3283,8 +3747,281 @@ def get_user_from_request():
     return None, None
 
 
+def shuffled_options(q, game_date):
+    """q's options in an order fixed per question and day. The bank lists the
+    answer first, and the daily payload is public and cached, so it must
+    never go out in bank order; every copy of a day's payload still agrees."""
+    seed = hmac.new(app.secret_key.encode(), f'options:{game_date}:{question_id_for(q) or q["q"]}'.encode(),
+                    hashlib.sha256).digest()
+    options = list(q['options'])
+    random.Random(seed).shuffle(options)
+    return options
+
+
+def safe_questions(questions, game_date):
+    """Strip answers from a daily question set before sending it to the client."""
+    return [{
+        'category': q['category'],
+        'category_name': q['category_name'],
+        'color': q['color'],
+        'question': q['q'],
+        'options': shuffled_options(q, game_date),
+        'subcategory': q['sub']
+    } for q in questions]
+
+
+def build_bootstrap(conn, user, anonymous_id=None):
+    """Everything the play page needs on load, built from one users row and one connection."""
+    user_id = user['id']
+    difficulty = user['difficulty'] or 'easy'
+    played_today = get_played_difficulties_today(user_id, conn=conn)
+
+    game_date = get_user_today().isoformat()
+    questions = None
+    questions_url = None
+    if difficulty not in played_today:
+        # The token and answer key come from start-game, which records the start
+        daily = get_daily_questions_for_user(user_id, conn=conn, difficulty=difficulty)
+        questions = safe_questions(daily, game_date)
+        questions_url = url_for('daily_questions_payload', game_date=game_date, difficulty=difficulty,
+                                v=daily_set_version(daily))
+
+    return {
+        'success': True,
+        'authenticated': bool(user['google_id']),
+        'anonymous_id': anonymous_id,
+        'user': {
+            'id': user_id,
+            'username': user['username'],
+            'profile_picture': user['profile_picture']
+        },
+        'difficulty': difficulty,
+        'onboarding': onboarding_progress(user['onboarding_completed'] or 0),
+        'played_today': played_today,
+        'game_date': game_date,
+        'questions': questions,
+        'questions_url': questions_url
+    }
+
+
+def load_bootstrap_user(cur, anonymous_id=None):
+    """Fetch the users row for the logged-in user, or for an anonymous_id."""
+    ph = get_placeholder()
+    columns = 'id, username, google_id, profile_picture, difficulty, onboarding_completed'
+    if current_user.is_authenticated:
+        cur.execute(f'SELECT {columns} FROM users WHERE id = {ph}', (current_user.id,))
+        return cur.fetchone()
+    if anonymous_id:
+        cur.execute(f'SELECT {columns} FROM users WHERE anonymous_id = {ph}', (anonymous_id,))
+        return cur.fetchone()
+    return None
+
+
+@app.route('/api/bootstrap', methods=['POST'])
+def bootstrap():
+    """Identity, difficulty, onboarding progress, played-today state and today's
+    questions in one response. Creates an anonymous user if none is found, like
+    /api/anonymous-session, so the play page needs no other calls before starting."""
+    data = request.get_json(silent=True) or {}
+    anonymous_id = None
+    if not current_user.is_authenticated:
+        anonymous_id = data.get('anonymous_id') or request.cookies.get('uptriv_anonymous_id')
+
+    try:
+        conn = get_db()
+        cur = conn.cursor()
+        ph = get_placeholder()
+
+        user = load_bootstrap_user(cur, anonymous_id)
+        if not user and not current_user.is_authenticated:
+            adjectives = ['Swift', 'Clever', 'Bright', 'Quick', 'Sharp', 'Keen', 'Bold', 'Wise']
+            nouns = ['Owl', 'Fox', 'Eagle', 'Wolf', 'Hawk', 'Bear', 'Tiger', 'Lion']
+            username = f"{random.choice(adjectives)}{random.choice(nouns)}{random.randint(100, 999)}"
+            anonymous_id = str(uuid.uuid4())
+            cur.execute(
+                f'INSERT INTO users (username, anonymous_id) VALUES ({ph}, {ph})',
+                (username, anonymous_id)
+            )
+            conn.commit()
+            user = load_bootstrap_user(cur, anonymous_id)
+
+        if not user:
+            conn.close()
+            return jsonify({'success': False, 'error': 'No user session'}), 401
+
+        if anonymous_id:
+            # Record a visit so this user appears in admin active users
+            ip = request.headers.get('X-Forwarded-For', request.remote_addr)
+            if ip and ',' in ip:
+                ip = ip.split(',')[0].strip()
+            cur.execute(f'''
+                INSERT INTO visits (path, ip_address, user_agent, user_id)
+                VALUES ({ph}, {ph}, {ph}, {ph})
+            ''', ('/play', ip, request.user_agent.string[:500], user['id']))
+            conn.commit()
+
+        payload = build_bootstrap(conn, user, anonymous_id)
+        conn.close()
+
+        resp = jsonify(payload)
+        if anonymous_id:
+            resp.set_cookie('uptriv_anonymous_id', anonymous_id, max_age=365*24*60*60, samesite='Lax')
+        return resp
+    except Exception as e:
+        print(f"Error in bootstrap: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# Signed game tokens: start-game hands one out and answer submissions verify it
+# with HMAC instead of re-resolving the user and today's question set. The token
+# pins the set the user started with, so answering across midnight still works.
+GAME_TOKEN_MAX_AGE = 24 * 60 * 60
+game_token_serializer = URLSafeTimedSerializer(
+    app.secret_key, salt='uptriv-game', signer_kwargs={'digest_method': hashlib.sha256}
+)
+
+
+def issue_game_token(user_id, game_date, difficulty, questions, mode='daily'):
+    """Sign (user_id, game_date, difficulty, question IDs[, mode]) into a compact
+    token. Daily tokens leave the mode out."""
+    payload = [user_id, game_date, difficulty, [question_id_for(q) for q in questions]]
+    return game_token_serializer.dumps(payload if mode == 'daily' else payload + [mode])
+
+
+def record_game_start(user_id, game_date, mode, difficulty, conn):
+    """Record that a game's token was handed out. False if that game (user,
+    date, mode, difficulty) was already started: answers stay on the client
+    until the game ends, so without this, clearing storage mid-game and
+    starting again would replay the day."""
+    cur = conn.cursor()
+    ph = get_placeholder()
+    cur.execute(f'''
+        INSERT INTO game_starts (user_id, game_date, mode, difficulty) VALUES ({ph}, {ph}, {ph}, {ph})
+        ON CONFLICT DO NOTHING
+    ''', (user_id, game_date, mode, difficulty))
+    conn.commit()
+    return cur.rowcount > 0
+
+
+def read_game_token(token):
+    """Verify a game token. Returns (user_id, game_date, difficulty, questions, mode) or None."""
+    try:
+        user_id, game_date, difficulty, question_ids, *mode = game_token_serializer.loads(
+            token, max_age=GAME_TOKEN_MAX_AGE)
+        questions = questions_for_game(question_ids, difficulty)
+    except (BadSignature, KeyError, TypeError, ValueError):
+        return None
+    return user_id, game_date, difficulty, questions, mode[0] if mode else 'daily'
+
+
+# Answer keys: the play page checks answers itself, so it can show right or
+# wrong without a round trip, and sends the whole game to submit-answers at
+# the end. For each question the key holds sha256("<salt>:<index>:<option>")
+# of the correct option, and the salt is sent with it. That means the answer
+# key gives the answers away: a client can hash each option and know the
+# answer before picking one. It is a trade of secrecy for latency, not a way
+# of hiding answers. What it does guarantee is the stored result: the server
+# grades the batch from its own copy of the answers.
+
+def answer_key(user_id, game_date, difficulty, questions):
+    """{'salt', 'hashes'} for a game, one hash per question in order. Anyone
+    holding it can find every answer; only send it with the game's token."""
+    salt = hmac.new(app.secret_key.encode(), f'answers:{user_id}:{game_date}:{difficulty}'.encode(),
+                    hashlib.sha256).hexdigest()[:16]
+    return {
+        'salt': salt,
+        'hashes': [hashlib.sha256(f"{salt}:{index}:{q['a']}".encode()).hexdigest()
+                   for index, q in enumerate(questions)]
+    }
+
+
+def questions_for_game(question_ids, difficulty):
+    """A game's questions in order. IDs this worker's bank doesn't have (removed
+    by a reload, or added by one it hasn't picked up yet) come from the
+    questions table, so games in progress keep resolving."""
+    by_id = question_bank().by_id
+    if all(qid in by_id for qid in question_ids):
+        return [by_id[qid] for qid in question_ids]
+    conn = get_db()
+    resolved = resolve_questions(conn.cursor(), set(question_ids))
+    conn.close()
+    return [resolved[qid] if qid in by_id else dict(resolved[qid], difficulty=difficulty)
+            for qid in question_ids]
+
+
+def resolve_game(data):
+    """Work out who is answering which questions for which date, in which mode.
+
+    Uses the signed game_token when the client sends one; otherwise (only
+    submit-answer, which is sent live) falls back to the session and today's
+    daily set. Returns (user_id, game_date, mode,
+    questions), or an error response tuple as the fifth element."""
+    token = data.get('game_token')
+    if token:
+        game = read_game_token(token)
+        if not game:
+            return None, None, None, None, (jsonify({'error': 'Invalid or expired game token'}), 400)
+        user_id, game_date, difficulty, questions, mode = game
+        return user_id, game_date, mode, questions, None
+
+    user_id, username = get_user_from_request()
+    if not user_id:
+        return None, None, None, None, (jsonify({'error': 'No user session'}), 401)
+    return user_id, get_user_today().isoformat(), 'daily', get_daily_questions_for_user(user_id), None
+
+
+def daily_set_version(questions):
+    """Short fingerprint of a set's question IDs. start-game puts it in the
+    questions URL, so an admin flush that swaps today's set also changes the
+    URL, and no cache can pair a new token with old questions."""
+    ids = ','.join(str(question_id_for(q)) for q in questions)
+    return hashlib.sha256(ids.encode()).hexdigest()[:12]
+
+
+@app.route('/api/daily/<game_date>/<difficulty>')
+def daily_questions_payload(game_date, difficulty):
+    """A day's questions without answers, the same for every player, so
+    browsers and proxies may cache it: until the rollover for today's set
+    (an admin flush can still replace it, see daily_set_version), for good
+    for a past day's. Future days are not served."""
+    try:
+        day = date.fromisoformat(game_date)
+    except ValueError:
+        return jsonify({'error': 'No questions for that day'}), 404
+    today = get_user_today()
+    if difficulty not in ('easy', 'hard') or day > today:
+        return jsonify({'error': 'No questions for that day'}), 404
+    if day < today:
+        return archive_questions(day.isoformat(), difficulty)
+
+    questions = get_daily_questions_for_user(None, difficulty=difficulty)
+    version = daily_set_version(questions)
+    requested = request.args.get('v')
+    if requested and requested != version:
+        # This worker's cached set may predate a flush another worker served
+        _uncache_daily_questions(today.isoformat(), (difficulty,))
+        questions = get_daily_questions_for_user(None, difficulty=difficulty)
+        version = daily_set_version(questions)
+
+    response = jsonify({
+        'success': True,
+        'game_date': today.isoformat(),
+        'difficulty': difficulty,
+        'version': version,
+        'questions': safe_questions(questions, today.isoformat())
+    })
+    if requested and requested != version:
+        response.headers['Cache-Control'] = 'no-store'
+    else:
+        response.headers['Cache-Control'] = f'public, max-age={seconds_until_rollover()}'
+    return response
+
+
 @app.route('/api/start-game', methods=['POST'])
 def start_game():
+    """Start today's game at the user's difficulty: game_token, questions_url
+    and answer_key. The answer key lets the client check answers locally, so
+    it reveals them to anyone who hashes the options (see answer_key)."""
     try:
         user_id, username = get_user_from_request()
 
@@ -3294,6 +4031,18 @@ def start_game():
         # Get user's current difficulty and what they've played today
         current_difficulty = get_user_difficulty(user_id)
         played_today = get_played_difficulties_today(user_id)
+        game_date = get_user_today().isoformat()
+        restarted = False
+
+        if current_difficulty not in played_today:
+            # One token per game: a second start (say, after clearing storage
+            # mid-game) counts as having played
+            conn = get_db()
+            started = record_game_start(user_id, game_date, 'daily', current_difficulty, conn)
+            conn.close()
+            if not started:
+                restarted = True
+                played_today = played_today + [current_difficulty]
 
         # Check if they've already played at their current difficulty
         if current_difficulty in played_today:
@@ -3301,7 +4050,10 @@ def start_game():
             can_play_hard = 'easy' in played_today and 'hard' not in played_today
 
             # Customize message based on what they've played
-            if 'easy' in played_today and 'hard' in played_today:
+            if restarted:
+                message = (f"You already started today's {'Hard' if current_difficulty == 'hard' else 'Easy'} game, "
+                           "so it can't be played again. Come back tomorrow for new questions.")
+            elif 'easy' in played_today and 'hard' in played_today:
                 message = "You've completed both Easy and Hard mode today! Come back tomorrow for new questions."
             elif current_difficulty == 'hard' and 'hard' in played_today:
                 message = "You've already played Hard mode today! Come back tomorrow for new questions."
@@ -3316,7 +4068,7 @@ def start_game():
             cur.execute(f'''
                 SELECT category, correct, difficulty
                 FROM game_results
-                WHERE user_id = {ph} AND game_date = {ph}
+                WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph}
                 ORDER BY id
             ''', (user_id, today))
             rows = cur.fetchall()
@@ -3325,6 +4077,8 @@ def start_game():
             today_results = {}
             for diff in played_today:
                 diff_results = [r for r in rows if (r['difficulty'] or 'easy') == diff]
+                if not diff_results:
+                    continue
                 score = sum(1 for r in diff_results if r['correct'])
                 today_results[diff] = {
                     'score': score,
@@ -3340,24 +4094,18 @@ def start_game():
                 'today_results': today_results
             }), 400
 
-        questions = get_daily_questions_for_user(user_id)
-
-        safe_questions = []
-        for q in questions:
-            safe_questions.append({
-                'category': q['category'],
-                'category_name': q['category_name'],
-                'color': q['color'],
-                'question': q['q'],
-                'options': q['options'],
-                'subcategory': q['sub']
-            })
+        # The questions themselves come from the cacheable questions_url
+        questions = get_daily_questions_for_user(user_id, difficulty=current_difficulty)
 
         return jsonify({
             'success': True,
-            'questions': safe_questions,
             'user': {'id': user_id, 'username': username},
-            'game_date': get_user_today().isoformat()
+            'game_date': game_date,
+            'difficulty': current_difficulty,
+            'questions_url': url_for('daily_questions_payload', game_date=game_date, difficulty=current_difficulty,
+                                     v=daily_set_version(questions)),
+            'game_token': issue_game_token(user_id, game_date, current_difficulty, questions),
+            'answer_key': answer_key(user_id, game_date, current_difficulty, questions)
         })
     except Exception as e:
         import traceback
@@ -3366,44 +4114,103 @@ def start_game():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+def get_stored_answers(cur, user_id, game_date, difficulty, question_ids, mode='daily', idempotency_keys=()):
+    """Answers already stored for these questions, plus any stored under one of
+    idempotency_keys. Returns (correctness by question_id, stored row by
+    idempotency key)."""
+    ph = get_placeholder()
+    by_key_sql = ''
+    params = (user_id, mode, game_date, difficulty, *question_ids)
+    if idempotency_keys:
+        by_key_sql = f'OR (user_id = {ph} AND idempotency_key IN ({", ".join([ph] * len(idempotency_keys))}))'
+        params += (user_id, *idempotency_keys)
+    cur.execute(f'''
+        SELECT game_date, mode, difficulty, question_id, answer_index, options_version, correct, idempotency_key
+        FROM game_results
+        WHERE (user_id = {ph} AND mode = {ph} AND game_date = {ph} AND difficulty = {ph}
+               AND question_id IN ({', '.join([ph] * len(question_ids))}))
+        {by_key_sql}
+    ''', params)
+    stored = {}
+    by_key = {}
+    for row in cur.fetchall():
+        if str(row['game_date']) == game_date and row['mode'] == mode and row['difficulty'] == difficulty:
+            stored[row['question_id']] = bool(row['correct'])
+        if row['idempotency_key']:
+            by_key[row['idempotency_key']] = row
+    return stored, by_key
+
+
+def idempotency_conflict(by_key, row):
+    """True when the stored answer holding this insert row's idempotency key is
+    for another question, or gave another answer to the same one: a reused key
+    rather than a retry."""
+    key = row[10]
+    stored = by_key.get(key) if key else None
+    if not stored:
+        return False
+    if (str(stored['game_date']), stored['mode'], stored['difficulty'], stored['question_id']) != row[1:5]:
+        return True
+    return stored['options_version'] == row[6] and stored['answer_index'] != row[5]
+
+
 @app.route('/api/submit-answer', methods=['POST'])
 def submit_answer():
     data = request.get_json()
-    user_id, username = get_user_from_request()
+    user_id, game_date, mode, questions, error = resolve_game(data)
 
-    if not user_id:
-        return jsonify({'error': 'No user session'}), 401
+    if error:
+        return error
 
     question_index = data.get('question_index')
     answer = data.get('answer')
     time_taken = data.get('time_taken', 10)
 
-    questions = get_daily_questions_for_user(user_id)
-
-    if question_index < 0 or question_index >= len(questions):
+    if not isinstance(question_index, int) or question_index < 0 or question_index >= len(questions):
         return jsonify({'error': 'Invalid question'}), 400
 
     q = questions[question_index]
     correct = answer == q['a']
     difficulty = q.get('difficulty', 'easy')
+    question_id = question_id_for(q)
+    idempotency_key = data.get('idempotency_key') or request.headers.get('Idempotency-Key')
 
     conn = get_db()
     cur = conn.cursor()
     placeholder = '%s' if USE_POSTGRES else '?'
 
-    # Save the answer with difficulty
+    # Save the answer with difficulty; double-taps and retries hit the uniqueness key and are ignored
+    row = (user_id, game_date, mode, difficulty, question_id, answer_index_for(q, answer), options_version_for(q),
+           1 if correct else 0, time_ms_for(time_taken), q['category'], idempotency_key)
     cur.execute(f'''
-        INSERT INTO game_results (user_id, game_date, category, subcategory, question, correct_answer, user_answer, correct, time_taken, difficulty)
-        VALUES ({placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder})
-    ''', (user_id, get_user_today().isoformat(), q['category'], q['sub'], q['q'], q['a'], answer, 1 if correct else 0, time_taken, difficulty))
+        INSERT INTO game_results (user_id, game_date, mode, difficulty, question_id, answer_index, options_version, correct, time_ms, category, idempotency_key)
+        VALUES ({', '.join([placeholder] * 11)})
+        ON CONFLICT DO NOTHING
+    ''', row)
+    inserted = cur.rowcount
+
+    if inserted:
+        mark_questions_seen(cur, user_id, [question_id], [] if correct else [question_id])
+    else:
+        # Already answered: report what was stored the first time
+        stored, by_key = get_stored_answers(cur, user_id, game_date, difficulty, [question_id], mode,
+                                            [idempotency_key] if idempotency_key else ())
+        if idempotency_conflict(by_key, row):
+            conn.close()
+            return jsonify({'error': 'Idempotency key already used for a different answer'}), 409
+        if question_id in stored:
+            correct = stored[question_id]
     conn.commit()
+    if inserted and mode == 'daily':
+        # Answers sent one at a time arrive in order, so the last one completes the game
+        record_game_progress(difficulty, question_index == 0, question_index == len(questions) - 1)
 
     # Get stats for this question (how many got it right)
     cur.execute(f'''
         SELECT COUNT(*) as total, SUM(correct) as correct_count
         FROM game_results
-        WHERE question = {placeholder}
-    ''', (q['q'],))
+        WHERE question_id = {placeholder}
+    ''', (question_id,))
     stats = cur.fetchone()
     conn.close()
 
@@ -3419,6 +4226,381 @@ def submit_answer():
     })
 
 
+@app.route('/api/submit-answers', methods=['POST'])
+def submit_answers():
+    """Submit several answers for a game in one request.
+
+    Accepts all six answers or any subset (e.g. answers a client queued while
+    offline), writes them with one multi-row insert in one transaction, and
+    returns correctness and percentages for each. The game_token from
+    start-game is required: a queued batch may arrive after the rollover, and
+    without the token it would be graded against the new day's set."""
+    data = request.get_json(silent=True) or {}
+    answers = data.get('answers')
+
+    if not isinstance(answers, list) or not answers:
+        return jsonify({'error': 'answers must be a non-empty list'}), 400
+    if not data.get('game_token'):
+        return jsonify({'error': 'game_token is required'}), 400
+
+    user_id, game_date, mode, questions, error = resolve_game(data)
+
+    if error:
+        return error
+
+    rows = []
+    graded = []
+    seen_indexes = set()
+    for entry in answers:
+        question_index = entry.get('question_index') if isinstance(entry, dict) else None
+        if not isinstance(question_index, int) or question_index < 0 or question_index >= len(questions) \
+                or question_index in seen_indexes:
+            return jsonify({'error': 'Invalid question', 'question_index': question_index}), 400
+        seen_indexes.add(question_index)
+
+        q = questions[question_index]
+        answer = entry.get('answer')
+        correct = answer == q['a']
+        rows.append((user_id, game_date, mode, q.get('difficulty', 'easy'), question_id_for(q),
+                     answer_index_for(q, answer), options_version_for(q), 1 if correct else 0,
+                     time_ms_for(entry.get('time_taken', 10)), q['category'], entry.get('idempotency_key')))
+        graded.append((question_index, q, correct))
+
+    conn = get_db()
+    cur = conn.cursor()
+    ph = get_placeholder()
+
+    row_sql = '(' + ', '.join([ph] * 11) + ')'
+    cur.execute(f'''
+        INSERT INTO game_results (user_id, game_date, mode, difficulty, question_id, answer_index, options_version, correct, time_ms, category, idempotency_key)
+        VALUES {', '.join([row_sql] * len(rows))}
+        ON CONFLICT DO NOTHING
+        RETURNING question_id
+    ''', tuple(value for row in rows for value in row))
+    new_ids = {row['question_id'] for row in cur.fetchall()}
+    inserted = len(new_ids)
+    difficulty = questions[0].get('difficulty', 'easy')
+    game_ids = [question_id_for(q) for q in questions]
+    # How many of the game's answers are stored now, to tell when this batch completes it
+    stored_count = inserted
+
+    if inserted < len(rows):
+        # Some answers were already stored (a retried batch): report the stored results
+        stored, by_key = get_stored_answers(cur, user_id, game_date, difficulty, game_ids, mode,
+                                            [row[10] for row in rows if row[10]])
+        stored_count = len(stored)
+        conflicts = [i for (i, _, _), row in zip(graded, rows) if idempotency_conflict(by_key, row)]
+        if conflicts:
+            # A key reused for another answer: nothing in this batch is stored
+            conn.rollback()
+            conn.close()
+            return jsonify({'error': 'Idempotency key already used for a different answer',
+                            'question_indexes': conflicts}), 409
+        graded = [(i, q, stored.get(question_id_for(q), correct)) for i, q, correct in graded]
+    elif inserted < len(questions) and mode == 'daily':
+        # A fresh batch with part of the game: the rest may be stored already
+        stored_count = len(get_stored_answers(cur, user_id, game_date, difficulty, game_ids, mode)[0])
+    if inserted:
+        mark_questions_seen(cur, user_id, [row[4] for row in rows],
+                            [question_id_for(q) for _, q, correct in graded if not correct])
+    conn.commit()
+    if inserted and mode == 'daily':
+        record_game_progress(difficulty, game_ids[0] in new_ids, stored_count == len(questions))
+
+    # Stats for every answered question in one aggregate
+    question_ids = list({question_id_for(q) for _, q, _ in graded})
+    cur.execute(f'''
+        SELECT question_id, COUNT(*) as total, SUM(correct) as correct_count
+        FROM game_results
+        WHERE question_id IN ({', '.join([ph] * len(question_ids))})
+        GROUP BY question_id
+    ''', tuple(question_ids))
+    stats = {row['question_id']: row for row in cur.fetchall()}
+    conn.close()
+
+    results = []
+    for question_index, q, correct in graded:
+        row = stats.get(question_id_for(q))
+        total_answers = (row['total'] if row else 0) or 1
+        correct_count = (row['correct_count'] if row else 0) or 0
+        results.append({
+            'question_index': question_index,
+            'correct': correct,
+            'correct_answer': q['a'],
+            'percent_correct': round((correct_count / total_answers) * 100),
+            'total_answers': total_answers
+        })
+
+    return jsonify({'success': True, 'results': results})
+
+
+# ============ PRACTICE ============
+# Unlimited practice once the daily game is done. Each POST /api/practice
+# returns the next batch of questions the user has never answered, picked by
+# subcategory with weak subcategories weighted up. Answers go through
+# submit-answer / submit-answers with the batch's game token and are stored
+# with mode = 'practice', which stats, profiles and history leave out.
+#
+# A batch costs O(batch size), not a pass over the user's history: the seen
+# and missed sets are one bitset row, the bank keeps questions grouped by
+# subcategory, and each pick is a weighted subcategory draw plus a few random
+# probes of the bitset. A subcategory's weight is its share of seen questions
+# the user missed, counted with the bank's per-subcategory bitsets.
+#
+# Practice shares the daily pools, so it only serves questions that have
+# already been a past day's question: today's set and everything the
+# schedule hasn't reached yet are left out (see unreleased_daily_question_ids).
+
+PRACTICE_BATCH_SIZE = 6
+PRACTICE_MAX_BATCH_SIZE = 20
+PRACTICE_PROBES = 4
+# A subcategory the user always misses gets 1 + this weight; one they never miss gets 1
+PRACTICE_WEAKNESS_BOOST = 3
+
+
+def practice_weights(bank, seen, missed):
+    """Subcategory -> sampling weight from the user's seen and missed sets."""
+    weights = {}
+    for sub, bits in bank.sub_bits.items():
+        total = (seen & bits).bit_count()
+        if total:
+            # Smoothed miss rate, so two answers don't decide a subcategory
+            miss_rate = ((missed & bits).bit_count() + 1) / (total + 2)
+            weights[sub] = 1 + PRACTICE_WEAKNESS_BOOST * miss_rate
+    return weights
+
+
+def sample_practice_questions(bank, difficulty, weights, exclude_bits, count, rng=random):
+    """Up to count questions whose IDs aren't in exclude_bits. Each pick draws a
+    subcategory by weight (unplayed ones count as an even miss rate) and probes
+    it at random; a subcategory with nothing left unseen is dropped."""
+    pools = bank.by_subcategory[difficulty]
+    subs = list(pools)
+    default_weight = 1 + PRACTICE_WEAKNESS_BOOST / 2
+    sub_weights = [weights.get(sub, default_weight) for sub in subs]
+    picked = []
+    while len(picked) < count and subs:
+        i = rng.choices(range(len(subs)), weights=sub_weights)[0]
+        pool = pools[subs[i]]
+        q = None
+        for _ in range(PRACTICE_PROBES):
+            candidate = pool[rng.randrange(len(pool))]
+            if not has_seen(exclude_bits, candidate.id):
+                q = candidate
+                break
+        if q is None:
+            unseen = [candidate for candidate in pool if not has_seen(exclude_bits, candidate.id)]
+            if not unseen:
+                del subs[i], sub_weights[i]
+                continue
+            q = rng.choice(unseen)
+        picked.append(q)
+        exclude_bits |= 1 << q.id
+    return picked
+
+
+@app.route('/api/practice', methods=['POST'])
+def practice():
+    """Next batch of practice questions.
+
+    Takes an optional difficulty (default: the user's), count (default 6, at
+    most 20) and previous_token: the last batch's game token, so a client can
+    fetch ahead before answering it without getting the same questions."""
+    data = request.get_json(silent=True) or {}
+    user_id, username = get_user_from_request()
+    if not user_id:
+        return jsonify({'error': 'No user session'}), 401
+
+    count = data.get('count', PRACTICE_BATCH_SIZE)
+    if not isinstance(count, int) or not 1 <= count <= PRACTICE_MAX_BATCH_SIZE:
+        return jsonify({'error': f'count must be between 1 and {PRACTICE_MAX_BATCH_SIZE}'}), 400
+    difficulty = data.get('difficulty')
+    if difficulty not in (None, 'easy', 'hard'):
+        return jsonify({'error': 'Invalid difficulty'}), 400
+
+    bank = question_bank()
+    conn = get_db()
+    cur = conn.cursor()
+    difficulty = difficulty or get_user_difficulty(user_id, conn)
+    seen, missed = get_seen_questions(cur, [user_id])[user_id]
+    exclude = seen | unreleased_daily_question_ids(cur, bank, difficulty)
+    conn.close()
+
+    previous = read_game_token(data['previous_token']) if data.get('previous_token') else None
+    if previous and previous[0] == user_id:
+        exclude |= seen_bits(question_id_for(q) for q in previous[3])
+
+    questions = sample_practice_questions(bank, difficulty, practice_weights(bank, seen, missed), exclude, count)
+    exclude |= seen_bits(q.id for q in questions)
+    return jsonify({
+        'success': True,
+        'difficulty': difficulty,
+        'questions': safe_questions(questions, get_user_today().isoformat()),
+        'game_token': issue_game_token(user_id, get_user_today().isoformat(), difficulty, questions,
+                                       mode='practice') if questions else None,
+        'remaining': (bank.id_bits[difficulty] & ~exclude).bit_count(),
+    })
+
+
+# ============ ARCHIVE ============
+# Past days' daily sets, playable any time. GET /api/archive lists the days
+# with a stored set, GET /api/archive/<date>/<difficulty> returns a day's
+# questions without answers, and POST /api/archive/start hands out a game
+# token for it. Answers go through submit-answer / submit-answers and are
+# stored with mode = 'archive' under the archived date, so they never count
+# as that day's daily game (start-game, streaks, history, stats, leaderboards).
+#
+# A past day's set never changes, so each day's payload is built once per
+# worker, kept in a small LRU and served with a year-long immutable
+# Cache-Control for browsers and proxies to keep too.
+
+ARCHIVE_CACHE_SIZE = 512
+ARCHIVE_MAX_AGE = 365 * 24 * 60 * 60
+
+_archive_cache = {}
+_archive_cache_lock = threading.Lock()
+
+
+def seconds_until_rollover():
+    """Seconds until get_user_today() moves to the next day."""
+    from datetime import timezone
+    central_now = datetime.now(timezone.utc) + timedelta(hours=-6)
+    next_day = datetime.combine(central_now.date() + timedelta(days=1), datetime.min.time(), timezone.utc)
+    return max(1, int((next_day - central_now).total_seconds()))
+
+
+def archived_game(game_date, difficulty):
+    """(questions, response body) for a past day's stored set, or None.
+    game_date must be before today: only past sets are final."""
+    key = (game_date, difficulty)
+    with _archive_cache_lock:
+        # Re-inserting on a hit keeps the dict in least-recently-used order
+        cached = _archive_cache.pop(key, None)
+        if cached:
+            _archive_cache[key] = cached
+    if cached:
+        CACHE_LOOKUPS.labels('archive', 'hit').inc()
+        return cached
+    CACHE_LOOKUPS.labels('archive', 'miss').inc()
+
+    conn = get_db()
+    cur = conn.cursor()
+    ph = get_placeholder()
+    cur.execute(
+        f'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+        (game_date, difficulty)
+    )
+    row = cur.fetchone()
+    questions = stored_daily_set(cur, row['questions_json']) if row else None
+    conn.close()
+    if not row:
+        return None
+
+    body = json.dumps({
+        'success': True,
+        'game_date': game_date,
+        'difficulty': difficulty,
+        'questions': safe_questions(questions, game_date)
+    })
+    with _archive_cache_lock:
+        while len(_archive_cache) >= ARCHIVE_CACHE_SIZE:
+            _archive_cache.pop(next(iter(_archive_cache)))
+        _archive_cache[key] = (questions, body)
+    return questions, body
+
+
+def parse_archive_date(value):
+    """The date if it's a valid ISO date before today, else None."""
+    try:
+        game_date = date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return game_date.isoformat() if game_date < get_user_today() else None
+
+
+@app.route('/api/archive')
+def archive_dates():
+    """Past days with a stored set, newest first, with their difficulties."""
+    conn = get_db()
+    cur = conn.cursor()
+    ph = get_placeholder()
+    cur.execute(f'''
+        SELECT game_date, difficulty FROM daily_questions
+        WHERE user_id IS NULL AND game_date < {ph}
+        ORDER BY game_date DESC
+    ''', (get_user_today().isoformat(),))
+    rows = cur.fetchall()
+    conn.close()
+
+    days = {}
+    for row in rows:
+        days.setdefault(str(row['game_date']), []).append(row['difficulty'] or 'easy')
+    response = jsonify({
+        'success': True,
+        'dates': [{'date': day, 'difficulties': sorted(difficulties)} for day, difficulties in days.items()]
+    })
+    # The list only grows at the rollover
+    response.headers['Cache-Control'] = f'public, max-age={seconds_until_rollover()}'
+    return response
+
+
+@app.route('/api/archive/<game_date>/<difficulty>')
+def archive_questions(game_date, difficulty):
+    """A past day's questions without answers. Public and immutable."""
+    game_date = parse_archive_date(game_date)
+    if not game_date or difficulty not in ('easy', 'hard'):
+        return jsonify({'error': 'Not an archived day'}), 404
+    game = archived_game(game_date, difficulty)
+    if not game:
+        return jsonify({'error': 'Not an archived day'}), 404
+
+    response = Response(game[1], mimetype='application/json')
+    response.headers['Cache-Control'] = f'public, max-age={ARCHIVE_MAX_AGE}, immutable'
+    return response
+
+
+@app.route('/api/archive/start', methods=['POST'])
+def start_archive_game():
+    """Game token for a past day's set. Takes date and difficulty; the
+    questions come from GET /api/archive/<date>/<difficulty>. A day already
+    played as that day's daily game can't be replayed."""
+    data = request.get_json(silent=True) or {}
+    user_id, username = get_user_from_request()
+    if not user_id:
+        return jsonify({'error': 'No user session'}), 401
+
+    game_date = parse_archive_date(data.get('date'))
+    difficulty = data.get('difficulty')
+    if not game_date or difficulty not in ('easy', 'hard'):
+        return jsonify({'error': 'Not an archived day'}), 404
+    game = archived_game(game_date, difficulty)
+    if not game:
+        return jsonify({'error': 'Not an archived day'}), 404
+
+    conn = get_db()
+    cur = conn.cursor()
+    ph = get_placeholder()
+    cur.execute(
+        f"SELECT COUNT(*) as count FROM game_results WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph} AND difficulty = {ph}",
+        (user_id, game_date, difficulty)
+    )
+    played = cur.fetchone()['count'] > 0
+    conn.close()
+    if played:
+        return jsonify({'error': 'already_played', 'message': 'You played this day when it was live.'}), 400
+
+    questions = game[0]
+    if not questions:
+        return jsonify({'error': 'This day can no longer be played'}), 410
+    return jsonify({
+        'success': True,
+        'game_date': game_date,
+        'difficulty': difficulty,
+        'questions_url': url_for('archive_questions', game_date=game_date, difficulty=difficulty),
+        'game_token': issue_game_token(user_id, game_date, difficulty, questions, mode='archive')
+    })
+
+
 @app.route('/api/dismiss-recommendation', methods=['POST'])
 def dismiss_recommendation():
     if not current_user.is_authenticated:
@@ -3530,36 +4712,39 @@ def get_history():
             conn.close()
             return jsonify({'error': 'User not found', 'games': []})
 
-        # Simple query without the LIKE filter to test
         cur.execute(f'''
-            SELECT game_date, category, subcategory, question, correct_answer, user_answer, correct, time_taken, COALESCE(difficulty, 'easy') as difficulty
+            SELECT game_date, category, question_id, answer_index, options_version, correct, time_ms, COALESCE(difficulty, 'easy') as difficulty
             FROM game_results
-            WHERE user_id = {placeholder}
-            ORDER BY created_at DESC
+            WHERE user_id = {placeholder} AND mode = 'daily'
+            ORDER BY game_date DESC, id DESC
         ''', (user_id,))
-        all_results = cur.fetchall()
+        results = cur.fetchall()
 
-        # Filter out onboarding in Python instead of SQL
-        results = [r for r in all_results if not str(r['game_date']).startswith('onboarding')]
-
-        # Get percentage stats for all questions this user has answered
-        questions_list = list(set(r['question'] for r in results))
+        # Get percentage stats for all questions this user has answered, in one aggregate
+        question_ids = list(set(r['question_id'] for r in results))
+        questions_by_id = resolve_questions(cur, question_ids)
         question_stats = {}
-        for q in questions_list:
+        if question_ids:
             cur.execute(f'''
-                SELECT COUNT(*) as total, SUM(correct) as correct_count
-                FROM game_results WHERE question = {placeholder}
-            ''', (q,))
-            stats = cur.fetchone()
-            total = stats['total'] or 1
-            correct_count = stats['correct_count'] or 0
-            question_stats[q] = round((correct_count / total) * 100)
+                SELECT question_id, COUNT(*) as total, SUM(correct) as correct_count
+                FROM game_results WHERE question_id IN ({', '.join([placeholder] * len(question_ids))})
+                GROUP BY question_id
+            ''', tuple(question_ids))
+            for stats in cur.fetchall():
+                total = stats['total'] or 1
+                correct_count = stats['correct_count'] or 0
+                question_stats[stats['question_id']] = round((correct_count / total) * 100)
+        user_answers = decode_answers(cur, results, questions_by_id)
 
         conn.close()
 
         # Group by date AND difficulty (so easy and hard on same day are separate rows)
         games = {}
-        for r in results:
+        for r, user_answer in zip(results, user_answers):
+            q = questions_by_id.get(r['question_id'])
+            if q is None:
+                # Logged by resolve_questions; nothing to show for it
+                continue
             game_date = r['game_date'] if isinstance(r['game_date'], str) else r['game_date'].isoformat()
             difficulty = r['difficulty'] or 'easy'
             game_key = f"{game_date}_{difficulty}"
@@ -3576,12 +4761,12 @@ def get_history():
                 'category': r['category'],
                 'category_name': CATEGORIES.get(r['category'], {}).get('name', r['category']),
                 'color': CATEGORIES.get(r['category'], {}).get('color', '#888'),
-                'question': r['question'],
-                'correct_answer': r['correct_answer'],
-                'user_answer': r['user_answer'] or '(No answer)',
+                'question': q['q'],
+                'correct_answer': q['a'],
+                'user_answer': user_answer,
                 'correct': r['correct'],
-                'time_taken': round(r['time_taken'], 1),
-                'percent_correct': question_stats.get(r['question'], 0)
+                'time_taken': round(r['time_ms'] / 1000, 1),
+                'percent_correct': question_stats.get(r['question_id'], 0)
             })
             games[game_key]['total'] += 1
             if r['correct']:
@@ -3594,8 +4779,7 @@ def get_history():
             'debug': {
                 'user_id': user_id,
                 'auth_method': auth_method,
-                'total_results': len(all_results),
-                'filtered_results': len(results),
+                'total_results': len(results),
                 'total_games': len(games_list)
             }
         })
@@ -3630,8 +4814,8 @@ def get_share_text():
     cur.execute(f'''
         SELECT category, correct
         FROM game_results
-        WHERE user_id = {placeholder} AND game_date = {placeholder} AND difficulty = {placeholder}
-        ORDER BY created_at ASC
+        WHERE user_id = {placeholder} AND mode = 'daily' AND game_date = {placeholder} AND difficulty = {placeholder}
+        ORDER BY id
     ''', (user_id, game_date, difficulty))
     results = cur.fetchall()
     conn.close()
@@ -3669,8 +4853,9 @@ def api_get_friends():
     friends = get_friends(current_user.id)
 
     # Add stats for each friend
+    stats_by_user = calculate_users_stats([friend['id'] for friend in friends])
     for friend in friends:
-        stats = calculate_user_stats(friend['id'])
+        stats = stats_by_user[friend['id']]
         friend['stats'] = {
             'overall_percentage': stats['overall_percentage'],
             'total_games': stats['total_games']
@@ -3810,6 +4995,18 @@ def api_remove_friend(friend_id):
     return jsonify({'success': True})
 
 
+def send_email(to, subject, html):
+    """Send one email through Resend, importing it on first use."""
+    import resend
+    resend.api_key = RESEND_API_KEY
+    resend.Emails.send({
+        "from": "UpTriv <noreply@uptriv.com>",
+        "to": [to],
+        "subject": subject,
+        "html": html,
+    })
+
+
 @app.route('/api/friends/invite', methods=['POST'])
 @login_required
 def api_invite_friend():
@@ -3859,17 +5056,12 @@ def api_invite_friend():
 
     # Try to send email, but always return the link as fallback
     email_sent = False
-    if resend.api_key:
+    if RESEND_API_KEY:
         try:
-            resend.Emails.send({
-                "from": "UpTriv <noreply@uptriv.com>",
-                "to": [email],
-                "subject": f"{current_user.username} invited you to play trivia",
-                "html": f'''<p>Hey!</p>
+            send_email(email, f"{current_user.username} invited you to play trivia", f'''<p>Hey!</p>
 <p>{current_user.username} thinks you'd like UpTriv — it's a daily trivia game (like Wordle but for trivia). 6 questions, takes about 2 minutes.</p>
 <p>Here's your invite link: <a href="{invite_url}">{invite_url}</a></p>
-<p>See you there!</p>'''
-            })
+<p>See you there!</p>''')
             email_sent = True
         except Exception as e:
             print(f"Resend email error: {e}")
@@ -3934,8 +5126,9 @@ def api_leaderboard():
     category_leaderboards_normal = {cat: [] for cat in CATEGORIES}
     category_leaderboards_expert = {cat: [] for cat in CATEGORIES}
 
+    stats_by_user = calculate_users_stats([user['id'] for user in all_users])
     for user in all_users:
-        stats = calculate_user_stats(user['id'])
+        stats = stats_by_user[user['id']]
         user_info = {
             'id': user['id'],
             'username': user['username'],
@@ -4072,11 +5265,9 @@ def api_leaderboard():
 
 # Initialize database on app load (works with gunicorn)
 try:
-    print("Starting database initialization...")
-    print(f"USE_POSTGRES: {USE_POSTGRES}")
-    print(f"DATABASE_URL set: {bool(DATABASE_URL)}")
     init_db()
-    print("Database initialized successfully!")
+    print(f"Database ready ({'PostgreSQL' if USE_POSTGRES else 'SQLite'}); Google OAuth "
+          f"{'configured' if GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET else 'NOT configured - missing credentials'}")
 except Exception as e:
     print(f"ERROR initializing database: {e}")
     import traceback
@@ -0,0 +1,91 @@
+"""Gunicorn hooks, read automatically from the working directory.
+
+The Procfile still sets workers, threads and timeout on the command line.
+This file sets up:
+
+- Preloading: the master imports the app, builds the question bank and
+  compiles the templates, then gc.freeze()s everything so the workers share
+  those pages copy-on-write. Each worker then opens its probe connection and
+  loads today's questions in post_fork. GUNICORN_PRELOAD=0 turns preloading
+  off, and each worker imports the app itself as before.
+- Prometheus multiprocess mode: each worker writes its metrics to
+  PROMETHEUS_MULTIPROC_DIR and /metrics sums them.
+
+Boot time and memory use are logged for the master and for each worker.
+"""
+import gc
+import os
+import shutil
+import tempfile
+import time
+
+_config_loaded_at = time.perf_counter()
+
+# One directory per master, so two servers on one machine don't mix samples
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR',
+                      os.path.join(tempfile.gettempdir(), f'uptriv-prometheus-{os.getpid()}'))
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+if preload_app:
+    # A collection during the import would free objects in the middle of pages
+    # that later allocations then dirty; collection resumes after gc.freeze()
+    gc.disable()
+
+
+def memory_mb():
+    """RSS and private (unshared) memory of this process in MB, or None off Linux."""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line and not line.startswith(' '))
+    except OSError:
+        return None
+    kb = {key: int(value.split()[0]) for key, value in fields.items() if value.strip().endswith('kB')}
+    return kb['Rss'] / 1024, (kb['Private_Clean'] + kb['Private_Dirty']) / 1024
+
+
+def describe_memory():
+    memory = memory_mb()
+    return f'rss {memory[0]:.1f} MB, private {memory[1]:.1f} MB' if memory else 'memory use unavailable'
+
+
+def on_starting(server):
+    # Files left by an earlier master would be summed into this one's metrics
+    path = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    # Workers read this for the pool utilisation denominator
+    os.environ['GUNICORN_THREADS'] = str(server.cfg.threads)
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        import app
+        app.preload()
+        # Move everything built so far out of the collector's reach: a
+        # collection would otherwise write to every object's header and
+        # unshare the pages in each worker
+        gc.freeze()
+        gc.enable()
+    server.log.info('Master ready in %.2fs (%s preloaded), %s',
+                    time.perf_counter() - _config_loaded_at,
+                    f'{gc.get_freeze_count():,} objects' if server.cfg.preload_app else 'nothing',
+                    describe_memory())
+
+
+def post_fork(server, worker):
+    started = time.perf_counter()
+    # Already imported by the master when preloading; otherwise this is the
+    # worker's own import, which gunicorn then reuses
+    import app
+    app.after_fork(server.cfg.threads)
+    server.log.info('Worker %s warmed up in %.2fs, %s', worker.pid, time.perf_counter() - started, describe_memory())
+
+
+def child_exit(server, worker):
+    # Drop a dead worker's live gauges (connections in use, threads)
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def on_exit(server):
+    shutil.rmtree(os.environ['PROMETHEUS_MULTIPROC_DIR'], ignore_errors=True)
@@ -0,0 +1,342 @@
+"""The trivia question bank: categories, the easy/hard/onboarding questions,
+curated daily picks and learning resources.
+
+data/questions.json is the file to edit. tools/build_questions.py validates
+it, assigns IDs to new questions and writes data/questions.bin, the compiled
+tuples in marshal format, which loads faster than the JSON parses and, unlike
+pickle, can't run code if someone swaps the file. load() uses the .bin
+when it was built from the current questions.json and compiles the JSON
+otherwise, so a forgotten build step costs start-up time, never correctness.
+
+This module has no side effects on import, so the build tool can use it
+without starting the app.
+"""
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+from collections.abc import Mapping
+from datetime import date
+
+# QUESTION_BANK_DIR points at another copy, e.g. on a volume that can be updated without a deploy
+DATA_DIR = os.environ.get('QUESTION_BANK_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+SOURCE_PATH = os.path.join(DATA_DIR, 'questions.json')
+ARTIFACT_PATH = os.path.join(DATA_DIR, 'questions.bin')
+
+# Bump when the compiled layout changes; older .bin files are then ignored
+ARTIFACT_FORMAT = 2
+
+logger = logging.getLogger(__name__)
+
+# path -> ((st_size, st_mtime_ns), sha256) of the last source_digest() call
+_source_digests = {}
+
+# Categories and their subcategories
+CATEGORIES = {
+    'news': {
+        'name': 'World & U.S. News',
+        'icon': 'globe',
+        'color': '#FF6B6B',
+        'subcategories': ['current_events', 'politics', 'famous_people', 'world_affairs']
+    },
+    'history': {
+        'name': 'History',
+        'icon': 'landmark',
+        'color': '#4ECDC4',
+        'subcategories': ['ancient', 'medieval', 'modern', 'wars', 'presidents', 'world_history']
+    },
+    'science': {
+        'name': 'Science & Nature',
+        'icon': 'flask',
+        'color': '#45B7D1',
+        'subcategories': ['space', 'animals', 'human_body', 'physics', 'chemistry', 'earth_science']
+    },
+    'entertainment': {
+        'name': 'Entertainment',
+        'icon': 'film',
+        'color': '#96CEB4',
+        'subcategories': ['movies', 'tv', 'music_pre1990', 'music_post1990', 'celebrities', 'literature']
+    },
+    'sports': {
+        'name': 'Sports',
+        'icon': 'trophy',
+        'color': '#FFEAA7',
+        'subcategories': ['football', 'basketball', 'baseball', 'soccer', 'olympics', 'records']
+    },
+    'geography': {
+        'name': 'Geography',
+        'icon': 'map',
+        'color': '#DDA0DD',
+        'subcategories': ['countries', 'capitals', 'landmarks', 'maps', 'flags', 'continents']
+    }
+}
+
+
+class QuestionBankError(ValueError):
+    """questions.json failed validation; args[0] lists every problem found."""
+
+    def __init__(self, problems):
+        super().__init__(problems)
+        self.problems = problems
+
+    def __str__(self):
+        return '\n'.join(self.problems)
+
+
+class Question(Mapping):
+    """One bank question.
+
+    Reads like the dicts the bank used to hold (q['q'], q['a'], q.get('difficulty'),
+    {**q}), but keeps its fields in slots with the answer as an index into the
+    options tuple, and shares repeated strings (categories, subcategories,
+    common options) between questions."""
+
+    __slots__ = ('id', 'q', 'options', 'answer_index', 'category', 'sub', 'difficulty',
+                 'category_name', 'color')
+    KEYS = ('id', 'q', 'a', 'options', 'sub', 'category', 'category_name', 'color', 'difficulty')
+
+    def __init__(self, question_id, text, options, answer_index, category, sub, difficulty):
+        self.id = question_id
+        self.q = text
+        self.options = tuple(sys.intern(option) for option in options)
+        self.answer_index = answer_index
+        self.category = sys.intern(category)
+        self.sub = sys.intern(sub)
+        self.difficulty = sys.intern(difficulty)
+        self.category_name = CATEGORIES[category]['name']
+        self.color = CATEGORIES[category]['color']
+
+    @property
+    def a(self):
+        return self.options[self.answer_index]
+
+    def __getitem__(self, key):
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return f'<Question {self.id} {self.category}/{self.sub}: {self.q!r}>'
+
+
+class QuestionBank:
+    """The compiled bank, indexed the ways the app reads it."""
+
+    def __init__(self, compiled):
+        self.digest = compiled['source_sha256']
+        self.next_id = compiled['next_id']
+        self.easy = {}
+        self.hard = {}
+        onboarding = []
+        self.by_id = {}
+        for question_id, bank, category, sub, text, options, answer_index in compiled['questions']:
+            q = Question(question_id, text, options, answer_index, category, sub,
+                         'hard' if bank == 'hard' else 'easy')
+            self.by_id[question_id] = q
+            if bank == 'onboarding':
+                onboarding.append(q)
+            else:
+                getattr(self, bank).setdefault(category, []).append(q)
+        self.onboarding = tuple(onboarding)
+        self.ids_by_text = {q.q: question_id for question_id, q in self.by_id.items()}
+        # Practice mode: questions grouped by subcategory, and every ID of the
+        # difficulty as a bitset (bit n for question n) to count against a user's seen set
+        self.by_subcategory = {}
+        self.id_bits = {}
+        # Every ID of each subcategory, across all banks, for practice weights
+        self.sub_bits = {}
+        for question_id, q in self.by_id.items():
+            self.sub_bits[q.sub] = self.sub_bits.get(q.sub, 0) | 1 << question_id
+        for difficulty in ('easy', 'hard'):
+            by_sub = {}
+            bits = 0
+            for questions in getattr(self, difficulty).values():
+                for q in questions:
+                    by_sub.setdefault(q.sub, []).append(q)
+                    bits |= 1 << q.id
+            self.by_subcategory[difficulty] = {sub: tuple(questions) for sub, questions in by_sub.items()}
+            self.id_bits[difficulty] = bits
+        self.curated = compiled['curated']
+        self.learning_resources = compiled['learning_resources']
+
+    def for_difficulty(self, difficulty):
+        """Category -> questions for daily play at this difficulty."""
+        return self.hard if difficulty == 'hard' else self.easy
+
+
+def source_digest(path=SOURCE_PATH):
+    """sha256 of the file, rehashed only when its size or mtime changed."""
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _source_digests.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _source_digests[path] = (key, digest)
+    return digest
+
+
+def normalized_text(text):
+    return ' '.join(text.split()).casefold()
+
+
+def validate(source):
+    """Every problem with a parsed questions.json, as readable strings."""
+    problems = []
+    if not isinstance(source.get('next_id'), int):
+        problems.append('next_id must be an integer')
+    next_id = source.get('next_id') if isinstance(source.get('next_id'), int) else float('inf')
+    seen_ids = {}
+    texts_by_bank = {}
+
+    def check_question(where, q, category, bank):
+        if not isinstance(q, dict):
+            problems.append(f'{where}: not an object')
+            return
+        label = f"{where} (id {q.get('id')})"
+        unknown = set(q) - {'id', 'q', 'a', 'options', 'sub', 'category'}
+        if unknown:
+            problems.append(f'{label}: unknown keys {sorted(unknown)}')
+        question_id = q.get('id')
+        if not isinstance(question_id, int) or question_id <= 0:
+            problems.append(f'{label}: id must be a positive integer (run tools/build_questions.py)')
+        elif question_id in seen_ids:
+            problems.append(f'{label}: id also used by {seen_ids[question_id]}')
+        elif question_id >= next_id:
+            problems.append(f'{label}: id is not below next_id {next_id}')
+        else:
+            seen_ids[question_id] = where
+        if category not in CATEGORIES:
+            problems.append(f'{label}: unknown category {category!r}')
+        text = q.get('q')
+        if not isinstance(text, str) or not text.strip():
+            problems.append(f'{label}: q must be non-empty text')
+        else:
+            key = normalized_text(text)
+            if key in texts_by_bank.setdefault(bank, {}):
+                problems.append(f'{label}: duplicate of {texts_by_bank[bank][key]}')
+            texts_by_bank[bank][key] = where
+        options = q.get('options')
+        if not isinstance(options, list) or len(options) < 2 or \
+                not all(isinstance(o, str) and o.strip() for o in options):
+            problems.append(f'{label}: options must be a list of at least two non-empty strings')
+        elif len(set(options)) != len(options):
+            problems.append(f'{label}: options repeat')
+        elif q.get('a') not in options:
+            problems.append(f"{label}: answer {q.get('a')!r} is not one of the options")
+        if not isinstance(q.get('sub'), str) or not q.get('sub'):
+            problems.append(f'{label}: sub must be non-empty text')
+
+    for bank in ('easy', 'hard'):
+        categories = source.get(bank)
+        if not isinstance(categories, dict):
+            problems.append(f'{bank} must map category -> list of questions')
+            continue
+        for category in CATEGORIES:
+            if not categories.get(category):
+                problems.append(f'{bank}: no {category} questions (every daily set needs one)')
+        for category, questions in categories.items():
+            for i, q in enumerate(questions if isinstance(questions, list) else []):
+                check_question(f'{bank}.{category}[{i}]', q, category, bank)
+
+    onboarding = source.get('onboarding')
+    if not isinstance(onboarding, list):
+        problems.append('onboarding must be a list of questions')
+    else:
+        for i, q in enumerate(onboarding):
+            check_question(f'onboarding[{i}]', q, q.get('category') if isinstance(q, dict) else None, 'onboarding')
+
+    for day, picks in (source.get('curated') or {}).items():
+        try:
+            date.fromisoformat(day)
+        except ValueError:
+            problems.append(f'curated: {day!r} is not a YYYY-MM-DD date')
+        for difficulty, by_category in picks.items():
+            bank = source.get(difficulty) if difficulty in ('easy', 'hard') else None
+            if not isinstance(bank, dict):
+                problems.append(f'curated.{day}: unknown difficulty {difficulty!r}')
+                continue
+            for category, text in by_category.items():
+                if not any(isinstance(q, dict) and q.get('q') == text for q in bank.get(category) or []):
+                    problems.append(f'curated.{day}.{difficulty}.{category}: no {difficulty} {category} question {text!r}')
+
+    for category, subs in (source.get('learning_resources') or {}).items():
+        if category not in CATEGORIES:
+            problems.append(f'learning_resources: unknown category {category!r}')
+        for sub, resources in subs.items():
+            for i, resource in enumerate(resources):
+                if not isinstance(resource.get('title'), str) or not isinstance(resource.get('type'), str):
+                    problems.append(f'learning_resources.{category}.{sub}[{i}]: needs type and title')
+    return problems
+
+
+def compile_source(source, digest):
+    """The compact form of a parsed questions.json: one tuple per question,
+    (id, bank, category, sub, text, options, answer_index), in file order.
+    Raises QuestionBankError if the source doesn't validate."""
+    problems = validate(source)
+    if problems:
+        raise QuestionBankError(problems)
+    questions = []
+    for bank in ('easy', 'hard'):
+        for category, bank_questions in source[bank].items():
+            for q in bank_questions:
+                questions.append((q['id'], bank, category, q['sub'], q['q'], tuple(q['options']),
+                                  q['options'].index(q['a'])))
+    for q in source['onboarding']:
+        questions.append((q['id'], 'onboarding', q['category'], q['sub'], q['q'], tuple(q['options']),
+                          q['options'].index(q['a'])))
+    return {
+        'format': ARTIFACT_FORMAT,
+        'source_sha256': digest,
+        'next_id': source['next_id'],
+        'questions': tuple(questions),
+        'curated': source.get('curated') or {},
+        'learning_resources': source.get('learning_resources') or {},
+    }
+
+
+def write_artifact(compiled, path=ARTIFACT_PATH):
+    """Write the .bin next to the source, atomically."""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(compiled, f)
+    os.replace(tmp_path, path)
+
+
+def read_artifact(path=ARTIFACT_PATH):
+    """The compiled dict in the .bin, or None if it is missing, unreadable or
+    of another format. The file may sit on a writable volume (QUESTION_BANK_DIR),
+    so it is read with marshal, which only builds plain values."""
+    try:
+        with open(path, 'rb') as f:
+            compiled = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(compiled, dict) or compiled.get('format') != ARTIFACT_FORMAT:
+        return None
+    return compiled
+
+
+def load(source_path=SOURCE_PATH, artifact_path=ARTIFACT_PATH):
+    """The QuestionBank for questions.json, from the .bin when it is current."""
+    digest = source_digest(source_path)
+    compiled = read_artifact(artifact_path)
+    if compiled and compiled.get('source_sha256') == digest:
+        try:
+            return QuestionBank(compiled)
+        except (KeyError, TypeError, ValueError):
+            pass
+    logger.warning('%s is missing or stale; compiling %s',
+                   os.path.basename(artifact_path), os.path.basename(source_path))
+    with open(source_path, 'rb') as f:
+        return QuestionBank(compile_source(json.loads(f.read()), digest))
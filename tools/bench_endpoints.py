@@ -0,0 +1,267 @@
+"""Endpoint latency benchmark using the Flask test client.
+
+Generates (or reuses) SQLite datasets of several sizes with
+tools/generate_data.py, then times the hot endpoints in-process through
+app.test_client(): no network and no server, just Flask, the app code and
+the database. For each endpoint it reports p50/p95/p99 latency and the
+number of SQL statements per request, and writes a JSON report.
+
+    python tools/bench_endpoints.py --sizes 1000,10000 --out bench.json
+    python tools/bench_endpoints.py --sizes 1000 --baseline tools/bench_baseline.json
+
+Today's question sets are drawn before timing starts, as the post-fork
+warm-up does in production, so no timed request pays for the draw.
+
+With --baseline, exits non-zero if any endpoint runs more queries per
+request (on average or at most) than the baseline, or its p95 grows by more
+than --tolerance. Endpoints whose request count differs from the baseline's
+are skipped, since their averages aren't comparable. Latency depends on the
+machine, so compare reports taken on the same one; query counts are
+comparable anywhere.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'uptriv-bench')
+
+
+def load_app(database_path):
+    os.environ['DATABASE_URL'] = 'sqlite:///' + database_path
+    sys.path.insert(0, ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app
+    return app
+
+
+def dataset_path(data_dir, users, seed):
+    return os.path.join(data_dir, f'bench-{users}-seed{seed}.db')
+
+
+def generate_dataset(path, users, days, seed, end_date):
+    """Build the dataset once; later runs reuse the file."""
+    if os.path.exists(path):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    subprocess.run([
+        sys.executable, os.path.join(ROOT, 'tools', 'generate_data.py'),
+        '--database-url', 'sqlite:///' + path, '--users', str(users), '--days', str(days),
+        '--seed', str(seed), '--end-date', end_date.isoformat(),
+    ], check=True)
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Bench:
+    """Times requests and counts the SQL statements each one runs."""
+
+    def __init__(self, app):
+        self.app = app
+        self.client = app.app.test_client()
+        self.statements = 0
+        original_get_db = app.get_db
+
+        def counting_get_db():
+            conn = original_get_db()
+            conn.set_trace_callback(self._count)
+            return conn
+
+        app.get_db = counting_get_db
+
+    def _count(self, statement):
+        if not statement.startswith(('BEGIN', 'COMMIT', 'ROLLBACK')):
+            self.statements += 1
+
+    def login(self, user_id):
+        with self.client.session_transaction() as session:
+            if user_id is None:
+                session.pop('_user_id', None)
+            else:
+                session['_user_id'] = str(user_id)
+                session['_fresh'] = True
+
+    def run(self, method, url, json_body=None):
+        self.statements = 0
+        started = time.perf_counter()
+        response = self.client.open(url, method=method, json=json_body)
+        elapsed = time.perf_counter() - started
+        return response, elapsed * 1000, self.statements
+
+
+def pick_users(app, count):
+    """Anonymous and Google users with history, plus an admin account."""
+    conn = app.get_db()
+    cur = conn.cursor()
+    cur.execute('''
+        SELECT id, username, anonymous_id, google_id FROM users
+        WHERE id IN (SELECT DISTINCT user_id FROM game_results WHERE mode = 'daily')
+        ORDER BY id
+    ''')
+    rows = [dict(row) for row in cur.fetchall()]
+    anonymous = [row for row in rows if row['anonymous_id']][:count]
+    google = [row for row in rows if row['google_id']][:count]
+    admin = google[0]
+    cur.execute('UPDATE users SET email = ? WHERE id = ?', (sorted(app.ADMIN_EMAILS)[0], admin['id']))
+    conn.commit()
+    conn.close()
+    return anonymous, google, admin
+
+
+def bench_dataset(app, bench, requests_per_endpoint):
+    anonymous, google, admin = pick_users(app, requests_per_endpoint)
+    app.warm_daily_questions_cache()
+    samples = {}
+
+    def record(name, method, url, json_body=None):
+        response, ms, statements = bench.run(method, url, json_body)
+        entry = samples.setdefault(name, {'ms': [], 'queries': [], 'status': {}})
+        entry['ms'].append(ms)
+        entry['queries'].append(statements)
+        entry['status'][str(response.status_code)] = entry['status'].get(str(response.status_code), 0) + 1
+        return response
+
+    # Anonymous players: start today's game, then answer its first question
+    bench.login(None)
+    for user in anonymous:
+        response = record('/api/start-game', 'POST', '/api/start-game', {'anonymous_id': user['anonymous_id']})
+        data = response.get_json() or {}
+        if data.get('game_token'):
+            questions = record('/api/daily', 'GET', data['questions_url']).get_json()['questions']
+            record('/api/submit-answer', 'POST', '/api/submit-answer', {
+                'game_token': data['game_token'], 'question_index': 0,
+                'answer': questions[0]['options'][0], 'time_taken': 4.2,
+            })
+        record('/api/get-history', 'GET', f"/api/get-history?anonymous_id={user['anonymous_id']}")
+        record('/api/check-hard-mode-eligibility', 'GET',
+               f"/api/check-hard-mode-eligibility?anonymous_id={user['anonymous_id']}")
+
+    # Signed-in players
+    for user in google:
+        bench.login(user['id'])
+        record('/api/get-stats', 'GET', '/api/get-stats')
+        record('/api/leaderboard', 'GET', '/api/leaderboard')
+        record('/api/friends', 'GET', '/api/friends')
+
+    bench.login(admin['id'])
+    for _ in range(max(1, requests_per_endpoint // 10)):
+        record('/admin', 'GET', '/admin')
+    bench.login(None)
+    for _ in range(max(1, requests_per_endpoint // 10)):
+        record('/sitemap.xml', 'GET', '/sitemap.xml')
+
+    results = {}
+    for name, entry in samples.items():
+        ms = sorted(entry['ms'])
+        results[name] = {
+            'requests': len(ms),
+            'p50_ms': round(percentile(ms, 50), 2),
+            'p95_ms': round(percentile(ms, 95), 2),
+            'p99_ms': round(percentile(ms, 99), 2),
+            'queries_per_request': round(sum(entry['queries']) / len(entry['queries']), 2),
+            'max_queries': max(entry['queries']),
+            'status': entry['status'],
+        }
+    return results
+
+
+def compare(report, baseline, tolerance):
+    """Print regressions against a baseline report; returns how many there are."""
+    regressions = 0
+    for size, endpoints in report['results'].items():
+        for name, result in endpoints.items():
+            base = baseline.get('results', {}).get(size, {}).get(name)
+            if not base:
+                continue
+            if base.get('requests') != result['requests']:
+                print(f"SKIPPED {size} users {name}: {result['requests']} requests, baseline has {base.get('requests')}")
+                continue
+            notes = []
+            if result['queries_per_request'] > base['queries_per_request']:
+                notes.append(f"queries {base['queries_per_request']} -> {result['queries_per_request']}")
+            if result['max_queries'] > base['max_queries']:
+                notes.append(f"max queries {base['max_queries']} -> {result['max_queries']}")
+            if result['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+                notes.append(f"p95 {base['p95_ms']}ms -> {result['p95_ms']}ms")
+            if notes:
+                regressions += 1
+                print(f"REGRESSION {size} users {name}: {', '.join(notes)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', default='1000,5000', help='comma-separated user counts')
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--requests', type=int, default=50, help='requests per endpoint per size')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='where generated datasets are kept')
+    parser.add_argument('--out', help='write the JSON report here')
+    parser.add_argument('--baseline', help='compare with this earlier report')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='allowed p95 growth vs the baseline')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    paths = {size: dataset_path(args.data_dir, size, args.seed) for size in sizes}
+
+    # Import against a scratch file; each dataset is swapped in below
+    scratch = tempfile.TemporaryDirectory()
+    app = load_app(os.path.join(scratch.name, 'scratch.db'))
+    # History ends yesterday so every benchmarked player still has today's game to start
+    end_date = app.get_user_today() - timedelta(days=1)
+    bench = Bench(app)
+    report = {
+        'meta': {
+            'sizes': sizes, 'days': args.days, 'seed': args.seed, 'requests': args.requests,
+            'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version,
+        },
+        'results': {},
+    }
+
+    for size in sizes:
+        path = paths[size]
+        working_copy = path + '.run'
+        generate_dataset(path, size, args.days, args.seed, end_date)
+        # Benchmark a copy: start-game and submit-answer write to it
+        with open(path, 'rb') as src, open(working_copy, 'wb') as dst:
+            dst.write(src.read())
+        app.DATABASE = working_copy
+        app._daily_questions_cache.clear()
+        print(f"Benchmarking {size:,} users...")
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                report['results'][str(size)] = bench_dataset(app, bench, args.requests)
+        finally:
+            os.remove(working_copy)
+        for name, result in report['results'][str(size)].items():
+            print(f"  {name:36} p50 {result['p50_ms']:7.2f}ms  p95 {result['p95_ms']:7.2f}ms  "
+                  f"p99 {result['p99_ms']:7.2f}ms  {result['queries_per_request']:5.1f} queries")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Wrote {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        print(f"{regressions} regression(s) against {args.baseline}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
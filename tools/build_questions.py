@@ -0,0 +1,135 @@
+"""Validate data/questions.json and build data/questions.bin.
+
+data/questions.json is the question bank's source: categories of easy and
+hard questions, the onboarding quiz, curated daily picks and learning
+resources. After editing it, run
+
+    python tools/build_questions.py           # dedupe, assign IDs, validate, write the .bin
+    python tools/build_questions.py --check   # validate only; fails if the .bin is stale
+
+New questions can leave out "id": they get next_id, which only ever grows,
+so a removed question's ID is never handed to another one. Exact duplicates
+(same text and answer, ignoring case and spacing) of an earlier question in
+the same bank are dropped if they have no ID yet. Both changes are written
+back to questions.json, reformatted with one question per line.
+
+The app loads the .bin when it matches questions.json and compiles the JSON
+itself otherwise, so commit both files together.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import question_bank  # noqa: E402
+
+SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_leaf(value):
+    """Scalars, lists of scalars and flat objects go on one line."""
+    if isinstance(value, list):
+        return all(isinstance(v, SCALARS) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(v, SCALARS) or (isinstance(v, list) and _is_leaf(v)) for v in value.values())
+    return True
+
+
+def format_source(value, indent=0):
+    """questions.json layout: nested objects expanded, each question or resource on one line."""
+    if _is_leaf(value):
+        return json.dumps(value, ensure_ascii=False)
+    pad = '  ' * (indent + 1)
+    if isinstance(value, dict):
+        items = [f'{pad}{json.dumps(key, ensure_ascii=False)}: {format_source(v, indent + 1)}' for key, v in value.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + '  ' * indent + '}'
+    items = [pad + format_source(v, indent + 1) for v in value]
+    return '[\n' + ',\n'.join(items) + '\n' + '  ' * indent + ']'
+
+
+def bank_lists(source):
+    """(bank name, list of questions) for every question list in the source."""
+    for bank in ('easy', 'hard'):
+        for category, questions in (source.get(bank) or {}).items():
+            yield f'{bank}.{category}', bank, questions
+    yield 'onboarding', 'onboarding', source.get('onboarding') or []
+
+
+def dedupe(source):
+    """Drop ID-less questions that repeat an earlier one in the same bank."""
+    notes = []
+    seen = {}
+    for where, bank, questions in bank_lists(source):
+        kept = []
+        bank_seen = seen.setdefault(bank, set())
+        for q in questions:
+            key = (question_bank.normalized_text(q.get('q', '')), q.get('a'))
+            if 'id' not in q and key in bank_seen:
+                notes.append(f"dropped duplicate in {where}: {q.get('q')!r}")
+                continue
+            bank_seen.add(key)
+            kept.append(q)
+        questions[:] = kept
+    return notes
+
+
+def assign_ids(source):
+    """Give ID-less questions the next unused IDs, keeping 'id' as the first key."""
+    notes = []
+    for where, _, questions in bank_lists(source):
+        for i, q in enumerate(questions):
+            if 'id' not in q:
+                questions[i] = {'id': source['next_id'], **q}
+                notes.append(f"assigned id {source['next_id']} in {where}: {q.get('q')!r}")
+                source['next_id'] += 1
+    return notes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--check', action='store_true', help='validate without writing; fail if the .bin is stale')
+    parser.add_argument('--source', default=question_bank.SOURCE_PATH)
+    parser.add_argument('--out', default=question_bank.ARTIFACT_PATH)
+    args = parser.parse_args()
+
+    with open(args.source, encoding='utf-8') as f:
+        source = json.load(f)
+
+    if args.check:
+        problems = question_bank.validate(source)
+        for problem in problems:
+            print(problem)
+        compiled = question_bank.read_artifact(args.out)
+        stale = not compiled or compiled.get('source_sha256') != question_bank.source_digest(args.source)
+        if not problems and stale:
+            print(f'{args.out} is stale: run tools/build_questions.py')
+        return 1 if problems or stale else 0
+
+    notes = dedupe(source) + assign_ids(source)
+    problems = question_bank.validate(source)
+    for note in notes:
+        print(note)
+    if problems:
+        for problem in problems:
+            print(problem)
+        print(f'{len(problems)} problem(s); nothing written')
+        return 1
+
+    formatted = format_source(source) + '\n'
+    with open(args.source, encoding='utf-8') as f:
+        unchanged = f.read() == formatted
+    if not unchanged:
+        with open(args.source, 'w', encoding='utf-8') as f:
+            f.write(formatted)
+    compiled = question_bank.compile_source(source, question_bank.source_digest(args.source))
+    question_bank.write_artifact(compiled, args.out)
+    print(f"{len(compiled['questions'])} questions, next id {compiled['next_id']}: wrote "
+          f"{os.path.relpath(args.out)} ({os.path.getsize(args.out):,} bytes)"
+          + ('' if unchanged else f' and reformatted {os.path.relpath(args.source)}'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""Synthetic data generator for scale testing.
+
+Populates a SQLite or Postgres database with users, daily game results,
+onboarding answers, friendships, visits and invites that look like
+production traffic. The same seed always produces the same data.
+
+    python tools/generate_data.py --database-url sqlite:///scale.db --users 1000 --days 30
+    python tools/generate_data.py --database-url postgresql://localhost/uptriv_scale --users 100000 --days 90
+
+100k users over 90 days comes to roughly 10M game_results rows. Postgres
+loads with COPY. SQLite loads with batched executemany, with syncs off.
+Secondary indexes on the big tables are dropped during the load and rebuilt
+by init_db afterwards. --database-url is required, so the app's own
+database is never the target by accident, and a database that already has
+users is refused unless --force is given; new users are then appended
+after the existing ones (use another --seed than the existing data's, or
+the generated anonymous IDs collide).
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BATCH_SIZE = 50000
+
+# Share of answers that are correct, by category and difficulty
+BASE_ACCURACY = {
+    'easy': {'news': 0.70, 'history': 0.66, 'science': 0.71, 'entertainment': 0.75, 'sports': 0.62, 'geography': 0.68},
+    'hard': {'news': 0.46, 'history': 0.41, 'science': 0.44, 'entertainment': 0.50, 'sports': 0.39, 'geography': 0.43},
+}
+NO_ANSWER_RATE = 0.03
+TIME_LIMIT_MS = 15000
+
+OTHER_PATHS = ['/', '/history', '/profile', '/friends', '/leaderboard', '/privacy']
+USER_AGENTS = [
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/124.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 Version/17.4 Safari/605.1.15',
+    'Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 Chrome/124.0 Mobile Safari/537.36',
+]
+ADJECTIVES = ['Swift', 'Clever', 'Bright', 'Quick', 'Sharp', 'Witty', 'Brave', 'Calm']
+NOUNS = ['Fox', 'Owl', 'Tiger', 'Eagle', 'Wolf', 'Bear', 'Hawk', 'Lion']
+
+
+def load_app(database_url):
+    """Import app.py against the given database; init_db creates the schema."""
+    os.environ['DATABASE_URL'] = database_url
+    sys.path.insert(0, ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app
+    return app
+
+
+class BulkLoader:
+    """Write rows in batches: COPY on Postgres, executemany on SQLite."""
+
+    def __init__(self, app, conn):
+        self.app = app
+        self.conn = conn
+        self.cur = conn.cursor()
+        self.columns = {}
+        self.batches = {}
+        self.counts = {}
+
+    def add(self, table, columns, row):
+        self.columns[table] = columns
+        batch = self.batches.setdefault(table, [])
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            self._flush(table, columns, batch)
+            self.batches[table] = []
+
+    def finish(self, table):
+        if self.batches.get(table):
+            self._flush(table, self.columns[table], self.batches.pop(table))
+        self.conn.commit()
+        print(f"  {table}: {self.counts.get(table, 0):,} rows")
+
+    def load(self, table, columns, rows):
+        for row in rows:
+            self.add(table, columns, row)
+        self.finish(table)
+
+    def _flush(self, table, columns, batch):
+        if self.app.USE_POSTGRES:
+            buf = io.StringIO()
+            csv.writer(buf).writerows(batch)
+            buf.seek(0)
+            self.cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+        else:
+            ph = self.app.get_placeholder()
+            self.cur.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([ph] * len(columns))})", batch)
+        self.counts[table] = self.counts.get(table, 0) + len(batch)
+
+
+def drop_secondary_indexes(app, cur, tables):
+    """Drop non-unique indexes on the bulk-loaded tables; init_db rebuilds them."""
+    for table in tables:
+        if app.USE_POSTGRES:
+            cur.execute(f"""
+                SELECT indexname AS name FROM pg_indexes
+                WHERE tablename = {app.get_placeholder()} AND indexdef NOT LIKE 'CREATE UNIQUE%'
+            """, (table,))
+        else:
+            cur.execute(f"""
+                SELECT name FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = {app.get_placeholder()} AND sql IS NOT NULL
+                AND sql NOT LIKE 'CREATE UNIQUE%'
+            """, (table,))
+        for row in cur.fetchall():
+            cur.execute(f"DROP INDEX IF EXISTS {row['name']}")
+
+
+def timestamp(day, rng):
+    """A moment on a Central-time game day, bunched in the hours after the rollover."""
+    offset = min(rng.expovariate(1 / 3.0), 23.9)
+    moment = datetime.combine(day, datetime.min.time()) + timedelta(hours=6 + offset)
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def make_users(rng, first_id, count, days, google_share):
+    users = []
+    for user_id in range(first_id, first_id + count):
+        google = rng.random() < google_share
+        users.append({
+            'id': user_id,
+            'username': f"{rng.choice(ADJECTIVES)}{rng.choice(NOUNS)}{user_id}",
+            'email': f"player{user_id}@example.com" if google else None,
+            'google_id': f"gen-{user_id}" if google else None,
+            'anonymous_id': None if google else str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            # Sign-ups grow over the period
+            'signup_day': int(days * rng.random() ** 0.7),
+            'play_rate': rng.betavariate(0.8, 2.5),
+            'skill': rng.gauss(0, 0.12),
+            'hard': rng.random() < 0.15,
+            'onboarding': rng.choice([0, 0, 0, 10, 20, 30, 40, 50]),
+        })
+    return users
+
+
+def daily_sets(app, rng, start, days):
+    """One question per category per difficulty per day, like the real daily sets."""
+    bank = app.question_bank()
+    sets = {}
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        for difficulty in ('easy', 'hard'):
+            pool = bank.for_difficulty(difficulty)
+            sets[(day, difficulty)] = [rng.choice(pool[category]) for category in app.CATEGORIES]
+    return sets
+
+
+def answer(rng, q, difficulty, skill, question_offsets):
+    """(answer_index, correct, time_ms) for one simulated answer."""
+    time_ms = min(int(rng.lognormvariate(8.6, 0.5)), TIME_LIMIT_MS)
+    if rng.random() < NO_ANSWER_RATE:
+        return None, 0, TIME_LIMIT_MS
+    accuracy = BASE_ACCURACY[difficulty][q['category']] + question_offsets[q['id']] + skill
+    correct_index = q['options'].index(q['a'])
+    if rng.random() < min(max(accuracy, 0.03), 0.97):
+        return correct_index, 1, time_ms
+    wrong = [i for i in range(len(q['options'])) if i != correct_index]
+    return rng.choice(wrong), 0, time_ms
+
+
+VISIT_COLUMNS = ['path', 'ip_address', 'user_agent', 'user_id', 'visited_at']
+
+
+def visit_row(path, user_id, visited_at):
+    ip = f"10.{user_id >> 16 & 255}.{user_id >> 8 & 255}.{user_id & 255}"
+    return (path, ip, USER_AGENTS[user_id % len(USER_AGENTS)], user_id, visited_at)
+
+
+def game_rows(app, rng, users, sets, start, days, loader):
+    """game_results rows in date order, as production writes them. Each game's
+    visits go to the loader alongside."""
+    bank = app.question_bank()
+    question_offsets = {qid: random.Random(qid).gauss(0, 0.12) for qid in bank.by_id}
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        game_date = day.isoformat()
+        for user in users:
+            if user['signup_day'] > offset:
+                continue
+            if offset == user['signup_day'] and user['onboarding']:
+                created_at = timestamp(day, rng)
+                for q in rng.sample(bank.onboarding, user['onboarding']):
+                    answer_index, correct, time_ms = answer(rng, q, 'easy',
+                                                            user['skill'], question_offsets)
+                    yield (user['id'], game_date, 'onboarding', 'easy', q['id'], answer_index, correct,
+                           time_ms, q['category'], created_at)
+            if rng.random() >= user['play_rate']:
+                continue
+            difficulties = ['easy']
+            if rng.random() < (0.8 if user['hard'] else 0.15):
+                difficulties.append('hard')
+            for difficulty in difficulties:
+                created_at = timestamp(day, rng)
+                loader.add('visits', VISIT_COLUMNS, visit_row('/play', user['id'], created_at))
+                for q in sets[(day, difficulty)]:
+                    answer_index, correct, time_ms = answer(rng, q, difficulty, user['skill'], question_offsets)
+                    yield (user['id'], game_date, 'daily', difficulty, q['id'], answer_index, correct,
+                           time_ms, q['category'], created_at)
+                if rng.random() < 0.4:
+                    loader.add('visits', VISIT_COLUMNS, visit_row(rng.choice(OTHER_PATHS), user['id'], created_at))
+
+
+def friendship_rows(rng, users):
+    """Friendships with a power-law degree distribution."""
+    user_ids = [user['id'] for user in users]
+    pairs = set()
+    for user_id in user_ids:
+        degree = min(int(rng.paretovariate(1.3)) - 1, 500)
+        for friend_id in rng.sample(user_ids, min(degree, len(user_ids))):
+            pair = (min(user_id, friend_id), max(user_id, friend_id))
+            if friend_id == user_id or pair in pairs:
+                continue
+            pairs.add(pair)
+            status = 'accepted' if rng.random() < 0.85 else 'pending'
+            yield (user_id, friend_id, status)
+
+
+def invite_rows(rng, users, start, days):
+    for user in users:
+        if not user['google_id'] or rng.random() >= 0.05:
+            continue
+        for _ in range(rng.randint(1, 3)):
+            sent = datetime.combine(start + timedelta(days=rng.randint(user['signup_day'], days - 1)),
+                                    datetime.min.time()) + timedelta(hours=rng.randint(6, 29))
+            yield (user['id'], f"friend{rng.getrandbits(32)}@example.com", f"{rng.getrandbits(128):032x}",
+                   rng.choice(['pending', 'pending', 'accepted']), sent.strftime('%Y-%m-%d %H:%M:%S'),
+                   (sent + timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--database-url', required=True, help='target database, e.g. sqlite:///scale.db')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=30, help='days of play history, ending on --end-date')
+    parser.add_argument('--end-date', type=date.fromisoformat, default=None, help='last game day (default: today)')
+    parser.add_argument('--google-share', type=float, default=0.3, help='share of users signed in with Google')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--force', action='store_true',
+                        help='add to a database that already has users (its indexes are dropped and rebuilt)')
+    args = parser.parse_args()
+
+    app = load_app(args.database_url)
+    rng = random.Random(args.seed)
+    end = args.end_date or app.get_user_today()
+    start = end - timedelta(days=args.days - 1)
+    started = time.time()
+
+    conn = app.get_db()
+    cur = conn.cursor()
+    if not app.USE_POSTGRES:
+        cur.execute('PRAGMA synchronous = OFF')
+    cur.execute('SELECT COALESCE(MAX(id), 0) AS max_id FROM users')
+    first_id = cur.fetchone()['max_id'] + 1
+    if first_id > 1 and not args.force:
+        conn.close()
+        sys.exit(f"{args.database_url} already has users; point --database-url at an empty database "
+                 "or pass --force to add to it")
+    drop_secondary_indexes(app, cur, ['game_results', 'visits', 'friendships'])
+    conn.commit()
+
+    print(f"Generating {args.users:,} users over {args.days} days ({start} to {end}), seed {args.seed}")
+    users = make_users(rng, first_id, args.users, args.days, args.google_share)
+    loader = BulkLoader(app, conn)
+
+    loader.load('users', ['id', 'username', 'email', 'google_id', 'anonymous_id', 'difficulty',
+                          'onboarding_completed', 'created_at'],
+                ((u['id'], u['username'], u['email'], u['google_id'], u['anonymous_id'],
+                  'hard' if u['hard'] else 'easy', u['onboarding'],
+                  f"{start + timedelta(days=u['signup_day'])} 12:00:00") for u in users))
+    if app.USE_POSTGRES:
+        cur.execute("SELECT setval(pg_get_serial_sequence('users', 'id'), (SELECT MAX(id) FROM users))")
+        conn.commit()
+
+    sets = daily_sets(app, rng, start, args.days)
+    cur.execute(f'SELECT game_date FROM daily_questions WHERE user_id IS NULL AND game_date >= {app.get_placeholder()}',
+                (start.isoformat(),))
+    existing = {str(row['game_date']) for row in cur.fetchall()}
+    loader.load('daily_questions', ['game_date', 'difficulty', 'questions_json'],
+                ((day.isoformat(), difficulty, json.dumps([dict(q) for q in questions]))
+                 for (day, difficulty), questions in sets.items() if day.isoformat() not in existing))
+
+    loader.load('game_results', ['user_id', 'game_date', 'mode', 'difficulty', 'question_id', 'answer_index',
+                                 'correct', 'time_ms', 'category', 'created_at'],
+                game_rows(app, rng, users, sets, start, args.days, loader))
+    loader.finish('visits')
+    loader.load('friendships', ['requester_id', 'addressee_id', 'status'], friendship_rows(rng, users))
+    loader.load('invites', ['inviter_id', 'email', 'token', 'status', 'created_at', 'expires_at'],
+                invite_rows(rng, users, start, args.days))
+    print("Rebuilding seen-question sets...")
+    app.rebuild_seen_questions(conn)
+    conn.close()
+
+    print("Rebuilding indexes...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        app.init_db()
+    conn = app.get_db()
+    conn.cursor().execute('ANALYZE')
+    conn.commit()
+    conn.close()
+    print(f"Done in {time.time() - started:.0f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Import-time budget for app.py.
+
+Runs `python -X importtime -c "import app"` in fresh interpreters against a
+scratch SQLite database and reports the median import time, the slowest
+top-level imports and the time from interpreter start to the first
+response. Exits non-zero when:
+
+- the median import of app takes longer than --budget-ms, or
+- any of LAZY_MODULES is imported at startup. Those modules are only needed
+  by a few routes and are imported on first use there.
+
+    python tools/import_budget.py
+    python tools/import_budget.py --runs 10 --budget-ms 500 --top 20
+
+Import time depends on the machine, so set --budget-ms for the one the
+check runs on. The lazy-module check holds anywhere.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported on first use: Google sign-in, invite emails, Postgres (get_db), admin profiling
+LAZY_MODULES = ['authlib', 'resend', 'requests', 'psycopg2', 'cProfile', 'pstats']
+
+FIRST_RESPONSE = (
+    'import contextlib, io\n'
+    'with contextlib.redirect_stdout(io.StringIO()):\n'
+    '    import app\n'
+    "response = app.app.test_client().get('/livez')\n"
+    'assert response.status_code == 200, response.status_code\n'
+)
+
+
+def parse_importtime(stderr):
+    """[(module, depth, self_us, cumulative_us)] from -X importtime output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        imports.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure_import(env):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def measure_first_response(env):
+    """Seconds from starting the interpreter to the app's first response."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', FIRST_RESPONSE], cwd=ROOT, env=env, check=True)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to time')
+    parser.add_argument('--budget-ms', type=float, default=400, help='allowed median import time of app')
+    parser.add_argument('--top', type=int, default=10, help='slowest top-level imports to list')
+    args = parser.parse_args()
+
+    scratch = tempfile.TemporaryDirectory()
+    env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.join(scratch.name, 'import.db'))
+    env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    # The first run creates the database and writes bytecode; don't count it
+    measure_import(env)
+
+    runs = [measure_import(env) for _ in range(args.runs)]
+    totals = [next(cumulative for name, _, _, cumulative in imports if name == 'app') / 1000 for imports in runs]
+    first_responses = [measure_first_response(env) for _ in range(args.runs)]
+    median_ms = statistics.median(totals)
+
+    print(f"import app: median {median_ms:.0f} ms (min {min(totals):.0f}, max {max(totals):.0f}) over {args.runs} runs")
+    print(f"interpreter start to first response: median {statistics.median(first_responses) * 1000:.0f} ms")
+
+    # Direct imports of app, and app's own time (route registration, init_db).
+    # -X importtime lists a module after everything it imported.
+    imports = runs[-1]
+    children = []
+    for name, depth, self_us, cumulative in imports:
+        if depth == 1:
+            children.append((name, cumulative))
+        elif depth == 0:
+            if name == 'app':
+                children.append(('(app itself)', self_us))
+                break
+            children = []
+    print("\nslowest imports from app:")
+    for name, cumulative in sorted(children, key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failures = 0
+    loaded = {name for name, _, _, _ in imports}
+    eager = [module for module in LAZY_MODULES if module in loaded]
+    if eager:
+        failures += 1
+        print(f"\nFAIL: imported at startup but should be lazy: {', '.join(eager)}")
+    if median_ms > args.budget_ms:
+        failures += 1
+        print(f"\nFAIL: median import {median_ms:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+    if not failures:
+        print(f"\nOK: within the {args.budget_ms:.0f} ms budget, no lazy module imported at startup")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
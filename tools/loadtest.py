@@ -0,0 +1,281 @@
+"""Daily-peak traffic replay against a local gunicorn.
+
+Starts gunicorn with the Procfile's worker and thread settings on a local
+port, then has many players run the post-rollover funnel at once:
+
+    GET /play -> POST /api/start-game -> GET /api/daily -> POST /api/submit-answers
+    -> GET /history
+
+The play page checks answers against the answer key as they're given and
+sends the whole game in one submit-answers batch at the end.
+
+Players are existing anonymous users from a dataset built by
+tools/generate_data.py, whose history ends yesterday, so each one has
+today's game to play. Reports throughput, per-step latency, error rate, and
+"database is locked" / connection-exhaustion events seen in responses or in
+the server log.
+
+    python tools/loadtest.py --players 500 --concurrency 50
+    python tools/loadtest.py --players 2000 --concurrency 200 --workers 4 --threads 4
+    python tools/loadtest.py --database-url postgresql://localhost/uptriv_scale --players 1000
+
+Without --database-url a SQLite dataset is generated (and cached) in the
+temp dir, and each run works on a fresh copy of it.
+"""
+import argparse
+import json
+import os
+import queue
+import random
+import shlex
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(tempfile.gettempdir(), 'uptriv-loadtest')
+
+STEPS = ['/play', '/api/start-game', '/api/daily', '/api/submit-answers', '/history']
+LOCK_MARKERS = ['database is locked', 'database table is locked']
+EXHAUSTION_MARKERS = ['too many clients', 'remaining connection slots', 'connection pool exhausted',
+                      'could not connect to server', 'Connection refused']
+
+
+def procfile_gunicorn_args():
+    """The gunicorn arguments from the Procfile's web process."""
+    with open(os.path.join(ROOT, 'Procfile')) as f:
+        for line in f:
+            if line.startswith('web:'):
+                args = shlex.split(line[len('web:'):])
+                return args[1:] if args and args[0] == 'gunicorn' else args
+    raise SystemExit('No web process in Procfile')
+
+
+def override_option(args, name, value):
+    if value is None:
+        return args
+    if name in args:
+        args = list(args)
+        args[args.index(name) + 1] = str(value)
+        return args
+    return args + [name, str(value)]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def central_today():
+    """Same rule as app.get_user_today(), without importing the app here."""
+    return (datetime.now(timezone.utc) - timedelta(hours=6)).date()
+
+
+def prepare_sqlite(users, days, seed):
+    """A fresh copy of a cached generated dataset."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    end_date = central_today() - timedelta(days=1)
+    cached = os.path.join(DATA_DIR, f'loadtest-{users}-seed{seed}-{end_date}.db')
+    if not os.path.exists(cached):
+        subprocess.run([
+            sys.executable, os.path.join(ROOT, 'tools', 'generate_data.py'),
+            '--database-url', 'sqlite:///' + cached, '--users', str(users), '--days', str(days),
+            '--seed', str(seed), '--end-date', end_date.isoformat(),
+        ], check=True)
+    working = os.path.join(DATA_DIR, 'loadtest-run.db')
+    shutil.copyfile(cached, working)
+    return 'sqlite:///' + working
+
+
+def load_players(database_url, count):
+    """anonymous_ids of players who have not played today."""
+    env = dict(os.environ, DATABASE_URL=database_url)
+    script = (
+        'import contextlib, io, json\n'
+        'with contextlib.redirect_stdout(io.StringIO()):\n'
+        '    import app\n'
+        'conn = app.get_db(); cur = conn.cursor()\n'
+        f"cur.execute('SELECT anonymous_id FROM users WHERE anonymous_id IS NOT NULL ORDER BY id LIMIT {int(count)}')\n"
+        "print(json.dumps([row['anonymous_id'] for row in cur.fetchall()]))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {step: [] for step in STEPS}
+        self.errors = {step: 0 for step in STEPS}
+        self.error_samples = []
+        self.locked = 0
+        self.exhausted = 0
+        self.funnels = 0
+
+    def record(self, step, ms, ok, detail=''):
+        with self.lock:
+            self.latencies[step].append(ms)
+            if not ok:
+                self.errors[step] += 1
+                if len(self.error_samples) < 10:
+                    self.error_samples.append(f"{step}: {detail[:200]}")
+            if any(marker in detail for marker in LOCK_MARKERS):
+                self.locked += 1
+            if any(marker in detail for marker in EXHAUSTION_MARKERS):
+                self.exhausted += 1
+
+
+def timed(stats, step, call):
+    started = time.perf_counter()
+    try:
+        response = call()
+        ms = (time.perf_counter() - started) * 1000
+        ok = response.status_code < 400
+        detail = '' if ok else f"{response.status_code} {response.text}"
+        stats.record(step, ms, ok, detail)
+        return response if ok else None
+    except requests.RequestException as e:
+        stats.record(step, (time.perf_counter() - started) * 1000, False, str(e))
+        return None
+
+
+def play(base_url, anonymous_id, stats, think_ms, rng):
+    """One player's funnel; stops at the first failed step."""
+    session = requests.Session()
+
+    def think():
+        if think_ms:
+            time.sleep(rng.uniform(0.5, 1.5) * think_ms / 1000)
+
+    if not timed(stats, '/play', lambda: session.get(f'{base_url}/play', timeout=60)):
+        return
+    think()
+    response = timed(stats, '/api/start-game', lambda: session.post(
+        f'{base_url}/api/start-game', json={'anonymous_id': anonymous_id}, timeout=60))
+    if not response:
+        return
+    data = response.json()
+    if not data.get('game_token'):
+        stats.record('/api/start-game', 0, False, f"no game: {str(data)[:200]}")
+        return
+    questions = timed(stats, '/api/daily', lambda: session.get(f"{base_url}{data['questions_url']}", timeout=60))
+    if not questions:
+        return
+    answers = []
+    for index, q in enumerate(questions.json()['questions']):
+        think()
+        answers.append({'question_index': index, 'answer': rng.choice(q['options']),
+                        'time_taken': round(rng.uniform(2, 12), 1)})
+    body = {'game_token': data['game_token'], 'answers': answers}
+    if not timed(stats, '/api/submit-answers', lambda: session.post(
+            f'{base_url}/api/submit-answers', json=body, timeout=60)):
+        return
+    think()
+    if timed(stats, '/history', lambda: session.get(f'{base_url}/history', timeout=60)):
+        with stats.lock:
+            stats.funnels += 1
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(pct / 100 * (len(values) - 1)))] if values else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--players', type=int, default=300, help='players to run through the funnel')
+    parser.add_argument('--concurrency', type=int, default=30, help='players in flight at once')
+    parser.add_argument('--think-ms', type=int, default=0, help='mean pause between steps')
+    parser.add_argument('--workers', type=int, help='override the Procfile --workers')
+    parser.add_argument('--threads', type=int, help='override the Procfile --threads')
+    parser.add_argument('--database-url', help='database to run against (default: a generated SQLite copy)')
+    parser.add_argument('--dataset-users', type=int, default=5000, help='size of the generated SQLite dataset')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    database_url = args.database_url or prepare_sqlite(max(args.dataset_users, args.players), 30, args.seed)
+    players = load_players(database_url, args.players)
+    if len(players) < args.players:
+        print(f"Only {len(players)} anonymous players in the dataset")
+
+    port = free_port()
+    gunicorn_args = procfile_gunicorn_args()
+    gunicorn_args = override_option(gunicorn_args, '--workers', args.workers)
+    gunicorn_args = override_option(gunicorn_args, '--threads', args.threads)
+    gunicorn_args += ['--bind', f'127.0.0.1:{port}']
+    log_path = os.path.join(tempfile.gettempdir(), 'uptriv-loadtest-server.log')
+    print(f"Starting gunicorn {' '.join(gunicorn_args)}")
+    with open(log_path, 'w') as log:
+        server = subprocess.Popen([sys.executable, '-m', 'gunicorn'] + gunicorn_args, cwd=ROOT,
+                                  env=dict(os.environ, DATABASE_URL=database_url), stdout=log, stderr=log)
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        for _ in range(300):
+            try:
+                requests.get(f'{base_url}/privacy', timeout=1)
+                break
+            except requests.RequestException:
+                time.sleep(0.1)
+        else:
+            raise SystemExit(f"gunicorn did not come up; see {log_path}")
+
+        stats = Stats()
+        pending = queue.Queue()
+        for anonymous_id in players:
+            pending.put(anonymous_id)
+
+        def worker(worker_seed):
+            rng = random.Random(worker_seed)
+            while True:
+                try:
+                    anonymous_id = pending.get_nowait()
+                except queue.Empty:
+                    return
+                play(base_url, anonymous_id, stats, args.think_ms, rng)
+
+        print(f"Running {len(players)} players, {args.concurrency} at a time...")
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(args.seed * 1000 + i,)) for i in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    with open(log_path) as f:
+        server_log = f.read()
+    log_locked = sum(server_log.count(marker) for marker in LOCK_MARKERS)
+    log_exhausted = sum(server_log.count(marker) for marker in EXHAUSTION_MARKERS)
+
+    total = sum(len(values) for values in stats.latencies.values())
+    errors = sum(stats.errors.values())
+    print(f"\n{total:,} requests in {elapsed:.1f}s: {total / elapsed:.1f} req/s, "
+          f"{stats.funnels / elapsed:.1f} completed funnels/s ({stats.funnels}/{len(players)})")
+    print(f"Errors: {errors} ({errors / max(total, 1):.2%})")
+    print(f"'database is locked': {stats.locked} in responses, {log_locked} in server log")
+    print(f"Connection exhaustion: {stats.exhausted} in responses, {log_exhausted} in server log")
+    print(f"\n{'step':22} {'count':>7} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for step in STEPS:
+        values = stats.latencies[step]
+        print(f"{step:22} {len(values):7} {stats.errors[step]:7} {percentile(values, 50):8.1f} "
+              f"{percentile(values, 95):8.1f} {percentile(values, 99):8.1f}")
+    for sample in stats.error_samples:
+        print(f"  {sample}")
+    print(f"\nServer log: {log_path}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Query plan regression checker for the hot SQL paths.
+
+Seeds a scratch database with a representative amount of data, runs EXPLAIN
+for every query in HOT_QUERIES and compares the plans with the checked-in
+baseline in tools/query_plans.json. Exits non-zero when a query's plan gains
+a full scan of a table or index that the baseline does not have.
+
+    python tools/query_plans.py                  # check against the baseline (SQLite)
+    python tools/query_plans.py --update         # rewrite the baseline after a reviewed change
+    python tools/query_plans.py --database-url postgresql://localhost/uptriv_plans
+
+The Postgres database is seeded from scratch, so only point it at an empty
+throwaway database. When a hot query in app.py changes, update its copy in
+HOT_QUERIES and rerun with --update.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'tools', 'query_plans.json')
+
+SEED_USERS = 300
+SEED_DAYS = 30
+TODAY = date(2026, 1, 31)
+
+# name -> (sql, params); {ph} is the dialect placeholder. Mirrors the queries in app.py.
+HOT_QUERIES = {
+    'user_by_anonymous_id': (
+        'SELECT id, username FROM users WHERE anonymous_id = {ph}', ('anon-7',)),
+    'user_by_username': (
+        'SELECT id FROM users WHERE username = {ph}', ('user7',)),
+    'daily_questions_for_day': (
+        'SELECT questions_json FROM daily_questions WHERE game_date = {ph} AND difficulty = {ph} AND user_id IS NULL',
+        (TODAY.isoformat(), 'easy')),
+    'has_played_today': (
+        "SELECT COUNT(*) as count FROM game_results WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph} AND difficulty = {ph}",
+        (7, TODAY.isoformat(), 'easy')),
+    'played_difficulties_today': (
+        "SELECT DISTINCT COALESCE(difficulty, 'easy') as difficulty FROM game_results "
+        "WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph}",
+        (7, TODAY.isoformat())),
+    'start_game_today_results': (
+        "SELECT category, correct, difficulty FROM game_results "
+        "WHERE user_id = {ph} AND mode = 'daily' AND game_date = {ph} ORDER BY id",
+        (7, TODAY.isoformat())),
+    'stored_answers': (
+        'SELECT game_date, mode, difficulty, question_id, answer_index, options_version, correct, idempotency_key '
+        'FROM game_results WHERE (user_id = {ph} AND mode = {ph} AND game_date = {ph} AND difficulty = {ph} '
+        'AND question_id IN ({ph}, {ph}))',
+        (7, 'daily', TODAY.isoformat(), 'easy', 1, 2)),
+    'stored_answers_by_idempotency_key': (
+        'SELECT game_date, mode, difficulty, question_id, answer_index, options_version, correct, idempotency_key '
+        'FROM game_results WHERE (user_id = {ph} AND mode = {ph} AND game_date = {ph} AND difficulty = {ph} '
+        'AND question_id IN ({ph}, {ph})) OR (user_id = {ph} AND idempotency_key IN ({ph}))',
+        (7, 'daily', TODAY.isoformat(), 'easy', 1, 2, 7, 'key-1')),
+    'question_percentages': (
+        'SELECT question_id, COUNT(*) as total, SUM(correct) as correct_count FROM game_results '
+        'WHERE question_id IN ({ph}, {ph}, {ph}) GROUP BY question_id',
+        (1, 2, 3)),
+    'share_text': (
+        "SELECT category, correct FROM game_results WHERE user_id = {ph} AND mode = 'daily' "
+        "AND game_date = {ph} AND difficulty = {ph} ORDER BY id",
+        (7, TODAY.isoformat(), 'easy')),
+    'get_history': (
+        "SELECT game_date, category, question_id, answer_index, options_version, correct, time_ms, COALESCE(difficulty, 'easy') as difficulty "
+        "FROM game_results WHERE user_id = {ph} AND mode = 'daily' ORDER BY game_date DESC, id DESC",
+        (7,)),
+    'user_stats': (
+        "SELECT question_id, category, correct, COALESCE(difficulty, 'easy') as difficulty FROM game_results WHERE user_id = {ph} AND mode IN ('daily', 'onboarding')",
+        (7,)),
+    'profile_overall': (
+        'SELECT COUNT(DISTINCT game_date) AS games_played, SUM(correct) AS total_correct, COUNT(*) AS total_questions '
+        "FROM game_results WHERE user_id = {ph} AND mode IN ('daily', 'onboarding')",
+        (7,)),
+    'profile_best_category': (
+        'SELECT category, SUM(correct) * 100 / COUNT(*) AS cat_pct FROM game_results '
+        "WHERE user_id = {ph} AND mode IN ('daily', 'onboarding') "
+        'GROUP BY category ORDER BY cat_pct DESC LIMIT 1',
+        (7,)),
+    'onboarding_results': (
+        "SELECT category, correct FROM game_results WHERE user_id = {ph} AND mode = 'onboarding'", (7,)),
+    'hard_mode_user': (
+        "SELECT COUNT(*) as total, SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as correct_count "
+        "FROM game_results WHERE user_id = {ph} AND mode = 'daily'",
+        (7,)),
+    'hard_mode_all_users': (
+        "SELECT user_id, COUNT(*) as total, SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as correct_count "
+        "FROM game_results WHERE mode = 'daily' GROUP BY user_id HAVING COUNT(*) >= 6",
+        ()),
+    'sitemap_profiles': (
+        "SELECT u.username FROM users u JOIN ("
+        "SELECT user_id FROM game_results WHERE mode = 'daily' "
+        "GROUP BY user_id HAVING COUNT(DISTINCT game_date) >= 3"
+        ") g ON g.user_id = u.id WHERE u.username IS NOT NULL AND u.username != ''",
+        ()),
+    'friends': (
+        "SELECT u.id, u.username, u.profile_picture, f.status, f.created_at FROM friendships f "
+        "JOIN users u ON u.id = f.addressee_id WHERE f.requester_id = {ph} AND f.status = 'accepted' "
+        "UNION ALL "
+        "SELECT u.id, u.username, u.profile_picture, f.status, f.created_at FROM friendships f "
+        "JOIN users u ON u.id = f.requester_id WHERE f.addressee_id = {ph} AND f.status = 'accepted'",
+        (7, 7)),
+    'pending_requests': (
+        "SELECT u.id, u.username, u.profile_picture, f.id as request_id, f.created_at FROM friendships f "
+        "JOIN users u ON f.requester_id = u.id WHERE f.addressee_id = {ph} AND f.status = 'pending'",
+        (7,)),
+    'admin_today_visits': (
+        'SELECT COUNT(*) as count, COUNT(DISTINCT ip_address) as unique_count FROM visits '
+        'WHERE visited_at >= {ph} AND visited_at < {ph}',
+        ('2026-01-31 06:00:00', '2026-02-01 06:00:00')),
+    'admin_daily_visits': (
+        'SELECT CASE WHEN visited_at >= {ph} THEN 0 WHEN visited_at >= {ph} THEN 1 WHEN visited_at >= {ph} THEN 2 '
+        'WHEN visited_at >= {ph} THEN 3 WHEN visited_at >= {ph} THEN 4 WHEN visited_at >= {ph} THEN 5 '
+        'WHEN visited_at >= {ph} THEN 6 END as days_ago, '
+        'COUNT(*) as visits, COUNT(DISTINCT ip_address) as unique_visitors '
+        'FROM visits WHERE visited_at >= {ph} AND visited_at < {ph} GROUP BY days_ago',
+        tuple(f'2026-01-{31 - i:02d} 06:00:00' for i in range(7)) + ('2026-01-25 06:00:00', '2026-02-01 06:00:00')),
+    'admin_today_logins': (
+        'SELECT DISTINCT u.username, u.email, u.profile_picture, u.google_id, u.anonymous_id, u.created_at '
+        'FROM visits v JOIN users u ON v.user_id = u.id '
+        'WHERE v.visited_at >= {ph} AND v.visited_at < {ph} ORDER BY u.username',
+        ('2026-01-31 06:00:00', '2026-02-01 06:00:00')),
+    'seen_questions': (
+        'SELECT user_id, bits, missed_bits FROM seen_questions WHERE user_id IN ({ph}, {ph})', (7, 8)),
+    'seen_questions_rebuild': (
+        'SELECT user_id, question_id, correct FROM game_results WHERE user_id >= {ph} AND user_id < {ph} AND question_id > 0',
+        (1, 1001)),
+    'archive_dates': (
+        'SELECT game_date, difficulty FROM daily_questions WHERE user_id IS NULL AND game_date < {ph} ORDER BY game_date DESC',
+        (TODAY.isoformat(),)),
+    'question_schedule': (
+        'SELECT category, cycle, last_key, skip_bits FROM question_schedule WHERE difficulty = {ph}', ('easy',)),
+    'unreleased_daily_sets': (
+        'SELECT game_date, difficulty, questions_json FROM daily_questions WHERE game_date >= {ph} AND user_id IS NULL',
+        (TODAY.isoformat(),)),
+    'admin_players_today': (
+        "SELECT COUNT(DISTINCT user_id) as count FROM game_results WHERE mode = 'daily' AND game_date = {ph}",
+        (TODAY.isoformat(),)),
+}
+
+
+def load_app(database_url):
+    """Import app.py against the given database; init_db creates the schema."""
+    os.environ['DATABASE_URL'] = database_url
+    sys.path.insert(0, ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app
+    return app
+
+
+def seed(app):
+    """Fill the scratch database: users with a month of daily games, onboarding
+    answers, friendships and visits."""
+    conn = app.get_db()
+    cur = conn.cursor()
+    ph = app.get_placeholder()
+    rng = random.Random(1)
+    by_id = app.question_bank().by_id
+    question_ids = list(by_id)
+
+    def insert(table, columns, rows):
+        cur.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([ph] * len(columns))})", rows)
+
+    insert('users', ['id', 'username', 'email', 'anonymous_id'],
+           [(u, f'user{u}', f'user{u}@example.com', f'anon-{u}') for u in range(1, SEED_USERS + 1)])
+
+    results = []
+    for user_id in range(1, SEED_USERS + 1):
+        for days_ago in range(rng.randint(1, SEED_DAYS)):
+            game_date = (TODAY - timedelta(days=days_ago)).isoformat()
+            for difficulty in ('easy', 'hard')[:rng.randint(1, 2)]:
+                for question_id in rng.sample(question_ids, 6):
+                    results.append((user_id, game_date, 'daily', difficulty, question_id, rng.randint(0, 3),
+                                    rng.randint(0, 1), rng.randint(1000, 20000),
+                                    by_id[question_id]['category']))
+        for question_id in rng.sample(question_ids, 10):
+            results.append((user_id, (TODAY - timedelta(days=SEED_DAYS)).isoformat(), 'onboarding', 'easy',
+                            question_id, 0, rng.randint(0, 1), 5000, by_id[question_id]['category']))
+    insert('game_results', ['user_id', 'game_date', 'mode', 'difficulty', 'question_id', 'answer_index',
+                            'correct', 'time_ms', 'category'], results)
+
+    friendships = set()
+    for user_id in range(1, SEED_USERS + 1):
+        for friend_id in rng.sample(range(1, SEED_USERS + 1), 5):
+            if friend_id != user_id and (friend_id, user_id) not in friendships:
+                friendships.add((user_id, friend_id))
+    insert('friendships', ['requester_id', 'addressee_id', 'status'],
+           [(a, b, rng.choice(['accepted', 'accepted', 'pending'])) for a, b in sorted(friendships)])
+
+    visits = []
+    for days_ago in range(SEED_DAYS):
+        day = TODAY - timedelta(days=days_ago)
+        for _ in range(200):
+            visited_at = f'{day.isoformat()} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00'
+            visits.append(('/play', f'10.0.0.{rng.randint(1, 250)}', rng.randint(1, SEED_USERS), visited_at))
+    insert('visits', ['path', 'ip_address', 'user_id', 'visited_at'], visits)
+
+    insert('daily_questions', ['game_date', 'difficulty', 'questions_json'],
+           [((TODAY - timedelta(days=d)).isoformat(), diff, '[]') for d in range(SEED_DAYS) for diff in ('easy', 'hard')])
+
+    conn.commit()
+    cur.execute('ANALYZE')
+    conn.commit()
+    conn.close()
+
+
+def sqlite_plan(cur, sql, params):
+    cur.execute('EXPLAIN QUERY PLAN ' + sql, params)
+    return [row['detail'] for row in cur.fetchall()]
+
+
+def postgres_plan(cur, sql, params):
+    cur.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+    plan = cur.fetchone()['QUERY PLAN'][0]['Plan']
+    lines = []
+
+    def walk(node, depth):
+        detail = node['Node Type']
+        if 'Relation Name' in node:
+            detail += f" on {node['Relation Name']}"
+        if 'Index Name' in node:
+            detail += f" using {node['Index Name']}"
+            if 'Index Cond' not in node:
+                detail += ' (full)'
+        lines.append('  ' * depth + detail)
+        for child in node.get('Plans', []):
+            walk(child, depth + 1)
+
+    walk(plan, 0)
+    return lines
+
+
+def is_full_scan(line, dialect):
+    """A full pass over a table or over a whole index."""
+    line = line.strip()
+    if dialect == 'postgres':
+        return line.startswith('Seq Scan') or line.endswith('(full)')
+    return line.startswith('SCAN ') and not line.startswith('SCAN CONSTANT')
+
+
+def collect_plans(app):
+    dialect = 'postgres' if app.USE_POSTGRES else 'sqlite'
+    explain = postgres_plan if app.USE_POSTGRES else sqlite_plan
+    ph = app.get_placeholder()
+    conn = app.get_db()
+    cur = conn.cursor()
+    plans = {name: explain(cur, sql.format(ph=ph), params) for name, (sql, params) in HOT_QUERIES.items()}
+    conn.close()
+    return dialect, plans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--database-url', help='empty Postgres database to seed (default: a temporary SQLite file)')
+    parser.add_argument('--update', action='store_true', help='write the current plans to the baseline')
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url:
+        database_url = args.database_url
+    else:
+        scratch = tempfile.TemporaryDirectory()
+        database_url = 'sqlite:///' + os.path.join(scratch.name, 'plans.db')
+
+    app = load_app(database_url)
+    seed(app)
+    dialect, plans = collect_plans(app)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    if args.update:
+        baseline[dialect] = plans
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Wrote {len(plans)} {dialect} plans to {os.path.relpath(BASELINE_PATH, ROOT)}")
+        return 0
+
+    expected = baseline.get(dialect, {})
+    failures = 0
+    for name, plan in plans.items():
+        new_scans = [line for line in plan if is_full_scan(line, dialect)
+                     and line not in expected.get(name, [])]
+        if name not in expected:
+            status = 'NEW (run with --update)'
+            failures += 1
+        elif new_scans:
+            status = 'SCAN: ' + '; '.join(line.strip() for line in new_scans)
+            failures += 1
+        elif plan != expected[name]:
+            status = 'changed (no new scans)'
+        else:
+            status = 'ok'
+        print(f"{name:28} {status}")
+        if status != 'ok':
+            for line in plan:
+                print(f"{'':28}   {line}")
+
+    for name in sorted(set(expected) - set(plans)):
+        print(f"{name:28} missing from HOT_QUERIES (stale baseline entry)")
+
+    print(f"\n{len(plans)} queries, {failures} failing ({dialect})")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())